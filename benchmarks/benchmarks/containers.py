@@ -0,0 +1,79 @@
+"""
+Benchmarks of the NdMapping based containers, including HoloMap
+collapsing and DynamicMap caching.
+"""
+
+from itertools import count
+
+import numpy as np
+
+from holoviews import Curve, Dimension, DynamicMap, HoloMap
+from holoviews.core.ndmapping import NdMapping
+
+
+class NdMappingSuite(object):
+
+    params = [100, 1000, 10000]
+    param_names = ['size']
+
+    def setup(self, size):
+        self.keys = [(i, j) for i in range(size//10) for j in range(10)]
+        self.mapping = NdMapping([(k, i) for i, k in enumerate(self.keys)],
+                                 kdims=['A', 'B'])
+
+    def time_insert(self, size):
+        mapping = NdMapping(kdims=['A', 'B'])
+        for key in self.keys:
+            mapping[key] = key[0]
+
+    def time_construct(self, size):
+        NdMapping([(k, i) for i, k in enumerate(self.keys)], kdims=['A', 'B'])
+
+    def time_getitem(self, size):
+        for key in self.keys[:100]:
+            self.mapping[key]
+
+    def time_slice(self, size):
+        self.mapping[size//40:size//20, 2:5]
+
+    def time_select(self, size):
+        self.mapping.select(A=(size//40, size//20), B=3)
+
+
+class HoloMapCollapseSuite(object):
+
+    params = ([10, 100, 1000], [100, 10000])
+    param_names = ['frames', 'samples']
+
+    def setup(self, frames, samples):
+        xs = np.arange(samples)
+        rs = np.random.RandomState(0)
+        self.hmap = HoloMap({i: Curve((xs, rs.randn(samples)))
+                             for i in range(frames)}, kdims=['Frame'])
+
+    def time_collapse_mean(self, frames, samples):
+        self.hmap.collapse(function=np.mean)
+
+    def time_collapse_mean_std(self, frames, samples):
+        self.hmap.collapse(function=np.mean, spreadfn=np.std)
+
+
+class DynamicMapCacheSuite(object):
+
+    params = [10, 100, 500]
+    param_names = ['cached']
+
+    def setup(self, cached):
+        self.dmap = DynamicMap(lambda i: Curve(np.arange(10)*i),
+                               kdims=[Dimension('i', range=(0, 10**9))])
+        for i in range(cached):
+            self.dmap[i]
+        self.cached = cached
+        self.misses = count(cached)
+
+    def time_cache_hits(self, cached):
+        for i in range(self.cached):
+            self.dmap[i]
+
+    def time_cache_miss(self, cached):
+        self.dmap[next(self.misses)]
@@ -0,0 +1,75 @@
+"""
+Benchmarks of Dataset construction and the core data operations
+across the supported data interfaces.
+"""
+
+import numpy as np
+
+from holoviews import Dataset
+
+
+def tabular_data(size, datatype):
+    """
+    Generates a dataset with two categorical and two numeric columns
+    of the supplied length in the format of the supplied datatype.
+    """
+    rs = np.random.RandomState(0)
+    columns = {'x': rs.randint(0, 10, size), 'y': rs.randint(0, 10, size),
+               'z': rs.randn(size), 'w': rs.rand(size)}
+    if datatype == 'array':
+        return np.column_stack([columns[c] for c in 'xyzw'])
+    elif datatype == 'dataframe':
+        import pandas as pd
+        return pd.DataFrame(columns, columns=list('xyzw'))
+    return columns
+
+
+class DatasetConstructionSuite(object):
+
+    params = ([1000, 100000, 1000000], ['array', 'dataframe', 'dictionary'])
+    param_names = ['size', 'datatype']
+
+    def setup(self, size, datatype):
+        try:
+            self.data = tabular_data(size, datatype)
+        except ImportError:
+            raise NotImplementedError('%s interface not available' % datatype)
+
+    def time_construct(self, size, datatype):
+        Dataset(self.data, kdims=['x', 'y'], vdims=['z', 'w'],
+                datatype=[datatype])
+
+
+class DatasetOperationsSuite(object):
+
+    params = ([1000, 100000, 1000000], ['array', 'dataframe', 'dictionary'])
+    param_names = ['size', 'datatype']
+
+    def setup(self, size, datatype):
+        try:
+            data = tabular_data(size, datatype)
+        except ImportError:
+            raise NotImplementedError('%s interface not available' % datatype)
+        self.dataset = Dataset(data, kdims=['x', 'y'], vdims=['z', 'w'],
+                               datatype=[datatype])
+
+    def time_select_value(self, size, datatype):
+        self.dataset.select(x=5)
+
+    def time_select_range(self, size, datatype):
+        self.dataset.select(x=(2, 7), z=(-1, 1))
+
+    def time_groupby(self, size, datatype):
+        self.dataset.groupby('x')
+
+    def time_groupby_two_dimensions(self, size, datatype):
+        self.dataset.groupby(['x', 'y'])
+
+    def time_aggregate(self, size, datatype):
+        self.dataset.aggregate('x', np.mean)
+
+    def time_sample(self, size, datatype):
+        self.dataset.sample([(i, i) for i in range(10)])
+
+    def time_range(self, size, datatype):
+        self.dataset.range('z')
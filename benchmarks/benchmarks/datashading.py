@@ -0,0 +1,53 @@
+"""
+Benchmarks of the datashader operations.
+"""
+
+import numpy as np
+
+from holoviews import Curve, Points, HoloMap
+
+
+class AggregateSuite(object):
+
+    params = ([10000, 1000000, 10000000], [200, 800])
+    param_names = ['samples', 'width']
+
+    def setup(self, samples, width):
+        try:
+            from holoviews.operation.datashader import aggregate
+        except ImportError:
+            raise NotImplementedError('datashader not available')
+        self.aggregate = aggregate
+        rs = np.random.RandomState(0)
+        self.points = Points(rs.randn(samples, 2))
+        self.curve = Curve((np.arange(samples), rs.randn(samples).cumsum()))
+
+    def time_aggregate_points(self, samples, width):
+        self.aggregate.cache.clear()
+        self.aggregate(self.points, width=width, height=width, dynamic=False)
+
+    def time_aggregate_curve(self, samples, width):
+        self.aggregate.cache.clear()
+        self.aggregate(self.curve, width=width, height=width, dynamic=False)
+
+
+class DatashadeHoloMapSuite(object):
+
+    params = ([1, 4], [False, True])
+    param_names = ['threads', 'cached']
+
+    def setup(self, threads, cached):
+        try:
+            from holoviews.operation.datashader import datashade
+        except ImportError:
+            raise NotImplementedError('datashader not available')
+        self.datashade = datashade
+        rs = np.random.RandomState(0)
+        self.hmap = HoloMap({i: Points(rs.randn(100000, 2)) for i in range(20)})
+        if cached:
+            datashade(self.hmap, dynamic=False)
+
+    def time_datashade_holomap(self, threads, cached):
+        if not cached:
+            self.datashade.cache.clear()
+        self.datashade(self.hmap, threads=threads, dynamic=False)
@@ -0,0 +1,54 @@
+"""
+Benchmarks of the ElementOperations in holoviews.operation.element.
+"""
+
+import numpy as np
+
+from holoviews import Image, HoloMap
+from holoviews.operation.element import contours
+
+
+def mpl_contours(image, levels):
+    """
+    Reference implementation extracting the contour paths of an
+    Image by drawing them on a matplotlib figure.
+    """
+    from matplotlib import pyplot as plt
+    fig = plt.figure()
+    extent = image.range(0) + image.range(1)[::-1]
+    contour_set = plt.contour(image.data, extent=extent, levels=levels)
+    paths = []
+    for cset in contour_set.collections:
+        for path in cset.get_paths():
+            paths.extend(np.split(path.vertices, np.where(path.codes==1)[0][1:]))
+    plt.close(fig)
+    return paths
+
+
+class ContoursSuite(object):
+
+    params = [100, 500, 2000]
+    param_names = ['size']
+
+    def setup(self, size):
+        ys, xs = np.mgrid[-3:3:size*1j, -3:3:size*1j]
+        data = np.sin(xs**2) * np.cos(ys) + np.random.RandomState(0).rand(size, size)*0.1
+        self.image = Image(data, bounds=(-3, -3, 3, 3))
+        self.levels = list(np.linspace(-1, 1, 10))
+        self.hmap = HoloMap({i: Image(data*i/10., bounds=(-3, -3, 3, 3))
+                             for i in range(10)})
+
+    def time_contours(self, size):
+        contours(self.image, levels=self.levels)
+
+    def time_filled_contours(self, size):
+        contours(self.image, levels=self.levels, filled=True)
+
+    def time_matplotlib_contours(self, size):
+        mpl_contours(self.image, self.levels)
+
+    def time_holomap_contours(self, size):
+        contours(self.hmap, levels=self.levels)
+
+    def time_holomap_contours_threaded(self, size):
+        contours(self.hmap, levels=self.levels, threads=4)
@@ -0,0 +1,35 @@
+"""
+Benchmarks of the option lookups performed for each plotted object.
+"""
+
+from holoviews import Curve, Overlay, Store
+
+
+class LookupOptionsSuite(object):
+
+    params = [1, 10, 100]
+    param_names = ['elements']
+
+    def setup(self, elements):
+        try:
+            import holoviews.plotting.mpl # noqa (register options)
+        except ImportError:
+            raise NotImplementedError('matplotlib not available')
+        self.curves = [Curve([i, i+1], group='Group%d' % (i % 5), label='Label%d' % i)
+                       for i in range(elements)]
+        self.overlay = Overlay(self.curves)
+        self.custom = [c(plot={'show_grid': True}, style={'color': 'red'})
+                       for c in self.curves]
+
+    def time_lookup_options(self, elements):
+        for curve in self.curves:
+            Store.lookup_options('matplotlib', curve, 'plot')
+            Store.lookup_options('matplotlib', curve, 'style')
+
+    def time_lookup_custom_options(self, elements):
+        for curve in self.custom:
+            Store.lookup_options('matplotlib', curve, 'plot')
+            Store.lookup_options('matplotlib', curve, 'style')
+
+    def time_lookup_overlay_options(self, elements):
+        Store.lookup_options('matplotlib', self.overlay, 'plot')
@@ -0,0 +1,90 @@
+"""
+Benchmarks of the plotting pipeline, covering range computation and
+the backend specific data processing and update paths.
+"""
+
+import numpy as np
+
+from holoviews import Curve, HoloMap, Layout, Points, Store
+
+
+def curve_holomap(frames, samples):
+    xs = np.arange(samples)
+    rs = np.random.RandomState(0)
+    return HoloMap({i: Curve((xs, rs.randn(samples)*i))
+                    for i in range(frames)}, kdims=['Frame'])
+
+
+# Maps the backend names to the plotting modules defining them
+backend_modules = {'matplotlib': 'mpl', 'bokeh': 'bokeh', 'plotly': 'plotly'}
+
+
+def load_backend(backend):
+    try:
+        __import__('holoviews.plotting.%s' % backend_modules[backend])
+    except ImportError:
+        raise NotImplementedError('%s backend not available' % backend)
+    return Store.renderers[backend]
+
+
+class ComputeRangesSuite(object):
+
+    params = ([10, 100, 1000], [1, 4])
+    param_names = ['frames', 'subplots']
+
+    def setup(self, frames, subplots):
+        renderer = load_backend('matplotlib')
+        hmap = curve_holomap(frames, 100)
+        self.obj = hmap if subplots == 1 else Layout([hmap]*subplots)
+        self.plot = renderer.get_plot(self.obj)
+
+    def time_compute_ranges(self, frames, subplots):
+        self.plot.range_cache.clear()
+        self.plot.compute_ranges(self.obj, None, None)
+
+    def time_compute_ranges_cached(self, frames, subplots):
+        self.plot.compute_ranges(self.obj, None, None)
+
+
+class BokehPlotSuite(object):
+
+    params = [1000, 100000, 1000000]
+    param_names = ['samples']
+
+    def setup(self, samples):
+        self.renderer = load_backend('bokeh')
+        rs = np.random.RandomState(0)
+        self.points = Points(rs.randn(samples, 3), vdims=['z'])
+        self.hmap = HoloMap({i: Points(rs.randn(samples, 2)) for i in range(2)})
+        self.plot = self.renderer.get_plot(self.points)
+        self.hmap_plot = self.renderer.get_plot(self.hmap)
+        # Rendering the plot attaches the Document diffs are computed on
+        self.renderer.figure_data(self.hmap_plot)
+        self.ranges = self.plot.compute_ranges(self.points, None, None)
+
+    def time_get_data(self, samples):
+        self.plot.get_data(self.points, self.ranges)
+
+    def time_update_and_diff(self, samples):
+        self.hmap_plot.update((0,))
+        self.renderer.diff(self.hmap_plot)
+        self.hmap_plot.update((1,))
+        self.renderer.diff(self.hmap_plot)
+
+
+class MPLPlotSuite(object):
+
+    params = ([1000, 100000], [10, 100])
+    param_names = ['samples', 'frames']
+
+    def setup(self, samples, frames):
+        renderer = load_backend('matplotlib')
+        self.plot = renderer.get_plot(curve_holomap(frames, samples))
+        self.frames = frames
+
+    def time_update_frame(self, samples, frames):
+        for key in self.plot.keys[:10]:
+            self.plot.update_frame(key)
+
+    def time_initialize_plot(self, samples, frames):
+        self.plot.initialize_plot()
@@ -15,6 +15,7 @@ from .array import ArrayInterface
 from .dictionary import DictInterface
 from .grid import GridInterface
 from .ndelement import NdElementInterface
+from .lazy import LazyDataset
 
 datatypes = ['array', 'dictionary', 'grid', 'ndelement']
 
@@ -190,6 +191,16 @@ class Dataset(Element):
         return [xs[idx] for idx in idxs] if len(coords) > 1 else xs[idxs[0]]
 
 
+    def lazy(self):
+        """
+        Returns a LazyDataset wrapping this Dataset, which records
+        subsequent select, sort, reindex, add_dimension, aggregate and
+        redim calls and executes them in an optimized pipeline once
+        the result is requested.
+        """
+        return LazyDataset(self)
+
+
     def sort(self, by=[]):
         """
         Sorts the data by the values along the supplied dimensions.
@@ -266,6 +277,8 @@ class Dataset(Element):
         """
         if selection_specs and not any(self.matches(sp) for sp in selection_specs):
             return self
+        elif not selection:
+            return self.clone()
 
         data = self.interface.select(self, **selection)
         if np.isscalar(data):
@@ -419,7 +432,15 @@ class Dataset(Element):
             group_dims = [d.name for d in self.kdims if d not in dimensions]
             group_kwargs = dict(util.get_param_values(self), **kwargs)
             group_kwargs['kdims'] = [self.get_dimension(d) for d in group_dims]
+            # Where supported, groups are taken from precomputed row
+            # indices when accessed rather than selected by masking
+            indices = self.interface.group_indices(self, dim_names) if group_dims else None
             def load_subset(*args):
+                if indices is not None:
+                    key = args[0] if len(args) == 1 else args
+                    rows = indices.get(key, np.array([], dtype=int))
+                    return group_type(self.clone(self.data.take(rows)).reindex(group_dims),
+                                      **group_kwargs)
                 constraint = dict(zip(dim_names, args))
                 group = self.select(**constraint)
                 if np.isscalar(group):
@@ -491,7 +512,13 @@ class Dataset(Element):
         dim_obj = self.get_dimension(dim)
         if dim_obj and dim_obj.type is not None:
             return dim_obj.type
-        return self.interface.dimension_type(self, dim_obj)
+        elif dim_obj is None:
+            return None
+        # Types are inferred once per dimension and cached
+        dimension_types = self.__dict__.setdefault('_dimension_types', {})
+        if dim_obj.name not in dimension_types:
+            dimension_types[dim_obj.name] = self.interface.dimension_type(self, dim_obj)
+        return dimension_types[dim_obj.name]
 
 
     def dframe(self, dimensions=None):
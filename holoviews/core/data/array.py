@@ -20,7 +20,9 @@ class ArrayInterface(Interface):
 
     @classmethod
     def dimension_type(cls, dataset, dim):
-        return dataset.data.dtype.type
+        if dataset.data.dtype.kind != 'O':
+            return dataset.data.dtype.type
+        return util.values_type(cls.values(dataset, dim))
 
     @classmethod
     def init(cls, eltype, data, kdims, vdims):
@@ -103,6 +105,8 @@ class ArrayInterface(Interface):
             dtypes = (dataset.data.dtype,)*dataset.data.shape[1]
             sort_fields = tuple('f%s' % dataset.get_dimension_index(d) for d in by)
             sorting = dataset.data.T.view(dtypes).argsort(order=sort_fields)
+        if util.is_identity(sorting):
+            return data
         return data[sorting]
 
 
@@ -120,10 +124,15 @@ class ArrayInterface(Interface):
 
     @classmethod
     def reindex(cls, dataset, kdims=None, vdims=None):
-        # DataFrame based tables don't need to be reindexed
+        # Contiguous runs of columns are returned as a read-only view
         dims = kdims + vdims
-        data = [dataset.dimension_values(d) for d in dims]
-        return np.column_stack(data)
+        indices = [dataset.get_dimension_index(d) for d in dims]
+        data = dataset.data
+        if data.ndim == 2 and indices == list(range(indices[0], indices[0]+len(indices))):
+            view = data[:, indices[0]:indices[-1]+1]
+            view.flags.writeable = False
+            return view
+        return np.column_stack([dataset.dimension_values(d) for d in dims])
 
 
     @classmethod
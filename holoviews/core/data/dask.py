@@ -7,11 +7,18 @@ except ImportError:
 
 import numpy as np
 import pandas as pd
+import dask
 import dask.dataframe as dd
 from dask.dataframe import DataFrame
 from dask.dataframe.core import Scalar
 
+try:
+    from dask.dataframe import Aggregation
+except ImportError:
+    Aggregation = None
+
 from .. import util
+from ..dimension import OrderedDict
 from ..element import Element
 from ..ndmapping import NdMapping, item_check
 from .interface import Interface
@@ -43,6 +50,27 @@ class DaskInterface(PandasInterface):
 
     default_partitions = 100
 
+    # Number of rows sampled to infer the type of object columns
+    type_samples = 100
+
+    # Functions mapped onto inbuilt dask reductions
+    inbuilts = {'amin': 'min', 'amax': 'max', 'mean': 'mean',
+                'std': 'std', 'sum': 'sum', 'var': 'var',
+                'min': 'min', 'max': 'max', 'nanmin': 'min',
+                'nanmax': 'max', 'nanmean': 'mean', 'nansum': 'sum'}
+
+    # Decomposable reductions defined as (chunk, aggregate, finalize)
+    # functions applied to pandas groupby objects
+    reductions = {
+        'prod': (lambda g: g.prod(), lambda g: g.prod()),
+        'nanprod': (lambda g: g.prod(), lambda g: g.prod()),
+        'ptp': (lambda g: (g.min(), g.max()),
+                lambda mn, mx: (mn.min(), mx.max()),
+                lambda mn, mx: mx - mn),
+        'count_nonzero': (lambda g: g.agg(np.count_nonzero),
+                          lambda g: g.sum()),
+        'len': (lambda g: g.size(), lambda g: g.sum())}
+
     @classmethod
     def init(cls, eltype, data, kdims, vdims):
         data, kdims, vdims = PandasInterface.init(eltype, data, kdims, vdims)
@@ -50,6 +78,14 @@ class DaskInterface(PandasInterface):
             data = dd.from_pandas(data, npartitions=cls.default_partitions, sort=False)
         return data, kdims, vdims
 
+    @classmethod
+    def dimension_type(cls, dataset, dim):
+        # Object columns are sampled from the first partition only
+        column = dataset.data[dataset.get_dimension(dim).name]
+        if column.dtype.kind == 'O':
+            return util.values_type(column.head(cls.type_samples))
+        return column.dtype.type
+
     @classmethod
     def shape(cls, dataset):
         return (len(dataset.data), len(dataset.data.columns))
@@ -68,6 +104,11 @@ class DaskInterface(PandasInterface):
         columns.warning('Dask dataframes do not support sorting')
         return columns.data
 
+    @classmethod
+    def redim(cls, dataset, dimensions):
+        column_renames = {k: v.name for k, v in dimensions.items()}
+        return dataset.data.rename(columns=column_renames)
+
     @classmethod
     def values(cls, columns, dim, expanded=True, flat=True):
         data = columns.data[dim]
@@ -126,6 +167,28 @@ class DaskInterface(PandasInterface):
             return df[columns.vdims[0].name].compute().iloc[0]
         return df
     
+    @classmethod
+    def group_indices(cls, columns, dimensions):
+        # Dask dataframes cannot be indexed by row position
+        return None
+
+    @classmethod
+    def _partition_keys(cls, data, dimensions):
+        """
+        Computes the unique group keys in each partition of the
+        dataframe in a single pass, returning an OrderedDict mapping
+        from each key to the indices of the partitions containing it,
+        in the order the keys first appear.
+        """
+        partitions = data[dimensions].to_delayed()
+        uniques = dask.compute(*[p.drop_duplicates() for p in partitions])
+        keys = OrderedDict()
+        for i, unique in enumerate(uniques):
+            for key in unique.itertuples(index=False):
+                keys.setdefault(tuple(key), []).append(i)
+        return keys
+
+
     @classmethod
     def groupby(cls, columns, dimensions, container_type, group_type, **kwargs):
         index_dims = [columns.get_dimension(d) for d in dimensions]
@@ -138,30 +201,50 @@ class DaskInterface(PandasInterface):
                                 kdims=element_dims)
         group_kwargs.update(kwargs)
 
+        # Each group only references the partitions containing its key
+        # so computing a group avoids a pass over the whole dataframe
+        df = columns.data
         data = []
-        groupby = columns.data.groupby(dimensions)
-        if len(dimensions) == 1:
-            column = columns.data[dimensions[0]]
-            if column.dtype.name == 'category':
-                indices = ((ind,) for ind in column.cat.categories)
-            else:
-                indices = ((ind,) for ind in column.unique().compute())
-        else:
-            group_tuples = columns.data[dimensions].itertuple()
-            indices = util.unique_iterator(ind[1:] for ind in group_tuples)
-        for coord in indices:
+        for coord, partitions in cls._partition_keys(df, dimensions).items():
             if any(isinstance(c, float) and np.isnan(c) for c in coord):
                 continue
+            if len(partitions) == df.npartitions:
+                group_df = df
+            else:
+                group_df = dd.concat([df.get_partition(i) for i in partitions])
+            mask = None
+            for dim, c in zip(dimensions, coord):
+                dim_mask = group_df[dim] == c
+                mask = dim_mask if mask is None else mask & dim_mask
             if len(coord) == 1:
                 coord = coord[0]
-            group = group_type(groupby.get_group(coord), **group_kwargs)
-            data.append((coord, group))
+            data.append((coord, group_type(group_df[mask], **group_kwargs)))
         if issubclass(container_type, NdMapping):
             with item_check(False):
                 return container_type(data, kdims=index_dims)
         else:
             return container_type(data)
-    
+
+
+    @classmethod
+    def _reduction(cls, function):
+        """
+        Returns a dask Aggregation computing the supplied function
+        in chunks, if the function is a known decomposable reduction.
+        Any NumPy ufunc is reduced by applying its reduce method to
+        each chunk and then to the chunk results.
+        """
+        if Aggregation is None:
+            return None
+        name = function.__name__
+        if isinstance(function, np.ufunc):
+            reduce_fn = lambda g: g.agg(function.reduce)
+            return Aggregation(name, reduce_fn, reduce_fn)
+        elif name in cls.reductions:
+            return Aggregation(name, *cls.reductions[name])
+        return None
+
+
     @classmethod
     def aggregate(cls, columns, dimensions, function, **kwargs):
         data = columns.data
@@ -169,24 +252,33 @@ class DaskInterface(PandasInterface):
         vdims = columns.dimensions('value', True)
         dtypes = data.dtypes
         numeric = [c for c, dtype in zip(dtypes.index, dtypes.values)
-                   if dtype.kind in 'iufc' and c in vdims]
+                   if dtype.kind in 'iufcb' and c in vdims]
         reindexed = data[cols+numeric]
 
-        inbuilts = {'amin': 'min', 'amax': 'max', 'mean': 'mean',
-                    'std': 'std', 'sum': 'sum', 'var': 'var'}
-        if len(dimensions):
-            groups = reindexed.groupby(cols, sort=False)
-            if (function.__name__ in inbuilts):
-                agg = getattr(groups, inbuilts[function.__name__])()
-            else:
-                agg = groups.apply(function)
-            return agg.reset_index()
-        else:
-            if (function.__name__ in inbuilts):
-                agg = getattr(reindexed, inbuilts[function.__name__])()
-            else:
-                raise NotImplementedError
+        name = function.__name__
+        if not len(dimensions) and name in cls.inbuilts:
+            agg = getattr(reindexed, cls.inbuilts[name])()
             return pd.DataFrame(agg.compute()).T
+        elif not len(dimensions):
+            # Aggregate over a constant key to reuse the grouped path
+            cols = ['__holoviews_key']
+            reindexed = reindexed.assign(**{cols[0]: 0})
+
+        groups = reindexed.groupby(cols, sort=False)
+        reduction = cls._reduction(function)
+        if name in cls.inbuilts:
+            agg = getattr(groups, cls.inbuilts[name])()
+        elif reduction is not None:
+            agg = groups.agg(reduction)
+        else:
+            meta = pd.DataFrame({c: np.array([], dtype='f8') for c in numeric},
+                                columns=numeric)
+            agg = groups.apply(lambda df: df[numeric].apply(function, **kwargs),
+                               meta=meta)
+        if dimensions:
+            return agg.reset_index()
+        return agg.compute().reset_index(drop=True)
+
 
     @classmethod
     def unpack_scalar(cls, columns, data):
@@ -30,7 +30,7 @@ class DictInterface(Interface):
     @classmethod
     def dimension_type(cls, dataset, dim):
         name = dataset.get_dimension(dim).name
-        return dataset.data[name].dtype.type
+        return util.values_type(dataset.data[name])
 
     @classmethod
     def init(cls, eltype, data, kdims, vdims):
@@ -69,16 +69,36 @@ class DictInterface(Interface):
         if not isinstance(data, cls.types):
             raise ValueError("DictInterface interface couldn't convert data.""")
         elif isinstance(data, dict):
-            unpacked = [(d, np.array(data[d])) for d in data]
+            unpacked = [(d, cls._column(data[d])) for d in data]
             if not cls.expanded([d[1] for d in unpacked]):
                 raise ValueError('DictInterface expects data to be of uniform shape.')
             if isinstance(data, odict_types):
                 data.update(unpacked)
             else:
-                data = OrderedDict([(d, np.array(data[d])) for d in dimensions])
+                columns = dict(unpacked)
+                data = OrderedDict([(d, columns[d]) for d in dimensions])
         return data, {'kdims':kdims, 'vdims':vdims}, {}
 
 
+    @classmethod
+    def _column(cls, values):
+        """
+        Returns the values of a column as a read-only array. Read-only
+        arrays are shared, e.g. between clones, while writable arrays
+        and other data are copied so that mutating the supplied data
+        does not affect the dataset. Memory-mapped arrays are shared
+        as a read-only view to avoid reading them into memory.
+        """
+        if isinstance(values, np.ndarray) and not values.flags.writeable:
+            return values
+        elif isinstance(values, np.memmap):
+            values = values.view()
+        else:
+            values = np.array(values)
+        values.flags.writeable = False
+        return values
+
+
     @classmethod
     def validate(cls, dataset):
         dimensions = dataset.dimensions(label=True)
@@ -150,6 +170,8 @@ class DictInterface(Interface):
         else:
             arrays = [dataset.dimension_values(d) for d in by]
             sorting = util.arglexsort(arrays)
+        if util.is_identity(sorting):
+            return dataset.data
         return OrderedDict([(d, v[sorting]) for d, v in dataset.data.items()])
 
 
@@ -163,8 +185,8 @@ class DictInterface(Interface):
 
     @classmethod
     def reindex(cls, dataset, kdims, vdims):
-        # DataFrame based tables don't need to be reindexed
-        return OrderedDict([(d.name, dataset.dimension_values(d))
+        # The read-only columns are shared with the original dataset
+        return OrderedDict([(d.name, dataset.data[d.name])
                             for d in kdims+vdims])
 
 
@@ -88,7 +88,7 @@ class GridInterface(DictInterface):
             arr = cls.values(dataset, dim, False, False)
         else:
             return None
-        return arr.dtype.type
+        return util.values_type(arr)
 
 
     @classmethod
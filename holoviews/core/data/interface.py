@@ -149,16 +149,26 @@ class Interface(param.Parameterized):
         return all_scalar and all_kdims and len(dataset.vdims) == 1
 
 
+    @classmethod
+    def dimension_type(cls, dataset, dim):
+        """
+        Returns the type of the values along the supplied dimension,
+        inferred from the dtype of the data where possible.
+        """
+        return util.values_type(dataset.dimension_values(dim))
+
     @classmethod
     def range(cls, dataset, dimension):
         column = dataset.dimension_values(dimension)
         if dataset.get_dimension_type(dimension) is np.datetime64:
             return column.min(), column.max()
+        elif column.dtype.kind not in 'SUO':
+            return (np.nanmin(column), np.nanmax(column))
         else:
             try:
                 return (np.nanmin(column), np.nanmax(column))
             except TypeError:
-                column.sort()
+                column = np.sort(column)
                 return column[0], column[-1]
 
     @classmethod
@@ -187,6 +197,16 @@ class Interface(param.Parameterized):
         kdims = [kdim for kdim in dataset.kdims if kdim not in reduce_dims]
         return cls.aggregate(dataset, kdims, function, **kwargs)
 
+    @classmethod
+    def group_indices(cls, dataset, dimensions):
+        """
+        Returns an OrderedDict mapping from each unique combination of
+        values along the supplied dimensions to the integer indices of
+        the rows in that group, in the order the groups first appear.
+        Interfaces which cannot index their data by row return None.
+        """
+        return None
+
     @classmethod
     def array(cls, dataset, dimensions):
         return Element.array(dataset, dimensions)
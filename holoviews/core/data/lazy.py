@@ -0,0 +1,179 @@
+"""
+The lazy module provides a LazyDataset, which records the
+transformations applied to a Dataset as an expression pipeline and
+only executes them once the result is requested. Before execution
+the pipeline is optimized so that selections are applied as early
+as possible, adjacent selections are fused into a single pass over
+the data and columns which are dropped by a reindex are pruned
+before sorting.
+"""
+
+import numpy as np
+
+from ..dimension import Dimension
+
+
+def _dim_name(dim):
+    return dim.name if isinstance(dim, Dimension) else dim
+
+
+class LazyDataset(object):
+    """
+    LazyDataset wraps a Dataset and records calls to select, sort,
+    reindex, add_dimension, aggregate and redim as a pipeline of
+    operations instead of executing them immediately:
+
+        lazy = dataset.lazy().select(x=(0, 10)).sort('y').select(y=(0, 5))
+        lazy.compute()
+
+    The pipeline is optimized and executed by the interface of the
+    wrapped Dataset when compute or dframe is called or when the
+    LazyDataset is rendered. Each optimized operation is executed
+    using the regular Dataset methods, so the result is identical to
+    the eager equivalent.
+    """
+
+    def __init__(self, dataset, pipeline=[]):
+        self.dataset = dataset
+        self.pipeline = list(pipeline)
+
+
+    def _append(self, method, args, kwargs):
+        return LazyDataset(self.dataset, self.pipeline+[(method, args, kwargs)])
+
+
+    def select(self, selection_specs=None, **selection):
+        return self._append('select', (selection_specs,), selection)
+
+
+    def sort(self, by=[]):
+        if not isinstance(by, list): by = [by]
+        return self._append('sort', (by,), {})
+
+
+    def reindex(self, kdims=None, vdims=None):
+        return self._append('reindex', (), dict(kdims=kdims, vdims=vdims))
+
+
+    def add_dimension(self, dimension, dim_pos, dim_val, vdim=False, **kwargs):
+        return self._append('add_dimension', (dimension, dim_pos, dim_val, vdim), kwargs)
+
+
+    def aggregate(self, dimensions=None, function=None, spreadfn=None, **kwargs):
+        return self._append('aggregate', (dimensions, function, spreadfn), kwargs)
+
+
+    def redim(self, specs=None, **dimensions):
+        return self._append('redim', (specs,), dimensions)
+
+
+    @classmethod
+    def _scalar_selection(cls, selection):
+        return any(np.isscalar(v) for v in selection.values())
+
+
+    @classmethod
+    def _swappable(cls, first, second):
+        """
+        Whether the second operation may be moved in front of the
+        first without changing the result.
+        """
+        (method1, args1, kwargs1), (method2, args2, kwargs2) = first, second
+        if method2 == 'select':
+            if args2[0] is not None:
+                return False
+            # Scalar selections may index the data returning a scalar,
+            # which depends on the preceding operations
+            if cls._scalar_selection(kwargs2):
+                return False
+            keys = set(kwargs2)
+            if method1 == 'sort':
+                return True
+            elif method1 == 'reindex':
+                dims = [_dim_name(d) for d in (kwargs1['kdims'] or [])+
+                        (kwargs1['vdims'] or [])]
+                return keys <= set(dims)
+            elif method1 == 'add_dimension':
+                dimension, _, dim_val, _ = args1
+                return np.isscalar(dim_val) and _dim_name(dimension) not in keys
+        elif method2 == 'reindex' and method1 == 'sort':
+            by = [_dim_name(d) for d in args1[0]]
+            dims = [_dim_name(d) for d in (kwargs2['kdims'] or [])+
+                    (kwargs2['vdims'] or [])]
+            return bool(by) and set(by) <= set(dims)
+        return False
+
+
+    @classmethod
+    def _fuse(cls, first, second):
+        """
+        Fuses two selections into one, intersecting ranges selected
+        along the same dimension. Returns None if the selections
+        cannot be fused.
+        """
+        if first[1][0] is not None or second[1][0] is not None:
+            return None
+        selection = dict(first[2])
+        for dim, value in second[2].items():
+            if dim not in selection:
+                selection[dim] = value
+                continue
+            previous = selection[dim]
+            if not all(isinstance(v, tuple) and len(v) == 2 for v in (previous, value)):
+                return None
+            lower = [b for b in (previous[0], value[0]) if b is not None]
+            upper = [b for b in (previous[1], value[1]) if b is not None]
+            selection[dim] = (max(lower) if lower else None,
+                              min(upper) if upper else None)
+        return ('select', (None,), selection)
+
+
+    def optimize(self):
+        """
+        Returns a new LazyDataset with an optimized pipeline, pushing
+        selections down towards the data, pruning columns before
+        sorting and fusing adjacent selections.
+        """
+        ops = list(self.pipeline)
+        changed = True
+        while changed:
+            changed = False
+            for i in range(len(ops)-1):
+                if self._swappable(ops[i], ops[i+1]):
+                    ops[i], ops[i+1] = ops[i+1], ops[i]
+                    changed = True
+        fused = []
+        for op in ops:
+            if fused and op[0] == 'select' and fused[-1][0] == 'select':
+                merged = self._fuse(fused[-1], op)
+                if merged is not None:
+                    fused[-1] = merged
+                    continue
+            fused.append(op)
+        return LazyDataset(self.dataset, fused)
+
+
+    def compute(self):
+        """
+        Optimizes and executes the pipeline, returning the resulting
+        Dataset or scalar.
+        """
+        obj = self.dataset
+        for method, args, kwargs in self.optimize().pipeline:
+            obj = getattr(obj, method)(*args, **kwargs)
+        return obj
+
+
+    def dframe(self, dimensions=None):
+        return self.compute().dframe(dimensions)
+
+
+    def __len__(self):
+        return len(self.compute())
+
+
+    def __repr__(self):
+        ops = ['%s(%s)' % (method, ', '.join([repr(a) for a in args]+
+                                             ['%s=%r' % kv for kv in sorted(kwargs.items())]))
+               for method, args, kwargs in self.pipeline]
+        return '.'.join(['LazyDataset(%s)' % type(self.dataset).__name__]+ops)
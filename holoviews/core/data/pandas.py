@@ -27,8 +27,7 @@ class PandasInterface(Interface):
     @classmethod
     def dimension_type(cls, columns, dim):
         name = columns.get_dimension(dim).name
-        idx = list(columns.data.columns).index(name)
-        return columns.data.dtypes[idx].type
+        return util.values_type(columns.data[name])
 
     @classmethod
     def init(cls, eltype, data, kdims, vdims):
@@ -121,8 +120,10 @@ class PandasInterface(Interface):
                                 kdims=element_dims)
         group_kwargs.update(kwargs)
 
-        data = [(k, group_type(v, **group_kwargs)) for k, v in
-                columns.data.groupby(dimensions, sort=False)]
+        # Take each group directly from the row indices of the groups
+        take = columns.data.take
+        data = [(k, group_type(take(idx), **group_kwargs)) for k, idx in
+                cls.group_indices(columns, dimensions).items()]
         if issubclass(container_type, NdMapping):
             with item_check(False):
                 return container_type(data, kdims=index_dims)
@@ -130,6 +131,12 @@ class PandasInterface(Interface):
             return container_type(data)
 
 
+    @classmethod
+    def group_indices(cls, columns, dimensions):
+        indices = columns.data.groupby(dimensions, sort=False).indices
+        return cyODict(sorted(indices.items(), key=lambda item: item[1][0]))
+
+
     @classmethod
     def aggregate(cls, columns, dimensions, function, **kwargs):
         data = columns.data
@@ -165,7 +172,7 @@ class PandasInterface(Interface):
     @classmethod
     def redim(cls, dataset, dimensions):
         column_renames = {k: v.name for k, v in dimensions.items()}
-        return dataset.data.rename(columns=column_renames)
+        return dataset.data.rename(columns=column_renames, copy=False)
 
 
     @classmethod
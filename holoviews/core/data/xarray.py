@@ -22,7 +22,7 @@ class XArrayInterface(GridInterface):
     @classmethod
     def dimension_type(cls, dataset, dim):
         name = dataset.get_dimension(dim).name
-        return dataset.data[name].dtype.type
+        return util.values_type(dataset.data[name])
 
 
     @classmethod
@@ -14,7 +14,8 @@ import param
 from ..core.util import (basestring, sanitize_identifier,
                          group_sanitizer, label_sanitizer, max_range,
                          find_range, dimension_sanitizer, OrderedDict,
-                         safe_unicode, unicode, dt64_to_dt, unique_array)
+                         safe_unicode, unicode, dt64_to_dt, unique_array,
+                         values_type)
 from .options import Store, StoreOptions
 from .pprint import PrettyPrinter
 
@@ -209,14 +210,44 @@ class Dimension(param.Parameterized):
         return title_format.format(name=self.name, val=value, unit=unit)
 
 
+    def __setattr__(self, attr, value):
+        "Clears the cached hash and sanitized name when a parameter changes."
+        if not attr.startswith('_'):
+            self.__dict__.pop('_cached_hash', None)
+            self.__dict__.pop('_cached_names', None)
+        super(Dimension, self).__setattr__(attr, value)
+
+
+    def __getstate__(self):
+        "Drops cached values, which are recomputed after unpickling."
+        state = super(Dimension, self).__getstate__()
+        state.pop('_cached_hash', None)
+        state.pop('_cached_names', None)
+        return state
+
+
+    @property
+    def _names(self):
+        "Tuple of the name and the sanitized name, computed once."
+        names = self.__dict__.get('_cached_names')
+        if names is None:
+            names = (self.name, dimension_sanitizer(self.name))
+            self.__dict__['_cached_names'] = names
+        return names
+
+
     def __hash__(self):
         """
         The hash allows two Dimension objects to be compared; if the
         hashes are equal, all the parameters of the Dimensions are
         also equal.
         """
-        return sum([hash(value) for _, value in self.get_param_values()
-                    if not isinstance(value, list)])
+        cached = self.__dict__.get('_cached_hash')
+        if cached is None:
+            cached = sum([hash(value) for _, value in self.get_param_values()
+                          if not isinstance(value, list)])
+            self.__dict__['_cached_hash'] = cached
+        return cached
 
 
     def __str__(self):
@@ -225,7 +256,7 @@ class Dimension(param.Parameterized):
 
     def __eq__(self, other):
         "Implements equals operator including sanitized comparison."
-        dim_matches = [self.name, dimension_sanitizer(self.name)]
+        dim_matches = self._names
         return other.name in dim_matches if isinstance(other, Dimension) else other in dim_matches
 
     def __ne__(self, other):
@@ -667,6 +698,36 @@ class Dimensioned(LabelledData):
         return [dim.name if label else dim for dim in dims]
 
 
+    def __getstate__(self):
+        "Drops the dimension lookup tables, which are rebuilt on demand."
+        state = super(Dimensioned, self).__getstate__()
+        state.pop('_cached_lookup', None)
+        return state
+
+
+    def _dimension_lookup(self):
+        """
+        Returns lookup tables for the key and value dimensions as a
+        tuple of the dimensions, a dictionary mapping names to
+        Dimensions and a dictionary mapping names and sanitized names
+        to indices. The tables are cached and rebuilt whenever the
+        kdims or vdims change.
+        """
+        dims = self.kdims+self.vdims
+        key = tuple(id(d) for d in dims)
+        lookup = self.__dict__.get('_cached_lookup')
+        if lookup is not None and lookup[0] == key:
+            return lookup[1:]
+        names, indices = {}, {}
+        for i, dim in enumerate(dims):
+            name, sanitized = dim._names
+            names.setdefault(name, dim)
+            indices.setdefault(name, i)
+            indices.setdefault(sanitized, i)
+        self.__dict__['_cached_lookup'] = (key, dims, names, indices)
+        return dims, names, indices
+
+
     def get_dimension(self, dimension, default=None, strict=False):
         """
         Access a Dimension object by name or index.
@@ -674,9 +735,16 @@ class Dimensioned(LabelledData):
         strict is False. If strict is True, a KeyError is raised
         instead.
         """
-        all_dims = self.dimensions()
         if isinstance(dimension, Dimension):
             dimension = dimension.name
+        dims, names, _ = self._dimension_lookup()
+        if isinstance(dimension, int):
+            if 0 <= dimension < len(dims):
+                return dims[dimension]
+        elif isinstance(dimension, basestring) and dimension in names:
+            return names[dimension]
+
+        all_dims = self.dimensions()
         if isinstance(dimension, int):
             if 0 <= dimension < len(all_dims):
                 return all_dims[dimension]
@@ -702,9 +770,10 @@ class Dimensioned(LabelledData):
                 return dim
             else:
                 return IndexError('Dimension index out of bounds')
+        _, _, indices = self._dimension_lookup()
+        if isinstance(dim, basestring) and dim in indices:
+            return indices[dim]
         try:
-            if dim in self.kdims+self.vdims:
-                return (self.kdims+self.vdims).index(dim)
             return self.dimensions().index(dim)
         except ValueError:
             raise Exception("Dimension %s not found in %s." %
@@ -720,11 +789,7 @@ class Dimensioned(LabelledData):
         dim_obj = self.get_dimension(dim)
         if dim_obj and dim_obj.type is not None:
             return dim_obj.type
-        dim_vals = [type(v) for v in self.dimension_values(dim)]
-        if len(set(dim_vals)) == 1:
-            return dim_vals[0]
-        else:
-            return None
+        return values_type(self.dimension_values(dim))
 
     def __getitem__(self, key):
         """
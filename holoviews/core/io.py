@@ -14,12 +14,14 @@ Archives: A collection of HoloViews objects that are first collected
 """
 from __future__ import absolute_import
 
-import re, os, time, string, zipfile, tarfile, shutil, itertools, pickle
+import re, os, time, string, zipfile, tarfile, shutil, itertools, pickle, struct
+import atexit, tempfile
 from collections import defaultdict
 
 from io import BytesIO
 from hashlib import sha256
 
+import numpy as np
 import param
 from param.parameterized import bothmethod
 
@@ -27,8 +29,9 @@ from .dimension import LabelledData
 from .element import Collator, Element
 from .layout import Layout
 from .ndmapping import OrderedDict, NdMapping, UniformNdMapping
-from .options import Store
-from .util import unique_iterator, group_sanitizer, label_sanitizer
+from .options import Store, StoreOptions
+from .spaces import HoloMap, DynamicMap
+from .util import unique_iterator, group_sanitizer, label_sanitizer, basestring
 
 
 def sanitizer(name, replacements=[(':','_'), ('/','_'), ('\\','_')]):
@@ -298,6 +301,412 @@ class Deserializer(Importer):
 
 
 
+# Layout of the local file header preceding each member of a zip
+# archive as defined by section 4.3.7 of the ZIP specification
+_local_header = struct.Struct('<4s2B4HL2L2H')
+
+# Members larger than this limit require Zip64 extensions
+_zip64_limit = (1 << 31) - 1
+
+
+class ArchivePickler(pickle.Pickler):
+    """
+    Pickler used by the columnar .hvz format, which writes each NumPy
+    array referenced by a component to a separate .npy member of the
+    zip archive. The frames of a HoloMap component may also be
+    written to separate members, allowing them to be loaded
+    individually.
+
+    Arrays of at least stored_size bytes are always stored
+    uncompressed so they may be memory-mapped on load, while smaller
+    arrays and the pickles use the supplied compression. Stored arrays
+    are padded so that the array data is aligned within the archive.
+    The padding is computed from the local file header layout defined
+    by the ZIP specification. If the position in the archive cannot be
+    determined the arrays are written without padding, in which case
+    they are still memory-mapped but may be unaligned.
+    """
+
+    alignment = 64
+
+    # Identifier of the zip extra field used to align stored members
+    padding_id = 0xD935
+
+    def __init__(self, archive, entry, protocol=2, compression=zipfile.ZIP_STORED,
+                 frames=[], written=None, counter=None, stored_size=2**16):
+        self._buffer = BytesIO()
+        pickle.Pickler.__init__(self, self._buffer, protocol)
+        self.archive = archive
+        self.entry = entry
+        self.compression = compression
+        self.stored_size = stored_size
+        self._protocol = protocol
+        self._frames = set(id(frame) for frame in frames)
+        self._written = {} if written is None else written
+        self._counter = itertools.count() if counter is None else counter
+
+
+    @classmethod
+    def dumps(cls, obj, archive, entry, protocol=2, compression=zipfile.ZIP_STORED,
+              stored_size=2**16):
+        """
+        Writes the arrays (and any HoloMap frames) of the supplied
+        object to the archive, returning the pickled remainder of the
+        object to be stored under the entry name.
+        """
+        frames = []
+        if isinstance(obj, HoloMap) and not isinstance(obj, DynamicMap):
+            frames = list(obj.data.values())
+        return cls(archive, entry, protocol, compression, frames,
+                   stored_size=stored_size)._dumps(obj)
+
+
+    def _dumps(self, obj):
+        save_state = Store.save_option_state
+        Store.save_option_state = True
+        try:
+            self.dump(obj)
+        finally:
+            Store.save_option_state = save_state
+        return self._buffer.getvalue()
+
+
+    def persistent_id(self, obj):
+        if id(obj) in self._frames:
+            self._frames.remove(id(obj))
+            name = '%s/frame%d' % (self.entry, next(self._counter))
+            pickler = self.__class__(self.archive, self.entry, self._protocol,
+                                 self.compression, written=self._written,
+                                 counter=self._counter, stored_size=self.stored_size)
+            self._writestr(name, pickler._dumps(obj))
+            return ('frame', name)
+        elif (isinstance(obj, np.ndarray) and not isinstance(obj, np.ma.MaskedArray)
+              and not obj.dtype.hasobject):
+            if id(obj) not in self._written:
+                name = '%s/%d.npy' % (self.entry, next(self._counter))
+                buff = BytesIO()
+                np.lib.format.write_array(buff, np.asarray(obj))
+                stored = self.stored_size is not None and obj.nbytes >= self.stored_size
+                self._writestr(name, buff.getvalue(), self._header_length(buff),
+                               zipfile.ZIP_STORED if stored else self.compression)
+                # Keep a reference to ensure the id is not reused
+                self._written[id(obj)] = (name, obj)
+            return ('array', self._written[id(obj)][0])
+        return None
+
+
+    @classmethod
+    def _header_length(cls, buff):
+        "Returns the length of the header of a serialized .npy array"
+        buff.seek(0)
+        version = np.lib.format.read_magic(buff)
+        if version == (1, 0):
+            np.lib.format.read_array_header_1_0(buff)
+        else:
+            np.lib.format.read_array_header_2_0(buff)
+        return buff.tell()
+
+
+    def _writestr(self, name, data, header_length=None, compression=None):
+        info = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+        info.compress_type = self.compression if compression is None else compression
+        info.external_attr = 0o600 << 16
+        offset = self._position()
+        if (header_length is not None and offset is not None and
+            info.compress_type == zipfile.ZIP_STORED):
+            # Pad the local file header so the array data is aligned,
+            # accounting for the padding field header and the Zip64
+            # extra field written for members larger than 2 GB
+            offset += _local_header.size + len(name.encode('utf-8')) + 4
+            if len(data) * 1.05 > _zip64_limit:
+                offset += 20
+            padding = -(offset + header_length) % self.alignment
+            info.extra = struct.pack('<HH', self.padding_id, padding) + b'\0' * padding
+        self.archive.writestr(info, data)
+
+
+    def _position(self):
+        """
+        Returns the offset at which the next member is written or None
+        if it cannot be determined.
+        """
+        offset = getattr(self.archive, 'start_dir', None)
+        if offset is not None:
+            return offset
+        try:
+            return self.archive.fp.tell()
+        except (AttributeError, IOError, ValueError):
+            return None
+
+
+
+class ArchiveUnpickler(pickle.Unpickler):
+    """
+    Unpickler used to load components of the .hvz format, resolving
+    the arrays and frames written by the ArchivePickler. Uncompressed
+    arrays in archives on disk are memory-mapped (copy-on-write) when
+    mmap is enabled. If lazy is enabled, frames are returned as the
+    names of the corresponding archive members and recorded in the
+    deferred list.
+    """
+
+    def __init__(self, data, archive, filename, mmap=True, lazy=False):
+        pickle.Unpickler.__init__(self, BytesIO(data))
+        self.archive = archive
+        self.filename = filename
+        self.mmap = mmap and isinstance(filename, basestring)
+        self.lazy = lazy
+        self.deferred = []
+
+
+    @classmethod
+    def loads(cls, archive, filename, name, mmap=True, lazy=False):
+        """
+        Loads the named member of an open archive, returning the
+        unpickled object and the names of any deferred frames.
+        """
+        unpickler = cls(archive.read(name), archive, filename, mmap, lazy)
+        Store.load_counter_offset = StoreOptions.id_offset()
+        try:
+            obj = unpickler.load()
+        finally:
+            Store.load_counter_offset = None
+        return obj, unpickler.deferred
+
+
+    def persistent_load(self, pid):
+        kind, name = pid
+        if kind == 'array':
+            return self._load_array(name)
+        elif kind == 'frame' and self.lazy:
+            self.deferred.append(name)
+            return name
+        elif kind == 'frame':
+            unpickler = self.__class__(self.archive.read(name), self.archive,
+                                   self.filename, self.mmap)
+            return unpickler.load()
+        raise pickle.UnpicklingError("Unsupported persistent id %r" % kind)
+
+
+    def _load_array(self, name):
+        info = self.archive.getinfo(name)
+        if not self.mmap or info.compress_type != zipfile.ZIP_STORED:
+            return np.load(BytesIO(self.archive.read(name)))
+
+        # Locate the member data from its local file header
+        with open(self.filename, 'rb') as f:
+            f.seek(info.header_offset)
+            header = _local_header.unpack(f.read(_local_header.size))
+            # Fields 10 and 11 hold the filename and extra field lengths
+            offset = info.header_offset + _local_header.size + header[10] + header[11]
+            f.seek(offset)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+            offset = f.tell()
+        if not np.prod(shape, dtype=np.int64):
+            return np.empty(shape, dtype=dtype, order='F' if fortran else 'C')
+        return np.memmap(self.filename, dtype=dtype, mode='c', offset=offset,
+                         shape=shape, order='F' if fortran else 'C')
+
+
+
+# Directories of SharedMemory instances which have not been closed
+_shared_paths = set()
+
+@atexit.register
+def _remove_shared_paths():
+    for path in list(_shared_paths):
+        shutil.rmtree(path, ignore_errors=True)
+    _shared_paths.clear()
+
+
+class SharedMemory(param.Parameterized):
+    """
+    SharedMemory owns a set of memory-mapped segments used to pass
+    HoloViews objects to worker processes without copying their array
+    data through pickles. The share method writes every large NumPy
+    array referenced by an object to a segment, by default on the
+    /dev/shm tmpfs if available, and returns a SharedHandle holding
+    the rest of the pickled object. When a handle is unpickled, e.g.
+    in a worker of a multiprocessing Pool, the object is reconstructed
+    with copy-on-write memory maps of the segments, so all workers
+    reference the same memory:
+
+        with SharedMemory() as shm:
+            handles = [shm.share(el) for el in elements]
+            results = pool.map(process, handles)
+
+    Arrays referenced multiple times are written once. The segments
+    are removed when the SharedMemory is closed, garbage collected or
+    the interpreter exits. Since handles hold a reference to their
+    SharedMemory in the sharing process, it is not garbage collected
+    while any of its handles are alive. Objects which have already
+    been loaded keep referencing the memory on platforms which allow
+    removing mapped files.
+    """
+
+    directory = param.String(default=None, allow_None=True, doc="""
+        The directory in which segments are created, defaults to
+        /dev/shm if writable and otherwise the temporary directory.""")
+
+    min_size = param.Integer(default=2**16, bounds=(1, None), doc="""
+        The minimum size in bytes of arrays placed in segments,
+        smaller arrays are pickled with the object.""")
+
+    protocol = param.Integer(default=2, doc="""
+        The pickling protocol used for the remainder of the object.""")
+
+    def __init__(self, **params):
+        super(SharedMemory, self).__init__(**params)
+        directory = self.directory
+        if directory is None and os.access('/dev/shm', os.W_OK):
+            directory = '/dev/shm'
+        self.path = tempfile.mkdtemp(prefix='holoviews-', dir=directory)
+        _shared_paths.add(self.path)
+        self._written = {}
+        self._counter = itertools.count()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def __del__(self):
+        self.close()
+
+
+    def share(self, obj):
+        """
+        Writes the large arrays of the supplied object to segments
+        and returns a SharedHandle to the object.
+        """
+        if self.path is None:
+            raise ValueError('Cannot share objects after the SharedMemory '
+                             'has been closed.')
+        return SharedHandle(SharedPickler.dumps(obj, self, self.protocol), self)
+
+
+    def write(self, arr):
+        """
+        Writes an array to a segment, returning the segment filename.
+        """
+        if id(arr) not in self._written:
+            filename = os.path.join(self.path, '%d.npy' % next(self._counter))
+            fortran = arr.flags.f_contiguous and not arr.flags.c_contiguous
+            segment = np.lib.format.open_memmap(filename, mode='w+', dtype=arr.dtype,
+                                                shape=arr.shape, fortran_order=fortran)
+            segment[...] = arr
+            segment.flush()
+            del segment
+            # Keep a reference to ensure the id is not reused
+            self._written[id(arr)] = (filename, arr)
+        return self._written[id(arr)][0]
+
+
+    def close(self):
+        """
+        Removes all segments.
+        """
+        path = getattr(self, 'path', None)
+        if path is not None:
+            shutil.rmtree(path, ignore_errors=True)
+            _shared_paths.discard(path)
+            self.path = None
+        self._written = {}
+
+
+
+class SharedPickler(pickle.Pickler):
+    """
+    Pickler used by SharedMemory, which writes NumPy arrays larger
+    than the minimum size of the SharedMemory to segments and pickles
+    references to the segments in their place.
+    """
+
+    def __init__(self, memory, protocol=2):
+        self._buffer = BytesIO()
+        pickle.Pickler.__init__(self, self._buffer, protocol)
+        self.memory = memory
+
+
+    @classmethod
+    def dumps(cls, obj, memory, protocol=2):
+        pickler = cls(memory, protocol)
+        pickler.dump(obj)
+        return pickler._buffer.getvalue()
+
+
+    def persistent_id(self, obj):
+        if (isinstance(obj, np.ndarray) and not isinstance(obj, np.ma.MaskedArray)
+            and not obj.dtype.hasobject and obj.nbytes >= self.memory.min_size):
+            return ('shared', self.memory.write(obj))
+        return None
+
+
+
+class SharedUnpickler(pickle.Unpickler):
+    """
+    Unpickler for objects pickled by the SharedPickler, which
+    memory-maps (copy-on-write) the referenced segments.
+    """
+
+    @classmethod
+    def loads(cls, data):
+        unpickler = cls(BytesIO(data))
+        Store.load_counter_offset = StoreOptions.id_offset()
+        try:
+            return unpickler.load()
+        finally:
+            Store.load_counter_offset = None
+
+
+    def persistent_load(self, pid):
+        kind, filename = pid
+        if kind == 'shared':
+            return np.load(filename, mmap_mode='c')
+        raise pickle.UnpicklingError("Unsupported persistent id %r" % kind)
+
+
+
+def _load_shared(data):
+    return SharedUnpickler.loads(data)
+
+
+class SharedHandle(object):
+    """
+    A lightweight handle to an object shared via SharedMemory, which
+    holds the pickled object without its large arrays. Unpickling a
+    handle returns the object itself, so handles may be passed to
+    worker processes in place of the objects they refer to.
+
+    The handle keeps its SharedMemory alive in the sharing process,
+    but the reference is not pickled.
+    """
+
+    def __init__(self, data, memory=None):
+        self.data = data
+        self._memory = memory
+
+
+    def load(self):
+        """
+        Loads the object referenced by the handle.
+        """
+        return SharedUnpickler.loads(self.data)
+
+
+    def __reduce__(self):
+        return (_load_shared, (self.data,))
+
+
+
 class Pickler(Exporter):
     """
     The recommended pickler for serializing HoloViews object to a .hvz
@@ -310,7 +719,9 @@ class Pickler(Exporter):
     3. Support for metadata per saved component.
 
     The output file with the .hvz file extension is simply a zip
-    archive containing pickled HoloViews objects.
+    archive containing pickled HoloViews objects. In the columnar
+    format the arrays and HoloMap frames of each component are stored
+    as separate members alongside the pickled component.
     """
 
     protocol = param.Integer(default=2, doc="""
@@ -320,6 +731,21 @@ class Pickler(Exporter):
     compress = param.Boolean(default=True, doc="""
         Whether compression is enabled or not""")
 
+    columnar = param.Boolean(default=False, doc="""
+        Whether to write the columnar format, which stores the NumPy
+        arrays of each component as separate .npy members and the
+        frames of HoloMaps as separate pickles. Arrays larger than
+        stored_size are stored uncompressed and aligned so they may be
+        memory-mapped when loaded.""")
+
+    stored_size = param.Integer(default=2**16, bounds=(0, None),
+                                allow_None=True, doc="""
+        The size in bytes above which arrays in the columnar format
+        are stored uncompressed regardless of compress, so they may be
+        memory-mapped when loaded. Compressed arrays are read into
+        memory instead. If None, arrays are compressed like all other
+        members.""")
+
     mime_type = 'application/zip'
     file_ext = 'hvz'
 
@@ -335,7 +761,7 @@ class Pickler(Exporter):
         base_info = {'file-ext': 'hvz', 'mime_type':self_or_cls.mime_type}
         key = self_or_cls._merge_metadata(obj, self_or_cls.key_fn, key)
         info = self_or_cls._merge_metadata(obj, self_or_cls.info_fn, info, base_info)
-        compression = zipfile.ZIP_STORED if self_or_cls.compress else zipfile.ZIP_DEFLATED
+        compression = zipfile.ZIP_DEFLATED if self_or_cls.compress else zipfile.ZIP_STORED
 
         filename = self_or_cls._filename(filename) if isinstance(filename, str) else filename
         with zipfile.ZipFile(filename, 'w', compression=compression) as f:
@@ -350,8 +776,13 @@ class Pickler(Exporter):
                 components = [obj]
 
             for component, entry in zip(components, entries):
-                f.writestr(entry,
-                           Store.dumps(component, protocol=self_or_cls.protocol))
+                if self_or_cls.columnar:
+                    data = ArchivePickler.dumps(component, f, entry,
+                                                self_or_cls.protocol, compression,
+                                                self_or_cls.stored_size)
+                else:
+                    data = Store.dumps(component, protocol=self_or_cls.protocol)
+                f.writestr(entry, data)
             f.writestr('metadata',
                        pickle.dumps({'info':info, 'key':key}))
 
@@ -368,8 +799,25 @@ class Unpickler(Importer):
 
     The components that may be individually loaded may be found using
     the entries method.
+
+    Columnar archives written by the Pickler memory-map their
+    uncompressed arrays, falling back to reading compressed arrays
+    into memory. When lazy loading is enabled, HoloMaps whose frames
+    were stored separately are returned as a DynamicMap rather than a
+    HoloMap.
     """
 
+    mmap = param.Boolean(default=True, doc="""
+        Whether to memory-map the uncompressed arrays of columnar
+        archives loaded from disk instead of reading them into
+        memory.""")
+
+    lazy = param.Boolean(default=False, doc="""
+        Whether HoloMaps with separately stored frames should be
+        loaded lazily, returning a DynamicMap instead of a HoloMap,
+        which loads each frame from the archive when it is first
+        accessed.""")
+
     def __call__(self, data, entries=None):
         buff = BytesIO(data)
         return self.load(buff, entries=entries)
@@ -382,7 +830,11 @@ class Unpickler(Importer):
             for entry in entries:
                 if entry not in f.namelist():
                     raise Exception("Entry %s not available" % entry)
-                components.append(Store.loads(f.read(entry)))
+                component, deferred = ArchiveUnpickler.loads(
+                    f, filename, entry, self_or_cls.mmap, self_or_cls.lazy)
+                if deferred:
+                    component = self_or_cls._lazy_map(filename, component)
+                components.append(component)
                 single_layout = entry.endswith('(L)')
 
         if len(components) == 1 and not single_layout:
@@ -390,6 +842,28 @@ class Unpickler(Importer):
         else:
             return Layout.from_values(components)
 
+    @bothmethod
+    def _lazy_map(self_or_cls, filename, hmap):
+        """
+        Given a HoloMap whose values are the names of the archive
+        members holding each frame, return a DynamicMap which loads
+        the frames on access.
+        """
+        frames = hmap.data
+        mmap = self_or_cls.mmap
+        def load_frame(*key):
+            with zipfile.ZipFile(filename, 'r') as f:
+                return ArchiveUnpickler.loads(f, filename, frames[key], mmap)[0]
+        keys = list(frames.keys())
+        kdims = [kdim(values=list(unique_iterator(k[i] for k in keys)))
+                 for i, kdim in enumerate(hmap.kdims)]
+        # The frames are not loaded so only explicit group and label
+        # values are retained
+        dmap = DynamicMap(load_frame, kdims=kdims, group=hmap._group,
+                          label=hmap._label)
+        dmap.id = hmap.id
+        return dmap
+
     @bothmethod
     def _load_metadata(self_or_cls, filename, name):
         with zipfile.ZipFile(filename, 'r') as f:
@@ -411,7 +885,8 @@ class Unpickler(Importer):
     @bothmethod
     def entries(self_or_cls, filename):
         with zipfile.ZipFile(filename, 'r') as f:
-            return [el for el in f.namelist() if el != 'metadata']
+            return [el for el in f.namelist()
+                    if el != 'metadata' and '/' not in el]
 
     @bothmethod
     def collect(self_or_cls, files, drop=[], metadata=True):
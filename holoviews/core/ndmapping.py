@@ -442,6 +442,19 @@ class MultiDimensionalMapping(Dimensioned):
         "Creates a table from the stored keys and data."
         if datatype is None:
             datatype = ['dataframe' if pd else 'dictionary']
+        elif not isinstance(datatype, list):
+            datatype = [datatype]
+
+        values = list(self.data.values())
+        if (datatype[0] == 'dataframe' and not kwargs and
+            self._dataframe_values(values)):
+            # Concatenate the DataFrames once, adding the keys as columns
+            lengths = [len(v.data) for v in values]
+            df = pd.concat([v.data for v in values], ignore_index=True)
+            for idx, (dim, key) in enumerate(zip(self.kdims, zip(*self.data.keys()))):
+                df.insert(idx, dim.name, pd.Series(key).repeat(lengths).values)
+            table = values[0].table(datatype=datatype)
+            return table.clone(df, kdims=self.kdims+table.kdims)
 
         tables = []
         for key, value in self.data.items():
@@ -452,6 +465,25 @@ class MultiDimensionalMapping(Dimensioned):
         return value.interface.concatenate(tables)
 
 
+    def _dataframe_values(self, values):
+        """
+        Whether the supplied values are all DataFrame backed elements
+        of the same type and dimensions which do not already contain
+        columns for the key dimensions.
+        """
+        if pd is None or not values:
+            return False
+        first = values[0]
+        interface = getattr(first, 'interface', None)
+        if interface is None or interface.datatype != 'dataframe':
+            return False
+        elif any(d.name in first.data.columns for d in self.kdims):
+            return False
+        dims = first.dimensions(label=True)
+        return all(type(v) is type(first) and v.interface is interface and
+                   v.dimensions(label=True) == dims for v in values)
+
+
     def dframe(self):
         "Creates a pandas DataFrame from the stored keys and data."
         try:
@@ -103,6 +103,13 @@ class ElementOperation(Operation):
        first component is a Normalization.ranges list and the second
        component is Normalization.keys. """)
 
+    threads = param.Integer(default=1, bounds=(1, None), doc="""
+       The number of threads used to process the frames of a HoloMap
+       and, for operations which support it, the tiles of individual
+       elements. Since NumPy releases the GIL for most array
+       computations operations implemented in terms of array
+       operations may be processed concurrently.""")
+
     def _process(self, view, key=None):
         """
         Process a single input element and outputs new single element
@@ -122,6 +129,16 @@ class ElementOperation(Operation):
         return self._process(element, key)
 
 
+    def _process_items(self, items):
+        """
+        Processes a list of (key, element) items, distributing the
+        items across a pool of threads if more than one thread was
+        requested.
+        """
+        return util.thread_map(lambda item: (item[0], self._process(item[1], key=item[0])),
+                               items, self.p.threads)
+
+
     def __call__(self, element, **params):
         self.p = param.ParamOverrides(self, params)
         dynamic = ((self.p.dynamic == 'default' and
@@ -149,8 +166,7 @@ class ElementOperation(Operation):
             samples = tuple(d.values for d in element.kdims)
             processed = self(element[samples], **params)
         elif isinstance(element, HoloMap):
-            mapped_items = [(k, self._process(el, key=k))
-                            for k, el in element.items()]
+            mapped_items = self._process_items(element.items())
             refval = mapped_items[0][1]
             processed = element.clone(mapped_items,
                                       group=refval.group,
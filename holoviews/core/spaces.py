@@ -278,19 +278,78 @@ class HoloMap(UniformNdMapping):
         for key, group in groups.items():
             if isinstance(function, MapOperation):
                 collapsed[key] = function(group, **kwargs)
+            elif hasattr(group.last, 'interface'):
+                col_data = self._collapse_columns(group, function, spreadfn, **kwargs)
+                if col_data is None:
+                    col_data = group.type(group.table().aggregate(group.last.kdims, function, spreadfn, **kwargs))
+                collapsed[key] = col_data
             else:
                 group_data = [el.data for el in group]
                 args = (group_data, function, group.last.kdims)
-                if hasattr(group.last, 'interface'):
-                    col_data = group.type(group.table().aggregate(group.last.kdims, function, spreadfn, **kwargs))
-
-                else:
-                    data = group.type.collapse_data(*args, **kwargs)
-                    col_data = group.last.clone(data)
-                collapsed[key] = col_data
+                data = group.type.collapse_data(*args, **kwargs)
+                collapsed[key] = group.last.clone(data)
         return collapsed if self.ndims > 1 else collapsed.last
 
 
+    @classmethod
+    def _collapse_columns(cls, group, function, spreadfn=None, **kwargs):
+        """
+        Collapses a HoloMap of Dataset Elements sharing the same
+        unique and sorted key dimension values by reducing the value
+        dimension columns across the frames directly, avoiding the
+        concatenation of all frames into a single Table. Returns
+        None if the Elements cannot be collapsed in this way.
+        """
+        last = group.last
+        if (function is None or len(last.kdims) == 0 or
+            not util.is_numpy_reduction(function) or
+            (spreadfn is not None and not util.is_numpy_reduction(spreadfn))):
+            return None
+        elements = list(group.data.values())
+        if any(type(el) is not type(last) or el.kdims != last.kdims
+               or el.vdims != last.vdims for el in elements):
+            return None
+        keys = [last.dimension_values(kd) for kd in last.kdims]
+        if not util.sorted_unique(keys):
+            return None
+        for el in elements:
+            if el is last:
+                continue
+            for kd, vals in zip(last.kdims, keys):
+                values = el.dimension_values(kd)
+                if values is not vals and not np.array_equal(values, vals):
+                    return None
+
+        data = OrderedDict([(kd.name, vals) for kd, vals in zip(last.kdims, keys)])
+        vdims = list(last.vdims)
+        values = [[el.dimension_values(vd) for el in elements] for vd in vdims]
+        if any(vals[0].dtype.kind not in 'biufc' for vals in values):
+            return None
+        for vd, vals in zip(vdims, values):
+            data[vd.name] = util.reduce_arrays(vals, function,
+                                               **cls._reduce_kwargs(function, kwargs))
+        if spreadfn:
+            spread_kwargs = cls._reduce_kwargs(spreadfn, {})
+            for vd, vals in zip(list(vdims), values):
+                spread_dim = vd('_'.join([vd.name, spreadfn.__name__]))
+                data[spread_dim.name] = util.reduce_arrays(vals, spreadfn, **spread_kwargs)
+                vdims.append(spread_dim)
+        return last.clone(data, kdims=last.kdims, vdims=vdims)
+
+
+    @classmethod
+    def _reduce_kwargs(cls, function, kwargs):
+        """
+        Table aggregations are computed by pandas where available,
+        which computes the sample variance and standard deviation, so
+        the same ddof is used when collapsing the columns directly.
+        """
+        if (any(function is fn for fn in (np.var, np.std)) and
+            'ddof' not in kwargs and util.pd is not None):
+            return dict(kwargs, ddof=1)
+        return kwargs
+
+
     def sample(self, samples=[], bounds=None, **sample_values):
         """
         Sample each Element in the UniformNdMapping by passing either a list of
@@ -26,6 +26,11 @@ try:
 except ImportError:
     dd = None
 
+try:
+    import dask.array as da
+except ImportError:
+    da = None
+
 
 
 
@@ -411,6 +416,30 @@ def isnumeric(val):
         return False
 
 
+def values_type(values, samples=100):
+    """
+    Infers the type of the values in an array or pandas Series from
+    its dtype without iterating over every value. Categorical data
+    returns the type of its categories while object arrays return
+    the type shared by a regularly spaced sample of the values, or
+    None if the sampled values are of inconsistent types.
+    """
+    dtype = getattr(values, 'dtype', None)
+    if getattr(dtype, 'name', None) == 'category':
+        categories = getattr(values, 'cat', values).categories
+        return values_type(np.asarray(categories), samples)
+    elif dtype is not None and dtype.kind != 'O':
+        return dtype.type
+    values = np.asarray(values)
+    if values.dtype.kind != 'O':
+        return values.dtype.type
+    values = values.ravel()
+    if len(values) > samples:
+        values = values[np.linspace(0, len(values)-1, samples).astype(int)]
+    types = set(type(v) for v in values)
+    return types.pop() if len(types) == 1 else None
+
+
 def find_minmax(lims, olims):
     """
     Takes (a1, a2) and (b1, b2) as input and returns
@@ -562,6 +591,22 @@ def unique_array(arr):
         return arr[np.sort(uniq_inds)]
 
 
+def factorize(values):
+    """
+    Encodes the values as integer codes indexing into an array of the
+    unique values, which are returned in the order they first appear.
+    """
+    if pd:
+        codes, uniques = pd.factorize(values, sort=False)
+        return codes, np.asarray(uniques)
+    uniques, inds, inverse = np.unique(values, return_index=True,
+                                       return_inverse=True)
+    order = np.argsort(inds)
+    ranks = np.empty(len(order), dtype=int)
+    ranks[order] = np.arange(len(order))
+    return ranks[inverse], uniques[order]
+
+
 def match_spec(element, specification):
     """
     Matches the group.label specification of the supplied
@@ -712,17 +757,27 @@ def is_cyclic(graph):
     Return True if the directed graph g has a cycle. The directed graph
     should be represented as adictionary mapping of edges for each node.
     """
-    path = set()
-
-    def visit(vertex):
-        path.add(vertex)
-        for neighbour in graph.get(vertex, ()):
-            if neighbour in path or visit(neighbour):
-                return True
-        path.remove(vertex)
-        return False
-
-    return any(visit(v) for v in graph)
+    visited, path = set(), set()
+    for root in graph:
+        if root in visited:
+            continue
+        visited.add(root)
+        path.add(root)
+        stack = [(root, iter(graph.get(root, ())))]
+        while stack:
+            vertex, neighbours = stack[-1]
+            for neighbour in neighbours:
+                if neighbour in path:
+                    return True
+                elif neighbour not in visited:
+                    visited.add(neighbour)
+                    path.add(neighbour)
+                    stack.append((neighbour, iter(graph.get(neighbour, ()))))
+                    break
+            else:
+                path.remove(vertex)
+                stack.pop()
+    return False
 
 
 def one_to_one(graph, nodes):
@@ -1099,3 +1154,139 @@ def is_nan(x):
         return np.isnan(x)
     except:
         return False
+
+
+def thread_map(fn, items, threads=1):
+    """
+    Applies the function to each of the supplied items, distributing
+    the calls across a pool of threads if more than one thread is
+    requested. Returns a list of the results in the order of the items.
+    """
+    items = list(items)
+    if threads <= 1 or len(items) < 2:
+        return [fn(item) for item in items]
+    from multiprocessing.pool import ThreadPool
+    pool = ThreadPool(min(threads, len(items)))
+    try:
+        return pool.map(fn, items)
+    finally:
+        pool.close()
+
+
+def is_identity(indices):
+    """
+    Returns whether an array of indices is the identity permutation,
+    i.e. whether indexing with it would return the data unchanged.
+    """
+    indices = np.asarray(indices)
+    return bool(indices.ndim == 1 and (indices == np.arange(len(indices))).all())
+
+
+def sorted_unique(columns):
+    """
+    Returns whether the rows formed by the supplied columns are
+    unique and sorted in lexicographic order.
+    """
+    if not len(columns) or len(columns[0]) < 2:
+        return True
+    try:
+        greater = np.zeros(len(columns[0])-1, dtype=bool)
+        equal = np.ones(len(columns[0])-1, dtype=bool)
+        for col in columns:
+            col = np.asarray(col)
+            greater |= equal & (col[1:] > col[:-1])
+            equal &= col[1:] == col[:-1]
+    except TypeError:
+        return False
+    return bool(greater.all())
+
+
+def _accumulate_moments(arrays, dtype):
+    """
+    Accumulates the count, mean and sum of squared deviations of a
+    sequence of arrays using Welford's algorithm.
+    """
+    count = 0
+    mean = np.zeros(arrays[0].shape, dtype)
+    m2 = np.zeros(arrays[0].shape, dtype)
+    for arr in arrays:
+        count += 1
+        delta = arr - mean
+        mean += delta / count
+        m2 += delta * (arr - mean)
+    return count, mean, m2
+
+
+def _accumulate_ufunc(arrays, ufunc, dtype):
+    """
+    Accumulates a sequence of arrays with a binary ufunc in place.
+    """
+    result = np.array(arrays[0], dtype=dtype)
+    for arr in arrays[1:]:
+        ufunc(result, arr, out=result)
+    return result
+
+
+# Numpy reductions supporting an axis argument, which reduce_arrays
+# applies to the stacked arrays
+numpy_reductions = [np.sum, np.mean, np.min, np.max, np.var, np.std,
+                    np.median, np.prod, np.nansum, np.nanmean, np.nanmin,
+                    np.nanmax, np.nanmedian]
+
+
+def is_numpy_reduction(function):
+    """
+    Returns whether the function is a known numpy reduction or a
+    ufunc, which may be applied along an axis by reduce_arrays.
+    """
+    return isinstance(function, np.ufunc) or any(function is fn for fn in numpy_reductions)
+
+
+def reduce_arrays(arrays, function, **kwargs):
+    """
+    Reduces a sequence of equally shaped arrays elementwise using a
+    numpy style function supporting an axis argument. Binary ufuncs,
+    np.sum, np.mean, np.min, np.max, np.var and np.std are applied
+    by streaming through the arrays, accumulating the result without
+    stacking them. Dask arrays are stacked lazily and other functions
+    are applied to the arrays stacked into a single preallocated
+    array along a new leading axis.
+    """
+    if not isinstance(arrays, (list, tuple)):
+        arrays = list(arrays)
+    if not len(arrays):
+        raise ValueError('Cannot reduce an empty sequence of arrays.')
+    if da is not None and any(isinstance(arr, da.Array) for arr in arrays):
+        if isinstance(function, np.ufunc):
+            return function.reduce(da.stack(arrays), axis=0, **kwargs)
+        return function(da.stack(arrays), axis=0, **kwargs)
+
+    arrays = [np.asarray(arr) for arr in arrays]
+    first = arrays[0]
+    if any(arr.shape != first.shape for arr in arrays):
+        raise ValueError('Cannot reduce arrays of different shapes.')
+
+    streamable = first.dtype.kind in 'biuf'
+    if isinstance(function, np.ufunc):
+        if streamable and not kwargs and function.nin == 2:
+            dtype = function.reduce(np.zeros((2, 1), first.dtype), axis=0).dtype
+            return _accumulate_ufunc(arrays, function, dtype)
+        return function.reduce(arrays, axis=0, **kwargs)
+
+    stream_kwargs = ['ddof'] if function in (np.var, np.std) else []
+    if streamable and all(k in stream_kwargs for k in kwargs):
+        dtype = function(np.zeros((2, 1), first.dtype), axis=0).dtype
+        ufuncs = {np.sum: np.add, np.min: np.minimum, np.max: np.maximum}
+        if function in ufuncs:
+            return _accumulate_ufunc(arrays, ufuncs[function], dtype)
+        elif function is np.mean:
+            return _accumulate_ufunc(arrays, np.add, dtype) / len(arrays)
+        elif function in (np.var, np.std):
+            count, _, m2 = _accumulate_moments(arrays, dtype)
+            var = m2 / max(count - kwargs.get('ddof', 0), 0)
+            return np.sqrt(var) if function is np.std else var
+
+    stacked = np.empty((len(arrays),)+first.shape, first.dtype)
+    for i, arr in enumerate(arrays):
+        stacked[i] = arr
+    return function(stacked, axis=0, **kwargs)
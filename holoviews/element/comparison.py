@@ -214,8 +214,33 @@ class Comparison(ComparisonInterface):
     def compare_floats(cls, arr1, arr2, msg='Floats'):
         cls.compare_arrays(arr1, arr2, msg)
 
+    @classmethod
+    def arrays_identical(cls, arr1, arr2):
+        """
+        Fast check whether two arrays are identical, either because
+        they share the same buffer or because their contents are
+        equal byte for byte, which also matches NaNs in the same
+        positions. A False return does not imply the arrays differ,
+        e.g. for object arrays or float arrays containing -0.0.
+        """
+        if arr1 is arr2:
+            return True
+        elif not (isinstance(arr1, np.ndarray) and isinstance(arr2, np.ndarray)):
+            return False
+        elif (arr1.shape != arr2.shape or arr1.dtype != arr2.dtype or
+              arr1.dtype.kind not in 'biufcmM'):
+            return False
+        elif (arr1.__array_interface__['data'] == arr2.__array_interface__['data']
+              and arr1.strides == arr2.strides):
+            return True
+        bytes1 = np.ascontiguousarray(arr1).reshape(-1).view(np.uint8)
+        bytes2 = np.ascontiguousarray(arr2).reshape(-1).view(np.uint8)
+        return bool((bytes1 == bytes2).all())
+
     @classmethod
     def compare_arrays(cls, arr1, arr2, msg='Arrays'):
+        if cls.arrays_identical(arr1, arr2):
+            return
         try:
             assert_array_equal(arr1, arr2)
         except:
@@ -327,8 +352,15 @@ class Comparison(ComparisonInterface):
                                        + "In first, not second %s. " % diff1
                                        + "In second, not first: %s." % diff2)
 
-        for element1, element2 in zip(el1, el2):
-            cls.assertEqual(element1, element2)
+        if el1.data is el2.data:
+            return
+
+        for key, element1, element2 in zip(el1.keys(), el1, el2):
+            try:
+                cls.assertEqual(element1, element2)
+            except cls.failureException as e:
+                raise cls.failureException('%s\n\n%s differ at key %r.'
+                                           % (e, msg, key))
 
     @classmethod
     def compare_holomap(cls, el1, el2, msg='HoloMaps'):
@@ -449,8 +481,10 @@ class Comparison(ComparisonInterface):
         cls.compare_dimensioned(el1, el2)
         if el1.shape[0] != el2.shape[0]:
             raise AssertionError("%s not of matching length." % msg)
-        dimension_data = [(d, el1[d], el2[d]) for d in el1.dimensions()]
-        for dim, d1, d2 in dimension_data:
+        if el1.data is el2.data and el1.interface is el2.interface:
+            return
+        for dim in el1.dimensions():
+            d1, d2 = el1[dim], el2[dim]
             if d1.dtype != d2.dtype:
                 cls.failureException("%s %s columns have different type." % (msg, dim)
                                      + " First has type %s, and second has type %s."
@@ -460,7 +494,11 @@ class Comparison(ComparisonInterface):
                     cls.failureException("%s along dimension %s not equal." %
                                          (msg, dim))
             else:
-                cls.compare_arrays(d1, d2, msg)
+                try:
+                    cls.compare_arrays(d1, d2, msg)
+                except cls.failureException as e:
+                    raise cls.failureException('%s\n\n%s differs along dimension %s.'
+                                               % (e, msg, dim))
 
 
     @classmethod
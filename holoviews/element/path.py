@@ -27,6 +27,10 @@ class Path(Element2D):
     3) A tuple containing an array of length N with the x-values and a
        second array of shape NxP, where P is the number of paths.
     4) A list of tuples each containing separate x and y values.
+
+    Alternatively a Path may be constructed from a ragged array, i.e.
+    a contiguous array of coordinates and an array of offsets
+    delimiting the paths, using the from_ragged classmethod.
     """
 
     kdims = param.List(default=[Dimension('x'), Dimension('y')],
@@ -51,6 +55,64 @@ class Path(Element2D):
         super(Path, self).__init__(data, **params)
 
 
+    @classmethod
+    def from_ragged(cls, coords, offsets, **params):
+        """
+        Constructs the element from a ragged array representation,
+        i.e. a single contiguous Nx2 array of coordinates and an
+        array of P+1 offsets, where path i is given by
+        coords[offsets[i]:offsets[i+1]]. The individual paths are
+        views into the coordinate array, which is reused by the
+        ragged method without copying.
+        """
+        coords = np.asarray(coords)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        paths = [coords[start:end] for start, end
+                 in zip(offsets[:-1], offsets[1:])]
+        element = cls(paths, **params)
+        element._ragged = (coords, offsets)
+        return element
+
+
+    def ragged(self):
+        """
+        Returns the paths as a ragged array, i.e. a tuple of a single
+        contiguous Nx2 coordinate array and an array of P+1 offsets,
+        where path i is given by coords[offsets[i]:offsets[i+1]].
+        """
+        ragged = self.__dict__.get('_ragged')
+        if ragged is not None and len(ragged[1]) == len(self.data)+1:
+            return ragged
+        lengths = [len(path) for path in self.data]
+        offsets = np.zeros(len(lengths)+1, dtype=np.int64)
+        offsets[1:] = np.cumsum(lengths)
+        if self.data:
+            coords = np.concatenate(self.data)
+        else:
+            coords = np.empty((0, len(self.kdims)))
+        return coords, offsets
+
+
+    def clone(self, data=None, shared_data=True, new_type=None, *args, **overrides):
+        """
+        Returns a clone of the object, retaining the ragged array
+        representation if the data is shared.
+        """
+        clone = super(Path, self).clone(data, shared_data, new_type,
+                                        *args, **overrides)
+        if (data is None and shared_data and isinstance(clone, Path)
+            and '_ragged' in self.__dict__):
+            clone._ragged = self._ragged
+        return clone
+
+
+    def __getstate__(self):
+        "The ragged array is dropped as the paths are pickled separately."
+        state = super(Path, self).__getstate__()
+        state.pop('_ragged', None)
+        return state
+
+
     def __getitem__(self, key):
         if key in self.dimensions(): return self.dimension_values(key)
         if not isinstance(key, tuple) or len(key) == 1:
@@ -82,10 +144,10 @@ class Path(Element2D):
         dim_idx = self.get_dimension_index(dimension)
         if dim_idx >= len(self.dimensions()):
             return super(Path, self).dimension_values(dimension)
-        values = []
-        for contour in self.data:
-            values.append(contour[:, dim_idx])
-        return np.concatenate(values) if values else []
+        if not self.data:
+            return []
+        coords, _ = self.ragged()
+        return coords[:, dim_idx]
 
 
 
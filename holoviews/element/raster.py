@@ -85,10 +85,7 @@ class Raster(Element2D):
 
     @classmethod
     def collapse_data(cls, data_list, function, kdims=None, **kwargs):
-        if isinstance(function, np.ufunc):
-            return function.reduce(data_list)
-        else:
-            return function(np.dstack(data_list), axis=-1, **kwargs)
+        return util.reduce_arrays(data_list, function, **kwargs)
 
 
     def sample(self, samples=[], **sample_values):
@@ -323,11 +320,8 @@ class QuadMesh(Raster):
         if not all(data[0].ndim == 1 for data in data_list):
             raise Exception("Collapsing of non-grid based QuadMesh"
                             "currently not supported")
-        xs, ys, zs = zip(data_list)
-        if isinstance(function, np.ufunc):
-            z = function.reduce(zs)
-        else:
-            z = function(np.dstack(zs), axis=-1, **kwargs)
+        xs, ys, zs = zip(*data_list)
+        z = util.reduce_arrays(zs, function, **kwargs)
         return xs[0], ys[0], z
 
 
@@ -383,7 +377,16 @@ class HeatMap(Dataset, Element2D):
 
     def __init__(self, data, **params):
         super(HeatMap, self).__init__(data, **params)
-        self.gridded = categorical_aggregate2d(self)
+        self._gridded = None
+
+    @property
+    def gridded(self):
+        """
+        The 2D aggregate of the HeatMap, computed on first access.
+        """
+        if getattr(self, '_gridded', None) is None:
+            self._gridded = categorical_aggregate2d(self)
+        return self._gridded
 
     @property
     def raster(self):
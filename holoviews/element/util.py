@@ -5,8 +5,8 @@ import numpy as np
 
 from ..core import Dataset, OrderedDict
 from ..core.operation import ElementOperation
-from ..core.util import (pd, is_nan, sort_topologically,
-                         cartesian_product, is_cyclic, one_to_one)
+from ..core.util import (pd, is_nan, sort_topologically, factorize,
+                         is_cyclic, one_to_one)
 
 try:
     import dask
@@ -57,6 +57,288 @@ def reduce_fn(x):
     return np.NaN
 
 
+# Marching squares lookup tables. Cell corners are encoded as bits
+# (bottom-left=1, bottom-right=2, top-right=4, top-left=8) and cell
+# edges are numbered bottom=0, right=1, top=2, left=3. Cases 16 and
+# 17 are the saddle cases 5 and 10 resolved with a high cell center.
+_ms_cases = {1: [(3, 0)], 2: [(0, 1)], 3: [(3, 1)], 4: [(1, 2)],
+             5: [(3, 0), (1, 2)], 6: [(0, 2)], 7: [(2, 3)], 8: [(2, 3)],
+             9: [(0, 2)], 10: [(0, 1), (2, 3)], 11: [(1, 2)], 12: [(3, 1)],
+             13: [(0, 1)], 14: [(3, 0)], 16: [(0, 1), (2, 3)],
+             17: [(3, 0), (1, 2)]}
+
+# Corner (row, column) offsets of the two vertices of each edge
+_ms_edge_vertices = np.array([[(0, 0), (0, 1)], [(0, 1), (1, 1)],
+                              [(1, 0), (1, 1)], [(0, 0), (1, 0)]])
+
+def _ms_segment_table():
+    """
+    Builds the segment table for each marching squares case, orienting
+    every segment such that values above the level lie on its left,
+    i.e. contours run counter-clockwise around high regions.
+    """
+    corner_bits = {(0, 0): 1, (0, 1): 2, (1, 1): 4, (1, 0): 8}
+    midpoints = {0: (0.5, 0), 1: (1, 0.5), 2: (0.5, 1), 3: (0, 0.5)}
+    table = np.full((18, 2, 2), -1, dtype=np.int8)
+    for case, segments in _ms_cases.items():
+        bits = {16: 5, 17: 10}.get(case, case)
+        for s, (a, b) in enumerate(segments):
+            # Select the vertex of edge a which is above the level
+            high = [v for v in _ms_edge_vertices[a]
+                    if bits & corner_bits[tuple(v)]][0]
+            (ax, ay), (bx, by) = midpoints[a], midpoints[b]
+            cross = (bx-ax)*(high[0]-ay) - (by-ay)*(high[1]-ax)
+            table[case, s] = (a, b) if cross > 0 else (b, a)
+    return table
+
+_ms_segments = _ms_segment_table()
+
+
+def _list_rank(prev):
+    """
+    Given an array of predecessor indices, where chain heads point to
+    themselves, computes the head of the chain each element belongs
+    to and its distance from the head using pointer jumping.
+    """
+    head, dist = prev.copy(), (prev != np.arange(len(prev))).astype(int)
+    for _ in range(int(np.ceil(np.log2(len(prev)+1)))+1):
+        dist = dist + dist[head]
+        head = head[head]
+    return head, dist
+
+
+def contour_paths(z, x, y, levels, filled=False):
+    """
+    Vectorized marching squares implementation which computes the
+    iso-lines (or filled iso-bands if filled=True) of a 2D array z at
+    all the supplied levels in a single pass. The z-array is indexed
+    as (row, column) where the x- and y-coordinates may be supplied
+    as 1D arrays of length ncolumns and nrows respectively, or as 2D
+    arrays matching the shape of z. Cells containing NaNs do not
+    generate any iso-lines and are treated as lying outside all
+    iso-bands.
+
+    Returns the paths in ragged form as a single (N, 2) array of
+    coordinates, an array of offsets delimiting each path and an array
+    of level indices associating each path with a level. When filled
+    is True the returned level index of a path is that of the lower
+    bound of the band it belongs to and holes are oriented clockwise.
+    """
+    z = np.asarray(z, dtype=np.float64)
+    levels = np.asarray(levels, dtype=np.float64)
+    x, y = np.asarray(x), np.asarray(y)
+    if x.ndim == 1: x = x[np.newaxis, :]
+    if y.ndim == 1: y = y[:, np.newaxis]
+    x, y = np.broadcast_to(x, z.shape), np.broadcast_to(y, z.shape)
+    nanmask = np.isnan(z)
+    if filled:
+        # Padding with -inf guarantees all iso-lines are closed rings,
+        # the padded coordinates collapse onto the array boundary
+        z = np.pad(np.where(nanmask, -np.inf, z), 1, mode='constant',
+                   constant_values=-np.inf)
+        x, y = np.pad(x, 1, mode='edge'), np.pad(y, 1, mode='edge')
+        nanmask = np.zeros(z.shape, dtype=bool)
+    ny, nx = z.shape
+    empty = (np.empty((0, 2)), np.zeros(1, dtype=int), np.empty(0, dtype=int))
+    if ny < 2 or nx < 2 or not len(levels):
+        return empty
+
+    # Compute marching squares case for each cell at every level
+    with np.errstate(invalid='ignore'):
+        above = z >= levels[:, np.newaxis, np.newaxis]
+    cases = (above[:, :-1, :-1].astype(np.uint8) | (above[:, :-1, 1:] << 1) |
+             (above[:, 1:, 1:] << 2) | (above[:, 1:, :-1] << 3))
+    cellnan = nanmask[:-1, :-1] | nanmask[:-1, 1:] | nanmask[1:, 1:] | nanmask[1:, :-1]
+    cases[:, cellnan] = 0
+    with np.errstate(invalid='ignore'):
+        center = (z[:-1, :-1] + z[:-1, 1:] + z[1:, 1:] + z[1:, :-1]) / 4.
+        center_high = center >= levels[:, np.newaxis, np.newaxis]
+    cases[(cases == 5) & center_high] = 16
+    cases[(cases == 10) & center_high] = 17
+
+    # Look up the segments of all cells
+    lvls, rows, cols, starts, ends = [], [], [], [], []
+    for s in range(2):
+        edges = _ms_segments[:, s][cases]
+        lvl, row, col = np.nonzero(edges[..., 0] >= 0)
+        lvls.append(lvl); rows.append(row); cols.append(col)
+        starts.append(edges[lvl, row, col, 0]); ends.append(edges[lvl, row, col, 1])
+    lvl, row, col = np.concatenate(lvls), np.concatenate(rows), np.concatenate(cols)
+    if not len(lvl):
+        return empty
+    starts, ends = np.concatenate(starts), np.concatenate(ends)
+
+    # Assign a globally unique id to each edge and interpolate the
+    # crossing point along it
+    nhedges, nvedges = ny*(nx-1), (ny-1)*nx
+    level_offset = lvl*(nhedges+nvedges)
+    def edge_points(edge):
+        horizontal = (edge % 2) == 0
+        eid = np.where(horizontal, (row+(edge == 2))*(nx-1)+col,
+                       nhedges+row*nx+col+(edge == 1)) + level_offset
+        (r0, c0), (r1, c1) = [(row+_ms_edge_vertices[edge, i, 0],
+                               col+_ms_edge_vertices[edge, i, 1]) for i in range(2)]
+        z0, z1 = z[r0, c0], z[r1, c1]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            t = (levels[lvl]-z0)/(z1-z0)
+        t[~np.isfinite(t)] = 0
+        xs = x[r0, c0] + t*(x[r1, c1]-x[r0, c0])
+        ys = y[r0, c0] + t*(y[r1, c1]-y[r0, c0])
+        return eid, np.column_stack([xs, ys])
+    start_ids, start_pts = edge_points(starts)
+    end_ids, end_pts = edge_points(ends)
+
+    # Link each segment to the segment starting where it ends
+    nsegs = len(lvl)
+    indices = np.arange(nsegs)
+    order = np.argsort(start_ids)
+    pos = np.searchsorted(start_ids, end_ids, sorter=order).clip(0, nsegs-1)
+    linked = start_ids[order[pos]] == end_ids
+    prev = indices.copy()
+    prev[order[pos[linked]]] = indices[linked]
+
+    # Break closed rings at their lowest index segment
+    head, _ = _list_rank(prev)
+    ring = prev[head] != head
+    if ring.any():
+        label, jump = np.where(ring, indices, nsegs), prev.copy()
+        for _ in range(int(np.ceil(np.log2(nsegs+1)))+1):
+            label = np.minimum(label, label[jump])
+            jump = jump[jump]
+        breaks = ring & (label == indices)
+        prev[breaks] = indices[breaks]
+    head, dist = _list_rank(prev)
+
+    # Order segments by level, path and position along the path
+    order = np.lexsort((dist, head, lvl[head]))
+    head = head[order]
+    new_path = np.concatenate([[True], head[1:] != head[:-1]])
+    path_index = np.cumsum(new_path)-1
+    last = np.concatenate([new_path[1:], [True]])
+    coords = np.empty((nsegs+path_index[-1]+1, 2))
+    coords[indices+path_index] = start_pts[order]
+    coords[(indices+path_index+1)[last]] = end_pts[order[last]]
+    point_path = np.repeat(path_index, 1+last)
+
+    # Drop repeated vertices generated when the level coincides with
+    # sample values or along the padded boundary of filled contours
+    keep = np.concatenate([[True], (point_path[1:] != point_path[:-1]) |
+                           (coords[1:] != coords[:-1]).any(axis=1)])
+    coords, point_path = coords[keep], point_path[keep]
+    counts = np.bincount(point_path, minlength=path_index[-1]+1)
+    path_levels = lvl[head[new_path]]
+    valid = counts > 1
+    if not valid.all():
+        coords = coords[np.repeat(valid, counts)]
+        counts, path_levels = counts[valid], path_levels[valid]
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    if filled:
+        # Combine outer rings of the lower level with the reversed
+        # rings of the upper level into bands
+        paths = np.split(coords, offsets[1:-1])
+        bands = [(l, p) for l, p in zip(path_levels, paths) if l < len(levels)-1]
+        bands += [(l-1, p[::-1]) for l, p in zip(path_levels, paths) if l > 0]
+        bands = sorted(bands, key=lambda b: b[0])
+        if not bands:
+            return empty
+        path_levels = np.array([l for l, _ in bands], dtype=int)
+        counts = np.array([len(p) for _, p in bands])
+        coords = np.concatenate([p for _, p in bands])
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+    return coords, offsets, path_levels
+
+
+def lttb_indices(x, y, samples):
+    """
+    Largest-Triangle-Three-Buckets downsampling of one or more curves
+    sampled at the sorted x-values x. The y-values may be supplied as
+    a 1D array or as a 2D array of shape (ncurves, len(x)), in which
+    case the buckets of all curves are processed together. Returns the
+    indices of the selected samples, an integer array with the same
+    number of dimensions as y and samples entries along the last axis.
+    """
+    x = np.asarray(x)
+    if x.dtype.kind == 'M':
+        x = x.astype('datetime64[ns]').astype(np.int64)
+    x = x.astype(np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    squeeze = y.ndim == 1
+    y = np.atleast_2d(y)
+    ncurves, n = y.shape
+    if samples >= n:
+        indices = np.tile(np.arange(n), (ncurves, 1))
+        return indices[0] if squeeze else indices
+    elif samples < 3:
+        raise ValueError("LTTB downsampling requires at least 3 samples.")
+
+    # The first and last samples are always retained, the remaining
+    # samples are split into buckets of (nearly) equal size
+    edges = np.linspace(1, n-1, samples-1).astype(np.int64)
+    rows = np.arange(ncurves)
+    indices = np.empty((ncurves, samples), dtype=np.int64)
+    indices[:, 0], indices[:, -1] = 0, n-1
+    selected = indices[:, 0]
+    for i in range(samples-2):
+        start, end = edges[i], edges[i+1]
+        nstart, nend = (edges[i+1], edges[i+2]) if i < samples-3 else (n-1, n)
+        # Triangle formed by the previously selected point, each point
+        # in the bucket and the average of the next bucket
+        ax, ay = x[selected], y[rows, selected]
+        cx, cy = x[nstart:nend].mean(), y[:, nstart:nend].mean(axis=1)
+        bx, by = x[start:end], y[:, start:end]
+        area = np.abs((ax-cx)[:, None]*(by-ay[:, None]) -
+                      (ax[:, None]-bx)*(cy-ay)[:, None])
+        area[np.isnan(area)] = -1
+        selected = start + np.argmax(area, axis=1)
+        indices[:, i+1] = selected
+    return indices[0] if squeeze else indices
+
+
+def minmax_indices(x, y, edges):
+    """
+    Min-max downsampling of one or more curves sampled at the sorted
+    x-values x, selecting the samples with the minimum and maximum
+    y-value in each bin defined by the sorted edges, e.g. one bin per
+    pixel. The y-values may be supplied as a 1D array or as a 2D array
+    of shape (ncurves, len(x)), in which case all curves are binned
+    together. Returns the selected indices in ascending order, an
+    integer array with the same number of dimensions as y and two
+    entries along the last axis per non-empty bin.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    squeeze = y.ndim == 1
+    y = np.atleast_2d(y)
+    bounds = np.searchsorted(x, edges, 'left')
+    bounds[-1] = np.searchsorted(x, edges[-1], 'right')
+    starts, ends = bounds[:-1], bounds[1:]
+    nonempty = ends > starts
+    starts, ends = starts[nonempty], ends[nonempty]
+    if not len(starts):
+        indices = np.empty((len(y), 0), dtype=np.int64)
+        return indices[0] if squeeze else indices
+
+    # Locate the first occurrence of the minimum and maximum of each
+    # bin, ignoring NaNs unless a bin only contains NaNs
+    offset = starts[0]
+    segment = y[:, offset:ends[-1]]
+    rel, counts = starts-offset, ends-starts
+    nans = np.isnan(segment)
+    positions = np.arange(segment.shape[1])
+    bin_indices = []
+    for fill, reduction in [(np.inf, np.minimum), (-np.inf, np.maximum)]:
+        values = np.where(nans, fill, segment)
+        extrema = np.repeat(reduction.reduceat(values, rel, axis=1), counts, axis=1)
+        matches = np.where(values == extrema, positions, segment.shape[1])
+        bin_indices.append(np.minimum.reduceat(matches, rel, axis=1))
+    imin, imax = bin_indices
+    indices = np.empty((len(y), 2*len(rel)), dtype=np.int64)
+    indices[:, 0::2] = np.minimum(imin, imax) + offset
+    indices[:, 1::2] = np.maximum(imin, imax) + offset
+    return indices[0] if squeeze else indices
+
+
 class categorical_aggregate2d(ElementOperation):
     """
     Generates a gridded Dataset of 2D aggregate arrays indexed by the
@@ -83,59 +365,90 @@ class categorical_aggregate2d(ElementOperation):
     def _get_coords(self, obj):
         """
         Get the coordinates of the 2D aggregate, maintaining the correct
-        sorting order.
+        sorting order, along with the integer codes of each row into
+        the coordinates.
         """
         xdim, ydim = obj.dimensions(label=True)[:2]
-        xcoords = obj.dimension_values(xdim, False)
-        ycoords = obj.dimension_values(ydim, False)
+        xcodes, xcoords = factorize(obj.dimension_values(xdim))
+        ycodes, ycoords = factorize(obj.dimension_values(ydim))
 
         # Determine global orderings of y-values using topological sort
-        grouped = obj.groupby(xdim, container_type=OrderedDict,
-                              group_type=Dataset).values()
-        orderings = OrderedDict()
-        for group in grouped:
-            vals = group.dimension_values(ydim)
-            if len(vals) == 1:
-                orderings[vals[0]] = [vals[0]]
-            else:
-                for i in range(len(vals)-1):
-                    p1, p2 = vals[i:i+2]
-                    orderings[p1] = [p2]
+        orderings = self._get_orderings(xcodes, ycodes, ycoords)
         if one_to_one(orderings, ycoords):
-            ycoords = np.sort(ycoords)
+            ordered = np.sort(ycoords)
         elif not is_cyclic(orderings):
-            ycoords = list(itertools.chain(*sort_topologically(orderings)))
-        return xcoords, ycoords
+            ordered = list(itertools.chain(*sort_topologically(orderings)))
+        else:
+            return xcoords, ycoords, xcodes, ycodes
+
+        # Retain y-values dropped from the orderings at the end
+        positions = set(ordered)
+        ordered = list(ordered) + [v for v in ycoords if v not in positions]
+        positions = {v: i for i, v in enumerate(ordered)}
+        remap = np.array([positions[v] for v in ycoords])
+        ycodes = np.where(ycodes < 0, ycodes, remap[ycodes])
+        return xcoords, np.array(ordered, dtype=ycoords.dtype), xcodes, ycodes
 
 
-    def _aggregate_dataset(self, obj, xcoords, ycoords):
+    def _get_orderings(self, xcodes, ycodes, ycoords):
         """
-        Generates a gridded Dataset from a column-based dataset and
-        lists of xcoords and ycoords
+        Computes the graph of y-value orderings observed within each
+        group of rows sharing an x-value. Each y-value is mapped onto
+        the value which last followed it within a group, while y-values
+        forming a group of their own are mapped onto themselves.
         """
-        dim_labels = obj.dimensions(label=True)
-        vdims = obj.dimensions()[2:]
-        xdim, ydim = dim_labels[:2]
+        order = np.argsort(xcodes, kind='mergesort')
+        xsorted, ysorted = xcodes[order], ycodes[order]
+        new_group = np.concatenate([[True], xsorted[1:] != xsorted[:-1]])
+        group_end = np.concatenate([new_group[1:], [True]])
+        singleton = new_group & group_end
+        followers = np.concatenate([ysorted[1:], [-1]])
+        assigned = singleton | ~group_end
+        keys = ysorted[assigned]
+        values = np.where(singleton, ysorted, followers)[assigned]
+
+        # Keys are ordered by first assignment, retaining the last value
+        ukeys, first = np.unique(keys, return_index=True)
+        _, last = np.unique(keys[::-1], return_index=True)
+        values = values[len(keys)-1-last]
+        orderings = OrderedDict()
+        for i in np.argsort(first):
+            orderings[ycoords[ukeys[i]]] = [ycoords[values[i]]]
+        return orderings
+
+
+    def _aggregate_dataset(self, obj, xcoords, ycoords, xcodes, ycodes):
+        """
+        Generates a gridded Dataset from a column-based dataset by
+        scattering the first non-NaN value of each x/y combination
+        into a dense 2D array for each value dimension.
+        """
+        kdims, vdims = obj.dimensions()[:2], obj.dimensions()[2:]
+        xdim, ydim = [d.name for d in kdims]
         shape = (len(ycoords), len(xcoords))
-        nsamples = np.product(shape)
+        valid = (xcodes >= 0) & (ycodes >= 0)
+        cells = (ycodes*len(xcoords)+xcodes)
 
-        ys, xs = cartesian_product([ycoords, xcoords])
-        data = {xdim: xs.flatten(), ydim: ys.flatten()}
-        for vdim in vdims:
-            values = np.empty(nsamples)
-            values[:] = np.NaN
-            data[vdim.name] = values
-        dtype = 'dataframe' if pd else 'dictionary'
-        dense_data = Dataset(data, kdims=obj.kdims, vdims=obj.vdims, datatype=[dtype])
-        concat_data = obj.interface.concatenate([dense_data, obj], datatype=[dtype])
-        agg = concat_data.reindex([xdim, ydim], vdims).aggregate([xdim, ydim], reduce_fn)
-
-        # Convert data to a gridded dataset
         grid_data = {xdim: xcoords, ydim: ycoords}
         for vdim in vdims:
-            grid_data[vdim.name] = agg.dimension_values(vdim).reshape(shape)
-        return agg.clone(grid_data, kdims=[xdim, ydim], vdims=vdims,
-                         datatype=self.p.datatype)
+            values = obj.dimension_values(vdim)
+            if values.dtype.kind in 'uifb':
+                dense = np.full(np.product(shape), np.NaN)
+            else:
+                dense = np.full(np.product(shape), np.NaN, dtype=object)
+            if values.dtype.kind == 'f':
+                mask = valid & ~np.isnan(values)
+            elif values.dtype.kind == 'O':
+                nulls = (pd.isnull(values) if pd else
+                         np.array([bool(is_nan(v)) for v in values], dtype=bool))
+                mask = valid & ~nulls
+            else:
+                mask = valid
+            filled, first = np.unique(cells[mask], return_index=True)
+            dense[filled] = values[mask][first]
+            grid_data[vdim.name] = dense.reshape(shape)
+        return Dataset(grid_data, kdims=kdims, vdims=vdims, label=obj.label,
+                       datatype=self.p.datatype)
 
 
     def _process(self, obj, key=None):
@@ -152,7 +465,5 @@ class categorical_aggregate2d(ElementOperation):
             raise ValueError("Must have at two dimensions to aggregate over"
                              "and one value dimension to aggregate on.")
 
-        dtype = 'dataframe' if pd else 'dictionary'
-        obj = Dataset(obj, datatype=[dtype])
-        xcoords, ycoords = self._get_coords(obj)
-        return self._aggregate_dataset(obj, xcoords, ycoords)
+        xcoords, ycoords, xcodes, ycodes = self._get_coords(obj)
+        return self._aggregate_dataset(obj, xcoords, ycoords, xcodes, ycodes)
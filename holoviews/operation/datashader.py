@@ -1,6 +1,8 @@
 from __future__ import absolute_import
 
-from collections import Callable, Iterable
+import threading
+import weakref
+from collections import Callable, Iterable, OrderedDict
 
 import param
 import numpy as np
@@ -69,6 +71,85 @@ def dataset_pipeline(dataset, schema, canvas, glyph, summary):
     return agg
 
 
+class AggregateCache(object):
+    """
+    AggregateCache memoizes the aggregates computed by the aggregate
+    operation, keyed by the identity of the aggregated element and
+    the parameters determining the aggregate, i.e. the ranges, width,
+    height, sampling and aggregator. Revisiting a frame of a HoloMap
+    or returning to a previous zoom level therefore does not require
+    rasterizing the data again. Entries are discarded once the
+    element is garbage collected or when more than size aggregates
+    are cached, evicting the least recently used aggregates first.
+
+    Since the cache assumes elements are not modified in place, it
+    should be cleared if the data of an aggregated element is mutated.
+    """
+
+    def __init__(self, size=100):
+        self.size = size
+        self._aggregates = OrderedDict()
+        self._expired = []
+        self._lock = threading.Lock()
+
+
+    def __len__(self):
+        return len(self._aggregates)
+
+
+    def _discard(self, key):
+        # Weakref callbacks may run during garbage collection while the
+        # lock is held, so expired keys are only removed on next access
+        return lambda ref: self._expired.append(key)
+
+
+    def _purge(self):
+        while self._expired:
+            key = self._expired.pop()
+            entry = self._aggregates.get(key)
+            if entry is not None and entry[0]() is None:
+                del self._aggregates[key]
+
+
+    def get(self, element, params):
+        """
+        Returns the cached aggregate of an element for the supplied
+        parameters or None.
+        """
+        key = (id(element), params)
+        with self._lock:
+            self._purge()
+            entry = self._aggregates.pop(key, None)
+            if entry is None or entry[0]() is not element:
+                return None
+            self._aggregates[key] = entry
+        return entry[1]
+
+
+    def set(self, element, params, aggregate):
+        """
+        Stores the aggregate of an element for the supplied parameters.
+        """
+        if not self.size:
+            return
+        key = (id(element), params)
+        try:
+            ref = weakref.ref(element, self._discard(key))
+        except TypeError:
+            return
+        with self._lock:
+            self._purge()
+            self._aggregates[key] = (ref, aggregate)
+            while len(self._aggregates) > self.size:
+                self._aggregates.popitem(last=False)
+
+
+    def clear(self):
+        with self._lock:
+            self._aggregates.clear()
+
+
+
 class aggregate(ElementOperation):
     """
     aggregate implements 2D binning for any valid HoloViews Element
@@ -86,6 +167,10 @@ class aggregate(ElementOperation):
     the operation will ensure that a bin is no smaller than theminimum
     sampling distance by reducing the width and height when the zoomed
     in beyond the minimum sampling distance.
+
+    Aggregates are cached by element and parameters, and the frames
+    of a HoloMap are aggregated concurrently when more than one
+    thread is requested and the operation is not dynamic.
     """
 
     aggregator = param.ClassSelector(class_=ds.reductions.Reduction,
@@ -123,6 +208,44 @@ class aggregate(ElementOperation):
                                         doc="""
         The type of the returned Elements, must be a 2D Dataset type.""")
 
+    cache = AggregateCache()
+
+    def _cache_params(self):
+        """
+        Returns a hashable key of the parameters determining the
+        aggregate or None if they cannot be hashed, in which case the
+        aggregate is not cached. Automatic ranges depend only on the
+        element, so the supplied ranges rather than the computed
+        ranges are used.
+        """
+        try:
+            return self._hashable((self.p.x_range, self.p.y_range,
+                                   self.p.width, self.p.height,
+                                   self.p.x_sampling, self.p.y_sampling,
+                                   self.p.element_type, self.p.aggregator))
+        except TypeError:
+            return None
+
+
+    @classmethod
+    def _hashable(cls, obj):
+        """
+        Converts an object into a hashable key, recursing into
+        containers and into the attributes of datashader reductions,
+        which may themselves hold nested reductions. Raises a
+        TypeError if the object cannot be hashed.
+        """
+        if isinstance(obj, dict):
+            return tuple(sorted((k, cls._hashable(v)) for k, v in obj.items()))
+        elif isinstance(obj, (list, tuple)):
+            return tuple(cls._hashable(v) for v in obj)
+        elif (isinstance(obj, ds.reductions.Reduction) or
+              type(obj).__module__.startswith('datashader.')):
+            return (type(obj), cls._hashable(vars(obj)))
+        hash(obj)
+        return obj
+
+
     @classmethod
     def get_agg_data(cls, obj, category=None):
         """
@@ -136,11 +259,14 @@ class aggregate(ElementOperation):
         is_df = lambda x: isinstance(x, Dataset) and x.interface in DF_INTERFACES
         if isinstance(obj, Path):
             glyph = 'line'
-            for p in obj.data:
-                df = pd.DataFrame(p, columns=obj.dimensions('key', True))
-                if isinstance(obj, Contours) and obj.vdims and obj.level:
-                    df[obj.vdims[0].name] = p.level
-                paths.append(df)
+            # Separate the paths in the contiguous coordinates with NaNs
+            coords, offsets = obj.ragged()
+            coords = np.insert(coords.astype('float64'), offsets[1:-1],
+                               np.NaN, axis=0)
+            df = pd.DataFrame(coords, columns=obj.dimensions('key', True))
+            if isinstance(obj, Contours) and obj.vdims and obj.level:
+                df[obj.vdims[0].name] = obj.level
+            paths.append(df)
         elif isinstance(obj, CompositeOverlay):
             for key, el in obj.data.items():
                 x, y, element, glyph = cls.get_agg_data(el)
@@ -175,6 +301,18 @@ class aggregate(ElementOperation):
 
 
     def _process(self, element, key=None):
+        cache_params = self._cache_params()
+        if cache_params is None:
+            return self._aggregate(element)
+        cached = self.cache.get(element, cache_params)
+        if cached is not None:
+            return cached
+        agg = self._aggregate(element)
+        self.cache.set(element, cache_params, agg)
+        return agg
+
+
+    def _aggregate(self, element):
         agg_fn = self.p.aggregator
         category = agg_fn.column if isinstance(agg_fn, ds.count_cat) else None
         x, y, data, glyph = self.get_agg_data(element, category)
@@ -249,18 +387,38 @@ class shade(ElementOperation):
         """
         if not isinstance(overlay, NdOverlay):
             raise ValueError('Only NdOverlays can be concatenated')
-        xarr = xr.concat([v.data.T for v in overlay.values()],
-                         dim=overlay.kdims[0].name)
+        dim = overlay.kdims[0].name
+        vdim = overlay.last.vdims[0].name
+        array = overlay.last.data[vdim]
+        # Fill a single preallocated array rather than concatenating
+        # transposed copies of each layer
+        stacked = np.empty(array.shape+(len(overlay),), dtype=array.dtype)
+        for i, el in enumerate(overlay.values()):
+            stacked[..., i] = el.data[vdim].values
+        # Layers are indexed by position along the concatenated
+        # dimension, matching the default coordinates of xr.concat
+        coords = OrderedDict((d, array.coords[d].values) for d in array.dims)
+        coords[dim] = np.arange(len(overlay))
+        xarr = xr.Dataset({vdim: (array.dims+(dim,), stacked)}, coords=coords)
         params = dict(get_param_values(overlay.last),
                       vdims=overlay.last.vdims,
                       kdims=overlay.kdims+overlay.last.kdims)
-        return Dataset(xarr.T, datatype=['xarray'], **params)
+        return Dataset(xarr, datatype=['xarray'], **params)
+
+
+    # Sampled colormaps, evicting the least recently used colormaps
+    # once more than _colormap_cache_size have been cached
+    _colormaps = OrderedDict()
+
+    _colormap_cache_size = 50
 
+    _colormap_lock = threading.Lock()
 
     @classmethod
     def uint32_to_uint8(cls, img):
         """
-        Cast uint32 RGB image to 4 uint8 channels.
+        Cast uint32 RGB image to 4 uint8 channels, returning a view
+        of the packed image without copying it.
         """
         return np.flipud(img.view(dtype=np.uint8).reshape(img.shape + (4,)))
 
@@ -275,6 +433,41 @@ class shade(ElementOperation):
         return "#{0:02x}{1:02x}{2:02x}".format(*(int(v*255) for v in rgb))
 
 
+    @classmethod
+    def sample_cmap(cls, cmap, samples):
+        """
+        Samples a colormap callable at the supplied number of evenly
+        spaced values between 0 and 1, returning a list of hex colors.
+        Colormaps are sampled in a single vectorized call where
+        supported and the most recently used colormaps are cached.
+        """
+        key = (cmap, samples)
+        try:
+            with cls._colormap_lock:
+                colors = cls._colormaps.pop(key, None)
+                if colors is not None:
+                    cls._colormaps[key] = colors
+        except TypeError:
+            key, colors = None, None
+        if colors is not None:
+            return colors
+        values = np.linspace(0, 1, samples)
+        try:
+            rgbs = np.asarray(cmap(values), dtype=float)
+            if rgbs.shape[:1] != (samples,):
+                raise ValueError
+        except Exception:
+            rgbs = np.array([cmap(v) for v in values], dtype=float)
+        rgbs = (rgbs[:, :3]*255).astype(int)
+        colors = ["#{0:02x}{1:02x}{2:02x}".format(*rgb) for rgb in rgbs]
+        if key is not None:
+            with cls._colormap_lock:
+                cls._colormaps[key] = colors
+                while len(cls._colormaps) > cls._colormap_cache_size:
+                    cls._colormaps.popitem(last=False)
+        return colors
+
+
     def _process(self, element, key=None):
         if isinstance(element, NdOverlay):
             bounds = element.last.bounds
@@ -299,13 +492,11 @@ class shade(ElementOperation):
                 shade_opts['color_key'] = [c for i, c in
                                            zip(range(categories), self.p.cmap)]
             else:
-                colors = [self.p.cmap(s) for s in np.linspace(0, 1, categories)]
-                shade_opts['color_key'] = map(self.rgb2hex, colors)
+                shade_opts['color_key'] = self.sample_cmap(self.p.cmap, categories)
         elif not self.p.cmap:
             pass
         elif isinstance(self.p.cmap, Callable):
-            colors = [self.p.cmap(s) for s in np.linspace(0, 1, 256)]
-            shade_opts['cmap'] = map(self.rgb2hex, colors)
+            shade_opts['cmap'] = self.sample_cmap(self.p.cmap, 256)
         else:
             shade_opts['cmap'] = self.p.cmap
 
@@ -11,13 +11,20 @@ from param import _is_number
 from ..core import (ElementOperation, NdOverlay, Overlay, GridMatrix,
                     HoloMap, Dataset, Element, Collator)
 from ..core.data import ArrayInterface, DictInterface
-from ..core.util import find_minmax, group_sanitizer, label_sanitizer, pd
+from ..core.util import (find_minmax, group_sanitizer, label_sanitizer, pd,
+                         thread_map)
 from ..element.chart import Histogram, Scatter
-from ..element.raster import Raster, Image, RGB, QuadMesh
+from ..element.raster import Raster, Image, RGB, QuadMesh, GridImage
 from ..element.path import Contours, Polygons
-from ..element.util import categorical_aggregate2d
+from ..element.util import (categorical_aggregate2d, contour_paths, toarray,
+                            lttb_indices, minmax_indices)
 from ..streams import RangeXY
 
+try:
+    import dask.array as dask_array
+except ImportError:
+    dask_array = None
+
 column_interfaces = [ArrayInterface, DictInterface]
 if pd:
     from ..core.data import PandasInterface
@@ -301,12 +308,43 @@ class threshold(ElementOperation):
 
 
 
+def _image_array(element):
+    """
+    Returns the value array of an Image or GridImage oriented with the
+    top row first, leaving dask arrays unevaluated.
+    """
+    if isinstance(element, GridImage):
+        return element.dimension_values(2, flat=False)[::-1]
+    return element.data
+
+
+def _image_result(element, array, xs=None, ys=None, **params):
+    """
+    Wraps an array oriented with the top row first in an element of
+    the same type as the supplied Image or GridImage.
+    """
+    if isinstance(element, GridImage):
+        xs = element.dimension_values(0, False) if xs is None else xs
+        ys = element.dimension_values(1, False) if ys is None else ys
+        return element.clone((xs, ys, array[::-1]), **params)
+    return Image(array, element.bounds, **params)
+
+
+def _is_dask(array):
+    return dask_array is not None and isinstance(array, dask_array.Array)
+
+
 class gradient(ElementOperation):
     """
     Compute the gradient plot of the supplied Image.
 
     If the Image value dimension is cyclic, the smallest step is taken
     considered the cyclic range
+
+    The gradient is computed in blocks of rows, bounding the size of
+    the temporary arrays and allowing the blocks to be processed
+    concurrently. GridImage elements backed by dask arrays are
+    processed lazily.
     """
 
     output_type = Image
@@ -314,6 +352,30 @@ class gradient(ElementOperation):
     group = param.String(default='Gradient', doc="""
     The group assigned to the output gradient matrix.""")
 
+    block_size = param.Integer(default=1024, bounds=(1, None), doc="""
+        The number of rows of the gradient computed at a time.""")
+
+    @classmethod
+    def _magnitude(cls, data, rows, out, cyclic_range=None):
+        """
+        Computes the gradient magnitude of the supplied rows in place
+        writing the results to the output array.
+        """
+        start, stop = rows
+        block = data[start:stop+1]
+        dx = np.subtract(block[:-1, 1:], block[:-1, :-1], dtype=np.float64)
+        dy = np.subtract(block[1:, :-1], block[:-1, :-1], dtype=np.float64)
+        if cyclic_range is not None:
+            # Wrap into the specified range preferring small jumps
+            for d in (dx, dy):
+                np.mod(d, cyclic_range, out=d)
+                np.minimum(d, cyclic_range-d, out=d)
+        np.multiply(dx, dx, out=dx)
+        np.multiply(dy, dy, out=dy)
+        np.add(dx, dy, out=dx)
+        np.sqrt(dx, out=out[start:stop])
+
+
     def _process(self, matrix, key=None):
 
         if len(matrix.vdims) != 1:
@@ -322,32 +384,34 @@ class gradient(ElementOperation):
 
         matrix_dim = matrix.vdims[0]
 
-        data = matrix.data
+        data = _image_array(matrix)
         r, c = data.shape
 
         if  matrix_dim.cyclic and (None in matrix_dim.range):
             raise Exception("Cyclic range must be specified to compute "
                             "the gradient of cyclic quantities")
-        cyclic_range = None if not matrix_dim.cyclic else np.diff(matrix_dim.range)
-        if cyclic_range is not None:
-            # shift values such that wrapping works ok
-            data = data - matrix_dim.range[0]
-
-        dx = np.diff(data, 1, axis=1)[0:r-1, 0:c-1]
-        dy = np.diff(data, 1, axis=0)[0:r-1, 0:c-1]
-
-        if cyclic_range is not None: # Wrap into the specified range
-            # Convert negative differences to an equivalent positive value
-            dx = dx % cyclic_range
-            dy = dy % cyclic_range
-            #
-            # Prefer small jumps
-            dx_negatives = dx - cyclic_range
-            dy_negatives = dy - cyclic_range
-            dx = np.where(np.abs(dx_negatives)<dx, dx_negatives, dx)
-            dy = np.where(np.abs(dy_negatives)<dy, dy_negatives, dy)
+        cyclic_range = None if not matrix_dim.cyclic else np.diff(matrix_dim.range)[0]
+
+        if _is_dask(data):
+            dx = data[:-1, 1:] - data[:-1, :-1]
+            dy = data[1:, :-1] - data[:-1, :-1]
+            if cyclic_range is not None:
+                dx, dy = dx % cyclic_range, dy % cyclic_range
+                dx = dask_array.minimum(dx, cyclic_range-dx)
+                dy = dask_array.minimum(dy, cyclic_range-dy)
+            gradient = dask_array.sqrt(dx * dx + dy * dy)
+        else:
+            gradient = np.empty((r-1, c-1))
+            blocks = [(i, min(i+self.p.block_size, r-1))
+                      for i in range(0, r-1, self.p.block_size)]
+            thread_map(lambda rows: self._magnitude(data, rows, gradient, cyclic_range),
+                       blocks, self.p.threads)
 
-        return Image(np.sqrt(dx * dx + dy * dy), matrix.bounds, group=self.p.group)
+        if isinstance(matrix, GridImage):
+            xs, ys = [matrix.dimension_values(i, False) for i in range(2)]
+            return _image_result(matrix, gradient, (xs[1:]+xs[:-1])/2.,
+                                 (ys[1:]+ys[:-1])/2., group=self.p.group)
+        return Image(gradient, matrix.bounds, group=self.p.group)
 
 
 
@@ -356,6 +420,13 @@ class convolve(ElementOperation):
     Apply a convolution to an overlay using the top layer as the
     kernel for convolving the bottom layer. Both Image elements in
     the input overlay should have a single value dimension.
+
+    Images larger than the tile_size are convolved tile by tile using
+    the overlap-save method, bounding the memory required by the FFTs
+    and allowing the tiles to be processed concurrently. The
+    convolution wraps around the edges of the Image. GridImage
+    elements backed by dask arrays are convolved lazily, chunk by
+    chunk.
     """
 
     output_type = Image
@@ -368,6 +439,47 @@ class convolve(ElementOperation):
         convolution in lbrt (left, bottom, right, top) format. By
         default, no slicing is applied.""")
 
+    tile_size = param.Integer(default=1024, bounds=(1, None), doc="""
+        The number of rows and columns of the output computed per
+        tile. Tiles are enlarged to at least the size of the kernel.""")
+
+    @classmethod
+    def _convolve(cls, data, kernel, tile_size, threads=1):
+        """
+        Computes the circular convolution of the data with the kernel
+        centered on each sample, convolving the data in tiles if it
+        exceeds the tile size.
+        """
+        rows, cols = data.shape
+        k_rows, k_cols = kernel.shape
+        t_rows, t_cols = max(tile_size, k_rows), max(tile_size, k_cols)
+        if t_rows >= rows and t_cols >= cols:
+            fft1 = np.fft.rfft2(data)
+            fft2 = np.fft.rfft2(kernel, s=data.shape)
+            convolved_raw = np.fft.irfft2(fft1 * fft2, s=data.shape)
+            return np.roll(np.roll(convolved_raw, -(k_cols//2), axis=-1),
+                           -(k_rows//2), axis=-2)
+
+        # Overlap-save: each output tile is computed from the input
+        # tile extended by the kernel support, wrapping at the edges
+        shape = (t_rows+k_rows-1, t_cols+k_cols-1)
+        kernel_fft = np.fft.rfft2(kernel, s=shape)
+        convolved = np.empty((rows, cols))
+        def convolve_tile(tile):
+            r0, c0 = tile
+            r1, c1 = min(r0+t_rows, rows), min(c0+t_cols, cols)
+            row_inds = np.arange(r0+k_rows//2-k_rows+1, r0+t_rows+k_rows//2) % rows
+            col_inds = np.arange(c0+k_cols//2-k_cols+1, c0+t_cols+k_cols//2) % cols
+            region = data[np.ix_(row_inds, col_inds)]
+            tile_raw = np.fft.irfft2(np.fft.rfft2(region, s=shape) * kernel_fft, s=shape)
+            convolved[r0:r1, c0:c1] = tile_raw[k_rows-1:k_rows-1+r1-r0,
+                                               k_cols-1:k_cols-1+c1-c0]
+        tiles = [(r, c) for r in range(0, rows, t_rows)
+                 for c in range(0, cols, t_cols)]
+        thread_map(convolve_tile, tiles, threads)
+        return convolved
+
+
     def _process(self, overlay, key=None):
         if len(overlay) != 2:
             raise Exception("Overlay must contain at least to items.")
@@ -380,17 +492,22 @@ class convolve(ElementOperation):
         xslice = slice(self.p.kernel_roi[0], self.p.kernel_roi[2])
         yslice = slice(self.p.kernel_roi[1], self.p.kernel_roi[3])
 
-        k = kernel.data if self.p.kernel_roi == (0,0,0,0) else kernel[xslice, yslice].data
-
-        fft1 = np.fft.fft2(target.data)
-        fft2 = np.fft.fft2(k, s= target.data.shape)
-        convolved_raw = np.fft.ifft2(fft1 * fft2).real
+        k = kernel if self.p.kernel_roi == (0,0,0,0) else kernel[xslice, yslice]
+        k = toarray(_image_array(k))
 
-        k_rows, k_cols = k.shape
-        rolled = np.roll(np.roll(convolved_raw, -(k_cols//2), axis=-1), -(k_rows//2), axis=-2)
-        convolved = rolled / float(k.sum())
+        data = _image_array(target)
+        if _is_dask(data):
+            depth = {0: k.shape[0]//2, 1: k.shape[1]//2}
+            convolved_raw = data.map_overlap(self._convolve, depth=depth,
+                                             boundary='periodic', kernel=k,
+                                             tile_size=self.p.tile_size,
+                                             dtype=np.float64)
+        else:
+            convolved_raw = self._convolve(data, k, self.p.tile_size,
+                                           self.p.threads)
+        convolved = convolved_raw / float(k.sum())
 
-        return Image(convolved, bounds=target.bounds, group=self.p.group)
+        return _image_result(target, convolved, group=self.p.group)
 
 
 
@@ -400,7 +517,14 @@ class contours(ElementOperation):
     lines for a given set of contour levels.
 
     The return is an NdOverlay with a Contours layer for each given
-    level, overlaid on top of the input Image.
+    level, overlaid on top of the input Image. If filled is enabled
+    Polygons are generated for the bands between consecutive levels,
+    keyed by the lower level of each band.
+
+    The contours are computed for all levels at once using a
+    vectorized marching squares implementation, which does not
+    require matplotlib and may safely be used across multiple
+    threads.
     """
 
     output_type = Overlay
@@ -417,41 +541,58 @@ class contours(ElementOperation):
     overlaid = param.Boolean(default=True, doc="""
         Whether to overlay the contour on the supplied Element.""")
 
+    def _get_grid(self, element):
+        """
+        Returns the 2D value array of the element along with the
+        x- and y-coordinates of its samples.
+        """
+        if isinstance(element, QuadMesh):
+            xs, ys, zs = element.data
+            if element._grid:
+                xs = element.dimension_values(0, False)
+                ys = element.dimension_values(1, False)
+            elif xs.shape != zs.shape:
+                # Coordinates supplied as corners of the quadrilaterals
+                xs = (xs[:-1, :-1] + xs[1:, :-1] + xs[:-1, 1:] + xs[1:, 1:]) / 4.
+                ys = (ys[:-1, :-1] + ys[1:, :-1] + ys[:-1, 1:] + ys[1:, 1:]) / 4.
+        elif isinstance(element, Raster):
+            zs = toarray(element.data)
+            if isinstance(element, Image):
+                # Image arrays are stored with the top row first
+                zs = np.flipud(zs)
+            xs = element.dimension_values(0, False)
+            ys = element.dimension_values(1, False)
+        else:
+            raise ValueError("contours operation requires an Image, "
+                             "Raster or QuadMesh as input.")
+        return zs, xs, ys
+
+
     def _process(self, element, key=None):
-        try:
-            from matplotlib import pyplot as plt
-        except ImportError:
-            raise ImportError("contours operation requires matplotlib.")
-        figure_handle = plt.figure()
-        extent = element.range(0) + element.range(1)[::-1]
+        levels = self.p.levels
         if self.p.filled:
-            contour_fn = plt.contourf
+            if len(levels) < 2:
+                raise ValueError("Filled contours require at least "
+                                 "two levels.")
             contour_type = Polygons
         else:
-            contour_fn = plt.contour
             contour_type = Contours
-        if type(element) is Raster:
-            data = [np.flipud(element.data)]
-        elif isinstance(element, Raster):
-            data = [element.data]
-        
-        elif isinstance(element, QuadMesh):
-            data = (element.dimension_values(0, False),
-                    element.dimension_values(1, False),
-                    element.data[2])
-        contour_set = contour_fn(*data, extent=extent,
-                                 levels=self.p.levels)
+        zs, xs, ys = self._get_grid(element)
+        coords, offsets, path_levels = contour_paths(zs, xs, ys, levels,
+                                                     self.p.filled)
 
+        # Paths are sorted by level, find the paths of each level
+        nlevels = len(levels)-1 if self.p.filled else len(levels)
+        splits = np.searchsorted(path_levels, np.arange(nlevels+1))
         contours = NdOverlay(None, kdims=['Levels'])
-        for level, cset in zip(self.p.levels, contour_set.collections):
-            paths = []
-            for path in cset.get_paths():
-                paths.extend(np.split(path.vertices, np.where(path.codes==1)[0][1:]))
-            contours[level] = contour_type(paths, level=level, group=self.p.group,
-                                           label=element.label, kdims=element.kdims,
-                                           vdims=element.vdims)
-
-        plt.close(figure_handle)
+        for i, level in enumerate(levels[:nlevels]):
+            level_offsets = offsets[splits[i]:splits[i+1]+1]
+            start, end = level_offsets[0], level_offsets[-1]
+            contours[level] = contour_type.from_ragged(
+                coords[start:end], level_offsets-start, level=level,
+                group=self.p.group, label=element.label,
+                kdims=element.kdims, vdims=element.vdims)
+
         if self.p.overlaid:
             contours = element * contours
         return contours
@@ -613,6 +754,116 @@ class decimate(ElementOperation):
         return sliced
 
 
+class downsample1d(ElementOperation):
+    """
+    Downsamples Curves or other column based Elements with sorted
+    x-values, and NdOverlays of such Elements, to the samples needed
+    to preserve their visual shape within the current x_range. The
+    'lttb' algorithm selects width samples using
+    Largest-Triangle-Three-Buckets, while the 'minmax' algorithm
+    retains the minimum and maximum sample of each of width bins, e.g.
+    one bin per pixel. Elements in an NdOverlay sharing the same
+    x-values are downsampled together. By default the operation
+    returns a DynamicMap with a RangeXY stream, which resamples the
+    data whenever the plot is zoomed or panned.
+    """
+
+    algorithm = param.ObjectSelector(default='lttb', objects=['lttb', 'minmax'],
+                                     doc="""
+        The downsampling algorithm, either 'lttb' (Largest-Triangle-
+        Three-Buckets) or 'minmax' (min-max envelope per bin).""")
+
+    dynamic = param.Boolean(default=True, doc="""
+       Enables dynamic processing by default.""")
+
+    streams = param.List(default=[RangeXY], doc="""
+        List of streams that are applied if dynamic=True, allowing
+        for dynamic interaction with the plot.""")
+
+    width = param.Integer(default=800, bounds=(3, None), doc="""
+        The number of samples selected by the 'lttb' algorithm or the
+        number of bins used by the 'minmax' algorithm, usually the
+        width of the plot in pixels.""")
+
+    x_range  = param.NumericTuple(default=None, length=2, doc="""
+       The x_range as a tuple of min and max x-value. Auto-ranges
+       if set to None.""")
+
+    y_range  = param.NumericTuple(default=None, length=2, doc="""
+       The y_range as a tuple of min and max y-value, supplied by
+       RangeXY streams. Samples outside the y_range are retained so
+       lines leaving the viewport are drawn correctly.""")
+
+    def _slice(self, xs):
+        """
+        Returns a slice selecting the sorted x-values within the
+        x_range, padded by one sample on either side so lines extend
+        to the edges of the viewport.
+        """
+        if not self.p.x_range or not len(xs):
+            return slice(None)
+        xstart, xend = self.p.x_range
+        start = max(np.searchsorted(xs, xstart, 'left')-1, 0)
+        end = np.searchsorted(xs, xend, 'right')+1
+        return slice(start, end)
+
+
+    def _indices(self, xs, ys):
+        """
+        Returns the indices of the retained samples given the x-values
+        and the 1D or 2D y-values, or None if no downsampling is
+        required.
+        """
+        if self.p.algorithm == 'lttb':
+            if len(xs) <= self.p.width:
+                return None
+            return lttb_indices(xs, ys, self.p.width)
+        if len(xs) <= 2*self.p.width:
+            return None
+        bins = xs.astype('datetime64[ns]').astype(np.int64) if xs.dtype.kind == 'M' else xs
+        edges = np.linspace(bins[0], bins[-1], self.p.width+1)
+        return minmax_indices(bins, ys, edges)
+
+
+    def _process(self, element, key=None):
+        if isinstance(element, NdOverlay):
+            return self._process_overlay(element)
+        elif not isinstance(element, Dataset):
+            raise ValueError("Cannot downsample non-Dataset types.")
+        columns = [element.dimension_values(d) for d in element.dimensions()]
+        slc = self._slice(columns[0])
+        columns = [column[slc] for column in columns]
+        indices = self._indices(columns[0], columns[1])
+        if indices is not None:
+            columns = [column[indices] for column in columns]
+        return element.clone(tuple(columns))
+
+
+    def _process_overlay(self, overlay):
+        """
+        Downsamples all Elements in an NdOverlay sharing the same
+        x-values in a single vectorized pass, falling back to
+        processing each Element separately otherwise.
+        """
+        elements = list(overlay.data.values())
+        if not all(isinstance(el, Dataset) for el in elements):
+            raise ValueError("Cannot downsample non-Dataset types.")
+        xs = [el.dimension_values(0) for el in elements]
+        if not elements or any(not np.array_equal(xs[0], x) for x in xs[1:]):
+            return overlay.clone([(k, self._process(el)) for k, el in overlay.items()])
+
+        slc = self._slice(xs[0])
+        ys = np.vstack([el.dimension_values(1)[slc] for el in elements])
+        indices = self._indices(xs[0][slc], ys)
+        items = []
+        for i, (k, el) in enumerate(overlay.items()):
+            columns = [el.dimension_values(d)[slc] for d in el.dimensions()]
+            if indices is not None:
+                columns = [column[indices[i]] for column in columns]
+            items.append((k, el.clone(tuple(columns))))
+        return overlay.clone(items)
+
+
 #==================#
 # Other operations #
 #==================#
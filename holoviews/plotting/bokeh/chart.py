@@ -16,7 +16,7 @@ from ...core.options import abbreviated_exception
 from ..util import compute_sizes, get_sideplot_ranges, match_spec, map_colors
 from .element import ElementPlot, ColorbarPlot, LegendPlot, line_properties, fill_properties
 from .path import PathPlot, PolygonPlot
-from .util import get_cmap, mpl_to_bokeh, update_plot, rgb2hex, bokeh_version
+from .util import get_cmap, mpl_to_bokeh, update_plot, bokeh_version
 
 
 class PointPlot(ColorbarPlot):
@@ -92,21 +92,22 @@ class PointPlot(ColorbarPlot):
 
     def get_batched_data(self, element, ranges=None, empty=False):
         data = defaultdict(list)
-        for key, el in element.items():
-            style = self.lookup_options(el, 'style')
-            style = style.max_cycles(len(self.ordering))
-            self.set_param(**self.lookup_options(el, 'plot').options)
+        styles, lengths = [], []
+        applied = None
+        for key, el, style, opts in self._batched_options(element, True):
+            if opts != applied:
+                self.set_param(**opts)
+                applied = opts
             eldata, elmapping = self.get_data(el, ranges, empty)
             for k, eld in eldata.items():
                 data[k].append(eld)
-            if 'color' not in elmapping:
-                zorder = self.get_zorder(element, key, el)
-                val = style[zorder].get('color')
-                elmapping['color'] = 'color'
-                if isinstance(val, tuple):
-                    val = rgb2hex(val)
-                data['color'].append([val]*len(data[k][-1]))
+            styles.append(style)
+            lengths.append(len(eld))
         data = {k: np.concatenate(v) for k, v in data.items()}
+        if 'color' not in elmapping:
+            colors, fields = self._batched_style_data(styles, lengths, ['color'])
+            data.update(colors)
+            elmapping.update(fields)
         return data, elmapping
 
 
@@ -157,31 +158,21 @@ class CurvePlot(ElementPlot):
     def get_batched_data(self, overlay, ranges=None, empty=False):
         data = defaultdict(list)
         opts = ['color', 'line_alpha', 'line_color']
-        for key, el in overlay.data.items():
+        styles = []
+        for key, el, style, _ in self._batched_options(overlay):
             eldata, elmapping = self.get_data(el, ranges, empty)
             for k, eld in eldata.items():
                 data[k].append(eld)
-
-            # Add options
-            style = self.lookup_options(el, 'style')
-            style = style.max_cycles(len(self.ordering))
-            zorder = self.get_zorder(overlay, key, el)
-            style = style[zorder]
-            for opt in opts:
-                if opt not in style:
-                    continue
-                val = style[opt]
-                if opt == 'color' and isinstance(val, tuple):
-                    val = rgb2hex(val)
-                data[opt].append([val])
+            styles.append(style)
 
             for d, k in zip(overlay.kdims, key):
                 sanitized = dimension_sanitizer(d.name)
                 data[sanitized].append([k])
-        data = {opt: vals for opt, vals in data.items()
-                if not any(v is None for v in vals)}
-        return data, dict(xs=elmapping['x'], ys=elmapping['y'],
-                          **{o: o for o in opts if o in data})
+
+        # Each Curve is drawn as a single line
+        style_data, fields = self._batched_style_data(styles, [1]*len(styles), opts)
+        data.update(style_data)
+        return data, dict(xs=elmapping['x'], ys=elmapping['y'], **fields)
 
 
 class AreaPlot(PolygonPlot):
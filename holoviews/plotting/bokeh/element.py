@@ -15,6 +15,10 @@ try:
     from bokeh.models.mappers import LogColorMapper
 except ImportError:
     LogColorMapper, ColorBar = None, None
+try:
+    from bokeh.models.mappers import CategoricalColorMapper
+except ImportError:
+    CategoricalColorMapper = None
 from bokeh.models import LogTicker, BasicTicker
 from bokeh.plotting.helpers import _known_tools as known_tools
 
@@ -33,7 +37,7 @@ from ...streams import Stream, RangeXY, RangeX, RangeY
 from ..plot import GenericElementPlot, GenericOverlayPlot
 from ..util import dynamic_update, get_sources
 from .plot import BokehPlot
-from .util import (mpl_to_bokeh, convert_datetime, update_plot,
+from .util import (mpl_to_bokeh, convert_datetime, update_plot, rgb2hex,
                    bokeh_version, mplcmap_to_palette, py2js_tickformatter)
 
 if bokeh_version >= '0.12':
@@ -255,6 +259,69 @@ class ElementPlot(BokehPlot, GenericElementPlot):
             data[dim] = [v for _ in range(len(data.values()[0]))]
 
 
+    def _batched_options(self, overlay, plot_options=False):
+        """
+        Resolves the style of each Element in a batched NdOverlay,
+        looking up the options only once per distinct type, group,
+        label and id. Returns a list of (key, element, style, options)
+        tuples, where style is the style at the z-order of the Element
+        and options are its plot options if plot_options is enabled.
+        """
+        items = list(overlay.data.items())
+        zorders = [self.get_zorder(overlay, key, el) for key, el in items]
+        ncycles = len(self.ordering)
+        cache, batched = {}, []
+        for (key, el), zorder in zip(items, zorders):
+            spec = (type(el), el.group, el.label, el.id)
+            if spec not in cache:
+                style = self.lookup_options(el, 'style').max_cycles(ncycles)
+                opts = self.lookup_options(el, 'plot').options if plot_options else {}
+                cache[spec] = (style, opts)
+            style, opts = cache[spec]
+            batched.append((key, el, style[zorder], opts))
+        return batched
+
+
+    def _batched_style_data(self, styles, lengths, opts):
+        """
+        Expands the supplied style options of each batched Element
+        into data columns by repeating the value of each Element by
+        the number of glyphs it contributes. Colors are encoded as
+        categorical codes, which are mapped to the distinct colors
+        with a CategoricalColorMapper. Returns the data columns and
+        the corresponding field specifications, skipping options
+        that are not defined on all Elements.
+        """
+        data, fields = {}, {}
+        lengths = np.asarray(lengths, dtype=int)
+        for opt in opts:
+            values = [style.get(opt) for style in styles]
+            if any(v is None for v in values):
+                continue
+            if 'color' not in opt:
+                data[opt] = np.repeat(values, lengths)
+                fields[opt] = opt
+                continue
+            palette, codes = [], []
+            for v in values:
+                v = rgb2hex(v) if isinstance(v, tuple) else v
+                if v not in palette:
+                    palette.append(v)
+                codes.append(palette.index(v))
+            codes = np.repeat(np.array(codes, dtype=int), lengths)
+            if CategoricalColorMapper is None:
+                data[opt] = np.array(palette, dtype=object)[codes]
+                fields[opt] = opt
+                continue
+            factors = list(range(len(palette)))
+            if bokeh_version >= '0.12.7':
+                codes, factors = codes.astype(str), [str(f) for f in factors]
+            mapper = CategoricalColorMapper(factors=factors, palette=palette)
+            data[opt] = codes
+            fields[opt] = {'field': opt, 'transform': mapper}
+        return data, fields
+
+
     def _axes_props(self, plots, subplots, element, ranges):
         # Get the bottom layer and range element
         el = element.traverse(lambda x: x, [Element])
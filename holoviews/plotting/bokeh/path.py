@@ -8,7 +8,7 @@ from bokeh.models import HoverTool
 from ...core import util
 from ..util import map_colors
 from .element import ElementPlot, ColorbarPlot, line_properties, fill_properties
-from .util import get_cmap, rgb2hex
+from .util import get_cmap
 
 
 class PathPlot(ElementPlot):
@@ -26,28 +26,36 @@ class PathPlot(ElementPlot):
         else:
             return list(self.overlay_dims.keys())
 
+    def _split_paths(self, element):
+        """
+        Splits the contiguous coordinates of the paths into lists
+        of x- and y-arrays, one per path.
+        """
+        coords, offsets = element.ragged()
+        if len(offsets) < 2:
+            return [], []
+        splits = offsets[1:-1]
+        return np.split(coords[:, 0], splits), np.split(coords[:, 1], splits)
+
     def get_data(self, element, ranges=None, empty=False):
-        xidx, yidx = (1, 0) if self.invert_axes else (0, 1)
-        xs = [] if empty else [path[:, xidx] for path in element.data]
-        ys = [] if empty else [path[:, yidx] for path in element.data]
-        return dict(xs=xs, ys=ys), dict(self._mapping)
+        xs, ys = ([], []) if empty else self._split_paths(element)
+        data = dict(xs=ys, ys=xs) if self.invert_axes else dict(xs=xs, ys=ys)
+        return data, dict(self._mapping)
 
     def get_batched_data(self, element, ranges=None, empty=False):
         data = defaultdict(list)
-        for key, el in element.data.items():
-            style = self.lookup_options(el, 'style')
-            style = style.max_cycles(len(self.ordering))
+        styles, lengths = [], []
+        for key, el, style, _ in self._batched_options(element):
             self.overlay_dims = dict(zip(element.kdims, key))
             eldata, elmapping = self.get_data(el, ranges, empty)
             for k, eld in eldata.items():
                 data[k].extend(eld)
-            zorder = self.get_zorder(element, key, el)
-            val = style[zorder].get('color')
-            if val:
-                elmapping['line_color'] = 'color'
-                if isinstance(val, tuple):
-                    val = rgb2hex(val)
-                data['color'] += [val for _ in range(len(list(eldata.values())[0]))]
+            styles.append(style)
+            lengths.append(len(eldata['xs']))
+        colors, fields = self._batched_style_data(styles, lengths, ['color'])
+        if 'color' in fields:
+            data.update(colors)
+            elmapping['line_color'] = fields['color']
         return data, elmapping
 
 
@@ -65,8 +73,7 @@ class PolygonPlot(ColorbarPlot, PathPlot):
         return dims
 
     def get_data(self, element, ranges=None, empty=False):
-        xs = [] if empty else [path[:, 0] for path in element.data]
-        ys = [] if empty else [path[:, 1] for path in element.data]
+        xs, ys = ([], []) if empty else self._split_paths(element)
         data = dict(xs=ys, ys=xs) if self.invert_axes else dict(xs=xs, ys=ys)
 
         style = self.style[self.cyclic_index]
@@ -91,19 +98,16 @@ class PolygonPlot(ColorbarPlot, PathPlot):
 
     def get_batched_data(self, element, ranges=None, empty=False):
         data = defaultdict(list)
-        for key, el in element.data.items():
-            style = self.lookup_options(el, 'style')
-            style = style.max_cycles(len(self.ordering))
+        styles, lengths = [], []
+        for key, el, style, _ in self._batched_options(element):
             self.overlay_dims = dict(zip(element.kdims, key))
             eldata, elmapping = self.get_data(el, ranges, empty)
             for k, eld in eldata.items():
                 data[k].extend(eld)
-            if 'color' not in elmapping:
-                zorder = self.get_zorder(element, key, el)
-                val = style[zorder].get('color')
-                elmapping['color'] = 'color'
-                if isinstance(val, tuple):
-                    val = rgb2hex(val)
-                data['color'] += [val for _ in range(len(eldata['xs']))]
-
+            styles.append(style)
+            lengths.append(len(eldata['xs']))
+        if 'color' not in elmapping:
+            colors, fields = self._batched_style_data(styles, lengths, ['color'])
+            data.update(colors)
+            elmapping.update(fields)
         return data, elmapping
@@ -44,17 +44,18 @@ class BokehRenderer(Renderer):
         backend. The output is not a file format but a suitable,
         in-memory byte stream together with any suitable metadata.
         """
-        plot, fmt =  self._validate(obj, fmt)
-        info = {'file-ext': fmt, 'mime_type': MIME_TYPES[fmt]}
+        with self._profiling():
+            plot, fmt =  self._validate(obj, fmt)
+            info = {'file-ext': fmt, 'mime_type': MIME_TYPES[fmt]}
 
-        if isinstance(plot, tuple(self.widgets.values())):
-            return plot(), info
-        elif fmt == 'html':
-            html = self.figure_data(plot)
-            html = "<div style='display: table; margin: 0 auto;'>%s</div>" % html
-            return self._apply_post_render_hooks(html, obj, fmt), info
-        elif fmt == 'json':
-            return self.diff(plot), info
+            if isinstance(plot, tuple(self.widgets.values())):
+                return plot(), info
+            elif fmt == 'html':
+                html = self.figure_data(plot)
+                html = "<div style='display: table; margin: 0 auto;'>%s</div>" % html
+                return self._apply_post_render_hooks(html, obj, fmt), info
+            elif fmt == 'json':
+                return self.diff(plot), info
 
 
     def figure_data(self, plot, fmt='html', **kwargs):
@@ -75,6 +76,21 @@ class BokehRenderer(Renderer):
         """
         plotobjects = [h for handles in plot.traverse(lambda x: x.current_handles)
                        for h in handles]
+        return self._patch(plot, plotobjects, serialize)
+
+
+    def full_diff(self, plot, serialize=True):
+        """
+        Returns a json diff restoring the state of all models in the
+        document, unlike diff which only contains the models changed
+        by the last update.
+        """
+        plotobjects = [m for root in plot.document.roots
+                       for m in root.references()]
+        return self._patch(plot, plotobjects, serialize)
+
+
+    def _patch(self, plot, plotobjects, serialize):
         patch = compute_static_patch(plot.document, plotobjects)
         processed = self._apply_post_render_hooks(patch, plot, 'json')
         return serialize_json(processed) if serialize else processed
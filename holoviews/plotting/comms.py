@@ -2,14 +2,19 @@ import json
 import uuid
 import sys
 import os
+import threading
 import traceback
+from collections import deque
 try:
     from StringIO import StringIO
 except:
     from io import StringIO
 
-from ipykernel.comm import Comm as IPyComm
-from IPython import get_ipython
+try:
+    from ipykernel.comm import Comm as IPyComm
+    from IPython import get_ipython
+except ImportError:
+    IPyComm, get_ipython = None, None
 
 
 class StandardOutput(list):
@@ -124,7 +129,14 @@ class Comm(object):
         # the correct comms handle is unblocked
         if comm_id:
             reply['comm_id'] = comm_id
-        self.send(json.dumps(reply))
+        self._send_reply(json.dumps(reply))
+
+
+    def _send_reply(self, data):
+        """
+        Sends the Ready or Error reply acknowledging a message.
+        """
+        self.send(data)
 
 
 class JupyterComm(Comm):
@@ -223,3 +235,129 @@ class JupyterCommJS(JupyterComm):
         """
         self.comm.send(data)
 
+
+
+class WebSocketComm(Comm):
+    """
+    WebSocketComm provides a comms channel over a WebSocket connection,
+    allowing plots to be updated outside of a Jupyter kernel, e.g. by
+    the PlotServer in holoviews.plotting.server. Once the frontend
+    connects, a connection object is attached by calling init. Its
+    write method accepts a message and a callback, which must be
+    called once the message has been flushed to the socket.
+
+    Messages are written one at a time and queued in the meantime.
+    Diffs may only contain the parts of the plot changed by a single
+    update, so pending messages cannot simply be dropped. Instead,
+    once more than max_queue messages are waiting, they are replaced
+    by a single message restoring the full state of the plot, so slow
+    clients cannot cause unbounded memory growth.
+    Replies acknowledging messages from the client are never dropped
+    and are written ahead of pending plot updates, since the frontend
+    waits for them before sending further events.
+    """
+
+    template = """
+    <script>
+      HoloViewsServer.connect("{comm_id}", function(msg) {{
+        {msg_handler}
+      }});
+    </script>
+
+    <div id="fig_{comm_id}">
+      {init_frame}
+    </div>
+    """
+
+    max_queue = 16
+
+    def __init__(self, plot, id=None, on_msg=None):
+        super(WebSocketComm, self).__init__(plot, id, on_msg)
+        self._queue = deque()
+        self._replies = deque()
+        self._lock = threading.Lock()
+        self._writing = False
+
+
+    def init(self, connection=None):
+        """
+        Attaches the connection and writes any queued messages.
+        """
+        with self._lock:
+            self._comm = connection
+            self._writing = False
+        self._flush()
+
+
+    def close(self):
+        """
+        Detaches the connection and discards all pending messages.
+        """
+        with self._lock:
+            self._comm = None
+            self._queue.clear()
+            self._replies.clear()
+
+
+    @classmethod
+    def decode(cls, msg):
+        """
+        Decodes JSON messages received over the WebSocket.
+        """
+        return json.loads(msg) if isinstance(msg, (str, bytes, type(u''))) else msg
+
+
+    def send(self, data):
+        """
+        Queues the data and writes it as soon as the connection
+        is ready.
+        """
+        with self._lock:
+            self._queue.append(data)
+            overflow = len(self._queue) > self.max_queue
+        if overflow:
+            # Render the full state outside the lock since the
+            # connection may be flushing the queue meanwhile
+            state = self._full_state(data)
+            with self._lock:
+                self._queue.clear()
+                self._queue.append(state)
+        self._flush()
+
+
+    def _full_state(self, data):
+        """
+        Returns a message restoring the full state of the plot,
+        replacing all pending messages. Without a plot the latest
+        message is assumed to hold the full state.
+        """
+        if self._plot is None:
+            return data
+        return self._plot.renderer.full_diff(self._plot)
+
+
+    def _send_reply(self, data):
+        with self._lock:
+            self._replies.append(data)
+        self._flush()
+
+
+    def _flush(self):
+        with self._lock:
+            if self._comm is None or self._writing:
+                return
+            elif self._replies:
+                data = self._replies.popleft()
+            elif self._queue:
+                data = self._queue.popleft()
+            else:
+                return
+            self._writing = True
+            connection = self._comm
+        connection.write(data, self._written)
+
+
+    def _written(self):
+        with self._lock:
+            self._writing = False
+        self._flush()
@@ -168,6 +168,26 @@ class AreaPlot(ChartPlot):
         stack = fill_fn(*plot_data, **plot_kwargs)
         return {'artist': stack}
 
+    def update_handles(self, key, axis, element, ranges, style):
+        """
+        Updates the vertices of the filled area in place if the data
+        is finite, otherwise the artist is redrawn.
+        """
+        plot_data, plot_style, axis_kwargs = self.get_data(element, ranges, dict(style))
+        xs, y1 = plot_data[:2]
+        y2 = plot_data[2] if len(plot_data) > 2 else np.zeros(len(xs))
+        artist = self.handles['artist']
+        if (len(artist.get_paths()) != 1 or
+            any(arr.dtype.kind not in 'iuf' or not np.isfinite(arr).all()
+                for arr in (xs, y1, y2))):
+            return super(AreaPlot, self).update_handles(key, axis, element, ranges, style)
+        verts = np.concatenate([np.column_stack([xs, y1]),
+                                np.column_stack([xs[::-1], y2[::-1]])])
+        if self.invert_axes:
+            verts = verts[:, ::-1]
+        artist.set_verts([verts])
+        return axis_kwargs
+
     def get_extents(self, element, ranges):
         vdims = element.vdims
         vdim = vdims[0].name
@@ -927,30 +947,35 @@ class SpikesPlot(PathPlot, ColorbarPlot):
         ndims = len(dimensions)
 
         pos = self.position
+        xs = element.dimension_values(0)
         if ndims > 1:
-            data = [[(x, pos), (x, pos+y)] for x, y in element.array()]
+            heights = element.dimension_values(1)
         else:
-            height = self.spike_length
-            data = [[(x[0], pos), (x[0], pos+height)] for x in element.array()]
+            heights = np.full(len(xs), self.spike_length)
 
+        # Construct segments as an array of shape (N, 2, 2)
+        data = np.empty((len(xs), 2, 2))
+        data[:, :, 0] = xs[:, np.newaxis]
+        data[:, 0, 1] = pos
+        data[:, 1, 1] = pos+heights
         if self.invert_axes:
-            data = [(line[0][::-1], line[1][::-1]) for line in data]
+            data = data[:, :, ::-1]
 
         cdim = element.get_dimension(self.color_index)
         if cdim:
             style['array'] = element.dimension_values(cdim)
             self._norm_kwargs(element, ranges, style, cdim)
             style['clim'] = style.pop('vmin'), style.pop('vmax')
-        return (np.array(data),), style, {}
+        return (data,), style, {}
 
 
     def update_handles(self, key, axis, element, ranges, style):
         artist = self.handles['artist']
         (data,), kwargs, axis_kwargs = self.get_data(element, ranges, style)
-        artist.set_paths(data)
+        artist.set_segments(data)
         artist.set_visible(style.get('visible', True))
         if 'array' in kwargs:
-            artist.set_clim((kwargs['vmin'], kwargs['vmax']))
+            artist.set_clim(kwargs['clim'])
             artist.set_array(kwargs['array'])
             if 'norm' in kwargs:
                 artist.norm = kwargs['norm']
@@ -10,7 +10,7 @@ from matplotlib.dates import date2num
 
 from ...core import util
 from ...core import (OrderedDict, NdOverlay, DynamicMap,
-                     CompositeOverlay, Element3D, Element)
+                     CompositeOverlay, Element3D, Element, Dimension)
 from ...core.options import abbreviated_exception
 from ..plot import GenericElementPlot, GenericOverlayPlot
 from ..util import dynamic_update
@@ -167,12 +167,20 @@ class ElementPlot(GenericElementPlot, MPLPlot):
 
             # Apply axis options if axes are enabled
             if element and not any(not sp._has_axes for sp in [self] + subplots):
-                # Set axis labels
-                if dimensions:
-                    self._set_labels(axis, dimensions, xlabel, ylabel, zlabel)
+                # Axis settings are only reapplied if they have changed
+                axis_state = self._get_axis_state(element, dimensions, ranges,
+                                                  xlabel, ylabel, zlabel,
+                                                  xticks, yticks, zticks)
+                update_axis = self._axis_state_changed(axis_state)
+                self._axis_state = axis_state
 
-                # Set axes limits
-                self._set_axis_limits(axis, element, subplots, ranges)
+                if update_axis:
+                    # Set axis labels
+                    if dimensions:
+                        self._set_labels(axis, dimensions, xlabel, ylabel, zlabel)
+
+                    # Set axes limits
+                    self._set_axis_limits(axis, element, subplots, ranges)
 
                 if not subplots:
                     legend = axis.get_legend()
@@ -182,19 +190,20 @@ class ElementPlot(GenericElementPlot, MPLPlot):
                     axis.xaxis.grid(self.show_grid)
                     axis.yaxis.grid(self.show_grid)
 
-                # Apply log axes
-                if self.logx:
-                    axis.set_xscale('log')
-                if self.logy:
-                    axis.set_yscale('log')
+                if update_axis:
+                    # Apply log axes
+                    if self.logx:
+                        axis.set_xscale('log')
+                    if self.logy:
+                        axis.set_yscale('log')
 
-                if not self.projection == '3d':
-                    self._set_axis_position(axis, 'x', self.xaxis)
-                    self._set_axis_position(axis, 'y', self.yaxis)
+                    if not self.projection == '3d':
+                        self._set_axis_position(axis, 'x', self.xaxis)
+                        self._set_axis_position(axis, 'y', self.yaxis)
 
-                # Apply ticks
-                if self.apply_ticks:
-                    self._finalize_ticks(axis, dimensions, xticks, yticks, zticks)
+                    # Apply ticks
+                    if self.apply_ticks:
+                        self._finalize_ticks(axis, dimensions, xticks, yticks, zticks)
 
             # Apply aspects
             if not (self.logx or self.logy):
@@ -212,6 +221,39 @@ class ElementPlot(GenericElementPlot, MPLPlot):
         return super(ElementPlot, self)._finalize_axis(key)
 
 
+    def _get_axis_state(self, element, dimensions, ranges, *axis_kwargs):
+        """
+        Returns a summary of the settings applied to the axes by
+        _finalize_axis, allowing them to be skipped when updating
+        to a frame which leaves the ranges and labels unchanged.
+        """
+        extents = self.get_extents(element, dict(ranges) if ranges else ranges)
+        if not extents or any(e is None for e in extents):
+            return None
+        # Plots such as BarPlot supply nested lists of dimensions
+        flat = []
+        for d in dimensions or []:
+            flat.extend(d if isinstance(d, list) else [d])
+        dims = tuple((d.name, hash(d)) if isinstance(d, Dimension) else d
+                     for d in flat)
+        params = (self.logx, self.logy, self.xaxis, self.yaxis,
+                  self.xticks, self.yticks, self.zticks, self.xrotation,
+                  self.yrotation, self.zrotation, self.invert_axes,
+                  self.invert_xaxis, self.invert_yaxis, self.show_legend,
+                  self.show_grid, self.labelled, self.fontsize)
+        return (dims, extents, axis_kwargs, params)
+
+
+    def _axis_state_changed(self, axis_state):
+        previous = getattr(self, '_axis_state', None)
+        if axis_state is None or previous is None:
+            return True
+        try:
+            return bool(axis_state != previous)
+        except Exception:
+            return True
+
+
     def _finalize_ticks(self, axis, dimensions, xticks, yticks, zticks):
         """
         Finalizes the ticks on the axes based on the supplied ticks
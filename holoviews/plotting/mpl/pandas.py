@@ -142,6 +142,7 @@ class DFrameViewPlot(ElementPlot):
         if not self.plot_type in ['hist', 'scatter_matrix']:
             if self.zorder == 0 and axis:
                 axis.cla()
+                self._axis_state = None
         self._update_plot(axis, view, style)
         return self.get_axis_kwargs(view)
 
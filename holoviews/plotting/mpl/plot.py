@@ -7,6 +7,7 @@ import matplotlib as mpl
 from mpl_toolkits.mplot3d import Axes3D  # noqa (For 3D plots)
 from matplotlib import pyplot as plt
 from matplotlib import gridspec, animation
+from matplotlib.artist import Artist
 import param
 from ...core import (OrderedDict, HoloMap, AdjointLayout, NdLayout,
                      GridSpace, Element, CompositeOverlay, Empty,
@@ -194,19 +195,39 @@ class MPLPlot(DimensionedPlot):
     def state(self):
         return self.handles['fig']
 
-    def anim(self, start=0, stop=None, fps=30):
+    def anim(self, start=0, stop=None, fps=30, blit=False):
         """
         Method to return a matplotlib animation. The start and stop
-        frames may be specified as well as the fps.
+        frames may be specified as well as the fps. When blit is
+        enabled only the artists are redrawn on each frame, which is
+        considerably faster but requires that the axes, ticks and
+        titles do not change between frames.
         """
         figure = self.initialize_plot()
-        anim = animation.FuncAnimation(figure, self.update_frame,
-                                       frames=self.keys,
-                                       interval = 1000.0/fps)
+        def update(key):
+            self.update_frame(key)
+            return self._frame_artists()
+        anim = animation.FuncAnimation(figure, update,
+                                       frames=self.keys[start:stop],
+                                       interval = 1000.0/fps, blit=blit)
         # Close the figure handle
         if self._close_figures: plt.close(figure)
         return anim
 
+    def _frame_artists(self):
+        """
+        Returns the artists drawn by this plot and its subplots,
+        excluding the figure, axes and titles.
+        """
+        artists = []
+        for handles in self.traverse(lambda x: x.handles):
+            for name, handle in handles.items():
+                if name in ('fig', 'axis', 'title'):
+                    continue
+                elif isinstance(handle, Artist):
+                    artists.append(handle)
+        return artists
+
     def update(self, key):
         rc_params = self.fig_rcparams
         if self.fig_latex:
@@ -229,7 +229,7 @@ class QuadMeshPlot(ColorbarPlot):
         cmesh = self.handles['artist']
         locs = np.concatenate(element.data[:2])
 
-        if (locs != self.handles['locs']).any():
+        if not np.array_equal(locs, self.handles['locs']):
             return super(QuadMeshPlot, self).update_handles(key, axis, element,
                                                             ranges, style)
         else:
@@ -37,6 +37,7 @@ class SeabornPlot(ElementPlot):
     def teardown_handles(self):
         if self.zorder == 0:
             self.handles['axis'].cla()
+            self._axis_state = None
 
 
 class RegressionPlot(SeabornPlot):
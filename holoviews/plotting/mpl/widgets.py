@@ -44,6 +44,13 @@ class MPLWidget(NdWidget):
         return self.encode_frames(frames)
 
 
+    def _encode_frame(self, frame):
+        if self.renderer.mode == 'mpld3':
+            import mpld3
+            return json.dumps(frame, cls=mpld3._display.NumpyEncoder)
+        return json.dumps(frame)
+
+
     def encode_frames(self, frames):
         if self.export_json:
             self.save_json(frames)
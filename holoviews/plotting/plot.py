@@ -4,7 +4,7 @@ plotting package or backend. Every plotting classes must be a subclass
 of this Plot baseclass.
 """
 
-from itertools import groupby, product
+from itertools import groupby, product, islice
 from collections import Counter, defaultdict
 
 import numpy as np
@@ -21,7 +21,8 @@ from ..core.spaces import HoloMap, DynamicMap
 from ..core.util import stream_parameters
 from ..element import Table
 from .util import (get_dynamic_mode, initialize_sampled, dim_axis_label,
-                   attach_streams, traverse_setter, get_nested_streams)
+                   attach_streams, traverse_setter, get_nested_streams,
+                   RangeCache)
 
 
 class Plot(param.Parameterized):
@@ -160,6 +161,9 @@ class DimensionedPlot(Plot):
     _fontsize_keys = ['xlabel','ylabel', 'labels', 'ticks',
                       'title', 'legend', 'legend_title']
 
+    # Cache of element ranges shared by all plots
+    range_cache = RangeCache()
+
     show_title = param.Boolean(default=True, doc="""
         Whether to display the plot title.""")
 
@@ -394,16 +398,16 @@ class DimensionedPlot(Plot):
         return norm_opts
 
 
-    @staticmethod
-    def _compute_group_range(group, elements, ranges):
+    @classmethod
+    def _compute_group_range(cls, group, elements, ranges):
         # Iterate over all elements in a normalization group
         # and accumulate their ranges into the supplied dictionary.
-        elements = [el for el in elements if el is not None]
+        # Element ranges are looked up in the shared range cache.
+        elements = [el for el in elements if el is not None
+                    and not isinstance(el, (Empty, Table))]
         group_ranges = OrderedDict()
-        for el in elements:
-            if isinstance(el, (Empty, Table)): continue
-            for dim in el.dimensions(label=True):
-                dim_range = el.range(dim)
+        for el_ranges in cls.range_cache.compute(elements):
+            for dim, dim_range in el_ranges.items():
                 if dim not in group_ranges:
                     group_ranges[dim] = []
                 group_ranges[dim].append(dim_range)
@@ -526,6 +530,78 @@ class DimensionedPlot(Plot):
         return len(self.keys)
 
 
+    def _add_key(self, key, hmap_key=None):
+        """
+        Appends a key to the plot keys if it is not already present,
+        maintaining a set of the keys to avoid scanning the list. If
+        the key of the frame in the DynamicMap is supplied it is also
+        appended to the cached index of its keys used by _nth_key.
+        """
+        keyset, count = self.__dict__.get('_keyset', (None, None))
+        try:
+            if keyset is None or count != len(self.keys):
+                keyset = set(self.keys)
+            if key not in keyset:
+                keyset.add(key)
+                self.keys.append(key)
+            self.__dict__['_keyset'] = (keyset, len(self.keys))
+        except TypeError:
+            if key not in self.keys:
+                self.keys.append(key)
+        if hmap_key is None or not isinstance(self.hmap, DynamicMap):
+            return
+        keys = self.__dict__.get('_nth_keys', {}).get(id(self.hmap))
+        data = self.hmap.data
+        # Only append the key if it is the single frame added to the
+        # DynamicMap since the index was last updated
+        if (keys is not None and len(keys) == len(data)-1 and
+            next(reversed(data)) == hmap_key):
+            keys.append(hmap_key)
+
+
+    def _nth_key(self, obj, index):
+        """
+        Returns the key of the nth item in the supplied map, clipping
+        the index to the number of items. The keys are cached, and
+        for DynamicMaps the cached keys are extended as new frames are
+        added rather than rebuilt. Once a DynamicMap cache is full the
+        oldest frames are evicted, which is detected by comparing the
+        first and last keys, in which case the keys are rebuilt.
+        """
+        cache = self.__dict__.setdefault('_nth_keys', {})
+        keys = cache.get(id(obj))
+        data = obj.data
+        if (keys is None or len(keys) > len(data) or
+            (keys and keys[0] != next(iter(data)))):
+            keys = cache[id(obj)] = list(data.keys())
+        elif len(keys) < len(data):
+            if not isinstance(obj, DynamicMap):
+                keys = cache[id(obj)] = list(data.keys())
+            else:
+                keys.extend(islice(data.keys(), len(keys), None))
+        elif keys and keys[-1] != next(reversed(data)):
+            keys = cache[id(obj)] = list(data.keys())
+        return keys[min([index, len(keys)-1])]
+
+
+    @classmethod
+    def _lookup_frame(cls, obj, selection):
+        """
+        Looks up the item of a HoloMap matching a selection across
+        all its key dimensions directly in the data, returning None
+        if the item cannot be resolved without calling select.
+        """
+        kdims = [d.name for d in obj.kdims]
+        if (isinstance(obj, DynamicMap) or len(selection) != len(kdims)
+            or any(d not in selection for d in kdims)):
+            return None
+        try:
+            item = obj.data.get(tuple(selection[d] for d in kdims))
+        except TypeError:
+            return None
+        return None if isinstance(item, HoloMap) else item
+
+
 
 class GenericElementPlot(DimensionedPlot):
     """
@@ -627,16 +703,16 @@ class GenericElementPlot(DimensionedPlot):
             key, frame = util.get_dynamic_item(self.hmap, self.dimensions, key)
             traverse_setter(self, '_force', False)
             if not isinstance(key, tuple): key = (key,)
+            hmap_key = key
             key_map = dict(zip([d.name for d in self.hmap.kdims], key))
             key = tuple(key_map.get(d.name, None) for d in self.dimensions)
-            if not key in self.keys:
-                self.keys.append(key)
+            self._add_key(key, hmap_key)
             self.current_frame = frame
             self.current_key = key
             return frame
 
         if isinstance(key, int):
-            key = list(self.hmap.data.keys())[min([key, len(self.hmap)-1])]
+            key = self._nth_key(self.hmap, key)
 
         self.current_key = key
 
@@ -654,10 +730,12 @@ class GenericElementPlot(DimensionedPlot):
                           for d in kdims}
         else:
             select = dict(zip(self.hmap.dimensions('key', label=True), key))
-        try:
-            selection = self.hmap.select((HoloMap, DynamicMap), **select)
-        except KeyError:
-            selection = None
+        selection = self._lookup_frame(self.hmap, select)
+        if selection is None:
+            try:
+                selection = self.hmap.select((HoloMap, DynamicMap), **select)
+            except KeyError:
+                selection = None
         selection = selection.last if isinstance(selection, HoloMap) else selection
         self.current_frame = selection
 
@@ -953,16 +1031,17 @@ class GenericCompositePlot(DimensionedPlot):
         Creates a clone of the Layout with the nth-frame for each
         Element.
         """
-        layout_frame = self.layout.clone(shared_data=False)
         keyisint = isinstance(key, int)
         if not isinstance(key, tuple): key = (key,)
-        nthkey_fn = lambda x: zip(tuple(x.name for x in x.kdims),
-                                  list(x.data.keys())[min([key[0], len(x)-1])])
+        nthkey_fn = lambda x: list(zip(tuple(x.name for x in x.kdims),
+                                       self._nth_key(x, key[0])))
         if key == self.current_key and not self._force:
             return self.current_frame
         else:
             self.current_key = key
 
+        layout_frame = self.layout.clone(shared_data=False)
+
         for path, item in self.layout.items():
             if self.dynamic == 'open':
                 if keyisint:
@@ -971,20 +1050,24 @@ class GenericCompositePlot(DimensionedPlot):
                         item.traverse(lambda x: next(x), (DynamicMap,))
                     dim_keys = item.traverse(nthkey_fn, (DynamicMap,))[0]
                 else:
-                    dim_keys = zip([d.name for d in self.dimensions
-                                    if d in item.dimensions('key')], key)
+                    dim_keys = list(zip([d.name for d in self.dimensions
+                                         if d in item.dimensions('key')], key))
                 self.current_key = tuple(k[1] for k in dim_keys)
             elif item.traverse(lambda x: x, [DynamicMap]):
                 key, frame = util.get_dynamic_item(item, self.dimensions, key)
                 layout_frame[path] = frame
                 continue
             elif self.uniform:
-                dim_keys = zip([d.name for d in self.dimensions
-                                if d in item.dimensions('key')], key)
+                dim_keys = list(zip([d.name for d in self.dimensions
+                                     if d in item.dimensions('key')], key))
             else:
                 dim_keys = item.traverse(nthkey_fn, (HoloMap,))[0]
             if dim_keys:
-                obj = item.select((HoloMap,), **dict(dim_keys))
+                obj = None
+                if isinstance(item, HoloMap):
+                    obj = self._lookup_frame(item, dict(dim_keys))
+                if obj is None:
+                    obj = item.select((HoloMap,), **dict(dim_keys))
                 if isinstance(obj, HoloMap) and len(obj) == 0:
                     continue
                 else:
@@ -54,15 +54,16 @@ class PlotlyRenderer(Renderer):
     _loaded = False
 
     def __call__(self, obj, fmt='html', divuuid=None):
-        plot, fmt =  self._validate(obj, fmt)
-        mime_types = {'file-ext':fmt, 'mime_type': MIME_TYPES[fmt]}
-
-        if isinstance(plot, tuple(self.widgets.values())):
-            return plot(), mime_types
-        elif fmt == 'html':
-            return self.figure_data(plot, divuuid=divuuid), mime_types
-        elif fmt == 'json':
-            return self.diff(plot), mime_types
+        with self._profiling():
+            plot, fmt =  self._validate(obj, fmt)
+            mime_types = {'file-ext':fmt, 'mime_type': MIME_TYPES[fmt]}
+
+            if isinstance(plot, tuple(self.widgets.values())):
+                return plot(), mime_types
+            elif fmt == 'html':
+                return self.figure_data(plot, divuuid=divuuid), mime_types
+            elif fmt == 'json':
+                return self.diff(plot), mime_types
 
 
     def diff(self, plot, serialize=True):
@@ -0,0 +1,229 @@
+"""
+The profiler module provides a Profiler which instruments the
+plotting pipeline, collecting hierarchical timings of plot
+instantiation, range computation, option lookup, data processing,
+glyph and artist construction and serialization. Results may be
+aggregated per plot class and frame into a Table or exported as a
+Chrome trace, which may be loaded in chrome://tracing.
+"""
+
+import os
+import json
+import time
+import threading
+
+import param
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from param.parameterized import bothmethod
+
+from ..core import OrderedDict
+from ..element import Table
+from .plot import Plot
+
+timer = getattr(time, 'perf_counter', time.time)
+
+
+class Profiler(param.Parameterized):
+    """
+    Profiler is a context manager which records the time spent in
+    the methods of all plotting classes and renderers while it is
+    active:
+
+        with Profiler() as profiler:
+            renderer(obj)
+        profiler.table()
+
+    The methods are instrumented by temporarily wrapping them on
+    entering the context and restored on exit, so the plotting code
+    does not incur any cost while no Profiler is active. Each call
+    is recorded with the name of the method, the class of the plot
+    or renderer, the current frame key, the total and self time
+    excluding nested instrumented calls and optionally the number
+    of bytes allocated.
+    """
+
+    memory = param.Boolean(default=False, doc="""
+        Whether to record the memory allocated by each call using
+        tracemalloc, which slows down the profiled code considerably.""")
+
+    methods = param.List(default=[
+        '__init__', 'update', 'initialize_plot', 'update_frame',
+        'refresh', 'compute_ranges', '_get_norm_opts',
+        '_compute_group_range', 'lookup_options', '_get_frame',
+        '_create_subplots', '_apply_compositor', 'get_data',
+        'get_extents', '_init_glyphs', '_init_glyph', '_update_glyphs',
+        '_update_glyph', 'init_artists', 'update_handles',
+        '_finalize_axis', 'get_plot', 'figure_data', '_figure_data',
+        'diff', 'get_widget'], doc="""
+        The names of the plot and renderer methods to instrument.""")
+
+    _active = None
+
+    def __init__(self, **params):
+        super(Profiler, self).__init__(**params)
+        self.records = []
+        self._patched = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._start = None
+        self._tracing = False
+
+
+    def __enter__(self):
+        if Profiler._active is not None:
+            raise RuntimeError('Another Profiler is already active.')
+        if self.memory:
+            if tracemalloc is None:
+                raise ImportError('Recording memory allocations requires '
+                                  'tracemalloc, available in Python 3.4+.')
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing = True
+        from .renderer import Renderer
+        for cls in self._subclasses(Plot) + self._subclasses(Renderer):
+            for name in self.methods:
+                attr = cls.__dict__.get(name)
+                wrapped = None if attr is None else self._wrap(cls, name, attr)
+                if wrapped is not None:
+                    self._patched.append((cls, name, attr))
+                    # Bypasses the Parameterized metaclass, which warns
+                    # when setting class attributes which aren't parameters
+                    type.__setattr__(cls, name, wrapped)
+        self._start = timer()
+        Profiler._active = self
+        return self
+
+
+    def __exit__(self, *args):
+        Profiler._active = None
+        for cls, name, attr in self._patched[::-1]:
+            type.__setattr__(cls, name, attr)
+        self._patched = []
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+
+    @classmethod
+    def _subclasses(cls, base):
+        classes, stack = [], [base]
+        while stack:
+            subclass = stack.pop()
+            if subclass not in classes:
+                classes.append(subclass)
+                stack.extend(subclass.__subclasses__())
+        return classes
+
+
+    def _wrap(self, cls, name, attr):
+        """
+        Wraps a method, classmethod, staticmethod or bothmethod so
+        calls to it are recorded, returning None for other attributes.
+        """
+        if isinstance(attr, classmethod):
+            return classmethod(self._timed(name, attr.__func__))
+        elif isinstance(attr, staticmethod):
+            return staticmethod(self._timed(name, attr.__func__, cls))
+        elif isinstance(attr, bothmethod):
+            return bothmethod(self._timed(name, attr.func))
+        elif callable(attr):
+            return self._timed(name, attr)
+
+
+    def _timed(self, name, fn, static=None):
+        profiler = self
+        def wrapper(*args, **kwargs):
+            obj = static if static else args[0]
+            stack = profiler._stack()
+            # Calls to the same method on a superclass are part of
+            # the call being recorded
+            if stack and stack[-1][0] == name and stack[-1][1] == id(obj):
+                return fn(*args, **kwargs)
+            memory = tracemalloc.get_traced_memory()[0] if profiler.memory else None
+            stack.append([name, id(obj), timer(), 0])
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profiler._record(stack, obj, memory)
+        wrapper.__name__ = fn.__name__
+        wrapper.__doc__ = fn.__doc__
+        return wrapper
+
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+    def _record(self, stack, obj, memory):
+        end = timer()
+        name, _, start, children = stack.pop()
+        duration = end - start
+        if stack:
+            stack[-1][3] += duration
+        if memory is not None:
+            memory = tracemalloc.get_traced_memory()[0] - memory
+        cls = obj if isinstance(obj, type) else type(obj)
+        record = dict(name=name, cls=cls.__name__, start=start-self._start,
+                      duration=duration, self_time=duration-children,
+                      depth=len(stack), memory=memory,
+                      key=getattr(obj, 'current_key', None),
+                      thread=threading.current_thread().ident)
+        with self._lock:
+            self.records.append(record)
+
+
+    def table(self, frames=False):
+        """
+        Aggregates the recorded calls per method and class, and
+        optionally per frame, returning a Table of the number of
+        calls, the total, self and mean time in seconds and the
+        allocated bytes, sorted by the total time.
+        """
+        aggregated = OrderedDict()
+        for record in self.records:
+            key = (record['name'], record['cls'])
+            if frames:
+                key += (str(record['key']),)
+            calls, total, self_time, memory = aggregated.get(key, (0, 0, 0, 0))
+            aggregated[key] = (calls+1, total+record['duration'],
+                               self_time+record['self_time'],
+                               memory+(record['memory'] or 0))
+        rows = [k+(calls, total, self_time, total/calls, memory)
+                for k, (calls, total, self_time, memory) in aggregated.items()]
+        rows = sorted(rows, key=lambda row: -row[-4])
+        kdims = ['Method', 'Class'] + (['Frame'] if frames else [])
+        return Table(rows, kdims=kdims, vdims=['Calls', 'Total', 'Self',
+                                               'Mean', 'Memory'])
+
+
+    def trace(self):
+        """
+        Returns the recorded calls in the Chrome trace event format.
+        """
+        pid = os.getpid()
+        events = []
+        for record in sorted(self.records, key=lambda r: (r['start'], r['depth'])):
+            args = {'key': str(record['key'])}
+            if record['memory'] is not None:
+                args['memory'] = record['memory']
+            events.append({'name': record['name'], 'cat': record['cls'],
+                           'ph': 'X', 'pid': pid, 'tid': record['thread'],
+                           'ts': record['start']*1e6,
+                           'dur': record['duration']*1e6, 'args': args})
+        return {'traceEvents': events}
+
+
+    def save_trace(self, filename):
+        """
+        Saves the recorded calls to a Chrome trace JSON file.
+        """
+        with open(filename, 'w') as f:
+            json.dump(self.trace(), f)
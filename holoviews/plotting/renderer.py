@@ -10,6 +10,7 @@ from contextlib import contextmanager
 
 import param
 from ..core.io import Exporter
+from ..core.data.lazy import LazyDataset
 from ..core.options import Store, StoreOptions, SkipRendering
 from ..core.util import find_file, unicode, unbound_dimensions
 from .. import Layout, HoloMap, AdjointLayout
@@ -18,6 +19,7 @@ from .widgets import NdWidget, ScrubberWidget, SelectionWidget
 from .. import DynamicMap
 from . import Plot
 from .comms import JupyterComm
+from .profiler import Profiler
 from .util import displayable, collate
 
 from param.parameterized import bothmethod
@@ -118,6 +120,11 @@ class Renderer(Exporter):
     key_fn = param.Callable(None, allow_None=True, constant=True,  doc="""
         Renderers do not support the saving of object key metadata""")
 
+    profile = param.Boolean(default=False, doc="""
+        Whether to profile the plotting and serialization calls made
+        when rendering an object. The Profiler holding the results is
+        made available as the last_profile attribute.""")
+
     post_render_hooks = param.Dict(default={'svg':[], 'png':[]}, doc="""
        Optional dictionary of hooks that are applied to the rendered
        data (according to the output format) before it is returned.
@@ -151,14 +158,32 @@ class Renderer(Exporter):
 
     def __init__(self, **params):
         self.last_plot = None
+        self.last_profile = None
         super(Renderer, self).__init__(**params)
 
 
+    @contextmanager
+    def _profiling(self):
+        """
+        Context manager which profiles the enclosed rendering calls
+        if the profile parameter is enabled and no other Profiler is
+        active, storing the Profiler as last_profile.
+        """
+        if not self.profile or Profiler._active is not None:
+            yield
+            return
+        with Profiler() as profiler:
+            yield
+        self.last_profile = profiler
+
+
     @bothmethod
     def get_plot(self_or_cls, obj, renderer=None):
         """
         Given a HoloViews Viewable return a corresponding plot instance.
         """
+        if isinstance(obj, LazyDataset):
+            obj = obj.compute()
         if not isinstance(obj, Plot) and not displayable(obj):
             obj = collate(obj)
 
@@ -253,6 +278,15 @@ class Renderer(Exporter):
         return data
 
 
+    def full_diff(self, plot):
+        """
+        Returns a diff restoring the complete current state of the
+        plot, which may replace any number of preceding diffs. By
+        default diffs already contain the complete plot state.
+        """
+        return self.diff(plot)
+
+
     def html(self, obj, fmt=None, css=None, comm=True, **kwargs):
         """
         Renders plot or data structure and wraps the output in HTML.
@@ -339,7 +373,8 @@ class Renderer(Exporter):
         with fields to interpolate 'js', 'css' and the main 'html'
         containing the widget. Also provides options to export widget
         data to a json file in the supplied json_path (defaults to
-        current path).
+        current path). Supplying a json_chunk_size streams the frames
+        to disk in chunks instead.
         """
         if fmt not in list(self_or_cls.widgets.keys())+['auto', None]:
             raise ValueError("Renderer.export_widget may only export "
@@ -356,6 +391,8 @@ class Renderer(Exporter):
                 save_path = json_path
             kwargs['json_save_path'] = save_path
             kwargs['json_load_path'] = json_path
+            if json:
+                kwargs['export_json'] = True
             widget = self_or_cls.get_widget(obj, fmt, **kwargs)
         else:
             widget = obj
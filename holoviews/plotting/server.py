@@ -0,0 +1,411 @@
+"""
+The server module allows serving HoloViews objects as standalone HTML
+pages outside of a Jupyter notebook. Plot updates triggered by
+DynamicMaps, streams and live widgets are pushed to the browser over
+WebSockets using the WebSocketComm. Each client receives its own
+PlotSession holding independent plot state, so a single process may
+serve many concurrent clients. Messages from each client are handled
+and rendered on a thread of its session, keeping the IOLoop free to
+serve the other clients while a frame is rendered.
+"""
+
+import threading
+
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
+import param
+
+try:
+    from tornado import web, websocket
+    from tornado.ioloop import IOLoop
+except ImportError:
+    web, websocket, IOLoop = None, None, None
+
+from ..core import Store, Dimensioned
+from .comms import WebSocketComm
+from .util import detach_streams
+from .widgets import NdWidget
+
+
+server_js = """
+var HoloViewsServer = {
+  sockets: {},
+
+  connect: function(comm_id, handler) {
+    var socket = HoloViewsServer.sockets[comm_id];
+    if (socket === undefined) {
+      var protocol = window.location.protocol == 'https:' ? 'wss://' : 'ws://';
+      socket = new WebSocket(protocol + window.location.host + '/ws/' + comm_id);
+      socket.handlers = [];
+      socket.listeners = [];
+      socket.pending = [];
+      socket.onopen = function() {
+        for (var i=0; i<socket.pending.length; i++) {
+          socket.send(socket.pending[i]);
+        }
+        socket.pending = [];
+      };
+      socket.onmessage = function(event) {
+        var msg = event.data, reply = null;
+        try { reply = JSON.parse(msg); } catch (err) {}
+        if (reply && (reply.msg_type == 'Ready' || reply.msg_type == 'Error')) {
+          if (reply.msg_type == 'Error') { console.log(reply.traceback); }
+          for (var i=0; i<socket.listeners.length; i++) { socket.listeners[i](reply); }
+        } else {
+          for (var i=0; i<socket.handlers.length; i++) { socket.handlers[i](msg); }
+        }
+      };
+      HoloViewsServer.sockets[comm_id] = socket;
+    }
+    if (handler) { socket.handlers.push(handler); }
+    return socket;
+  },
+
+  send: function(comm_id, msg) {
+    var socket = HoloViewsServer.connect(comm_id);
+    var data = JSON.stringify(msg);
+    if (socket.readyState == 1) {
+      socket.send(data);
+    } else {
+      socket.pending.push(data);
+    }
+  }
+};
+
+/* Route live widget updates over the WebSocket instead of the kernel */
+var ServerWidgetMethods = {
+  init_comms: function() {
+    var widget = this;
+    var socket = HoloViewsServer.connect(this.id, function(msg) {
+      widget.process_msg({content: {data: msg}});
+    });
+    socket.listeners.push(function(reply) {
+      widget.wait = false;
+      if (widget.queue.length > 0) {
+        var current = widget.queue[widget.queue.length-1];
+        widget.queue = [];
+        widget.dynamic_update(current);
+      }
+    });
+  },
+  dynamic_update: function(current) {
+    if (current === undefined) { return; }
+    this.current = current;
+    this.time = Date.now();
+    HoloViewsServer.send(this.id, {msg_type: 'widget', key: current, comm_id: this.id});
+  }
+};
+
+['HoloViewsWidget', 'SelectionWidget', 'ScrubberWidget',
+ 'BokehSelectionWidget', 'BokehScrubberWidget',
+ 'MPLSelectionWidget', 'MPLScrubberWidget'].forEach(function(name) {
+  if (window[name] !== undefined) {
+    for (var method in ServerWidgetMethods) {
+      window[name].prototype[method] = ServerWidgetMethods[method];
+    }
+  }
+});
+"""
+
+# Applies bokeh document patches to the plot with the given root id
+bokeh_msg_handler = """
+<script>
+  HoloViewsServer.connect("{comm_id}", function(msg) {{
+    var doc = Bokeh.index["{root_id}"].model.document;
+    doc.apply_json_patch(JSON.parse(msg));
+  }});
+</script>
+"""
+
+page_template = """<!DOCTYPE html>
+<html>
+  <head>
+    <meta charset="utf-8">
+    <title>{title}</title>
+    {css}
+    {js}
+    <script type="text/javascript">{server_js}</script>
+  </head>
+  <body>
+    {html}
+  </body>
+</html>
+"""
+
+
+class PlotSession(object):
+    """
+    A PlotSession holds the plot state of a single client. The object
+    is rendered with a renderer whose comms have been replaced by
+    WebSocketComms, and messages received from the client are
+    dispatched to the live widget or the streams of the plot.
+
+    Clients may send JSON messages with a msg_type of 'widget',
+    supplying the key of the frame to display, or 'stream', supplying
+    the index of a stream on the plot and the contents to update it
+    with. Messages are handled in order on a background thread of the
+    session, so rendering does not block the IOLoop.
+    """
+
+    def __init__(self, obj, renderer, fmt=None, title='HoloViews', max_queue=16):
+        self.obj = obj
+        self.renderer = renderer
+        html = renderer.html(obj, fmt)
+        plot = renderer.last_plot
+        if isinstance(plot, NdWidget):
+            self.widget, self.plot = plot, plot.plot
+        else:
+            self.widget, self.plot = None, plot
+        if self.plot.comm is None:
+            self.plot.comm = WebSocketComm(self.plot)
+            self.plot.traverse(lambda x: setattr(x, 'comm', self.plot.comm))
+        self.comm = self.plot.comm
+        self.comm._on_msg = self.on_msg
+        self.comm.max_queue = max_queue
+        self.id = self.comm.id
+        if renderer.backend == 'bokeh':
+            html += bokeh_msg_handler.format(comm_id=self.id,
+                                             root_id=self.plot.state.ref['id'])
+        js, css = renderer.html_assets()
+        self.page = page_template.format(title=title, css=css, js=js,
+                                         server_js=server_js, html=html)
+        self._messages = Queue()
+        self._thread = None
+
+
+    def handle(self, message):
+        """
+        Queues a raw message received from the client to be handled
+        on the thread of the session.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+        self._messages.put(message)
+
+
+    def _run(self):
+        while True:
+            message = self._messages.get()
+            if message is None:
+                break
+            self.comm._handle_msg(message)
+
+
+    def on_msg(self, msg):
+        """
+        Dispatches a message received from the client.
+        """
+        msg_type = msg.get('msg_type')
+        if msg_type == 'widget':
+            if self.widget is None:
+                raise ValueError('Session %s does not display a widget.' % self.id)
+            self.widget.update(msg['key'])
+        elif msg_type == 'stream':
+            stream = self.plot.streams[msg['index']]
+            stream.update(**msg['contents'])
+        else:
+            raise ValueError('Unknown message type %r.' % msg_type)
+
+
+    def close(self):
+        """
+        Stops the thread handling messages, detaches the plot from its
+        streams and releases the comm.
+        """
+        if self._thread is not None:
+            self._messages.put(None)
+            self._thread = None
+        detach_streams(self.plot, self.obj)
+        prefetcher = getattr(self.widget, 'prefetcher', None)
+        if prefetcher is not None:
+            prefetcher.close()
+        NdWidget.widgets.pop(self.id, None)
+        self.comm.close()
+
+
+
+class WebSocketConnection(object):
+    """
+    Adapts a tornado WebSocketHandler to the connection interface of
+    the WebSocketComm. Messages are written on the IOLoop of the
+    handler, so plot updates may be pushed from any thread.
+    """
+
+    def __init__(self, handler, loop):
+        self.handler = handler
+        self.loop = loop
+
+    def write(self, data, callback):
+        self.loop.add_callback(self._write, data, callback)
+
+    def _write(self, data, callback):
+        try:
+            future = self.handler.write_message(data)
+        except websocket.WebSocketClosedError:
+            return
+        if future is None:
+            callback()
+        else:
+            self.loop.add_future(future, lambda f: callback())
+
+
+if web is not None:
+
+    class PageHandler(web.RequestHandler):
+        """
+        Creates a new PlotSession for each page request.
+        """
+
+        def initialize(self, server):
+            self.server = server
+
+        def get(self):
+            session = self.server.create_session()
+            self.write(session.page)
+
+
+    class SocketHandler(websocket.WebSocketHandler):
+        """
+        Connects the WebSocket of a client to its PlotSession.
+        """
+
+        def initialize(self, server):
+            self.server = server
+            self.session = None
+
+        def open(self, session_id):
+            self.session = self.server.sessions.get(session_id)
+            if self.session is None:
+                self.close()
+                return
+            connection = WebSocketConnection(self, IOLoop.current())
+            self.session.comm.init(connection)
+
+        def on_message(self, message):
+            self.session.handle(message)
+
+        def on_close(self):
+            if self.session is not None:
+                self.server.close_session(self.session.id)
+
+
+
+class PlotServer(param.Parameterized):
+    """
+    PlotServer serves a HoloViews object as a standalone HTML page
+    using tornado. Every page request creates a new PlotSession with
+    its own plot, which the page connects to over a WebSocket to
+    receive plot updates and send widget and stream events. To give
+    each client independent streams, supply a callable returning a
+    new object instead of the object itself.
+
+    The server may be embedded in an existing tornado application via
+    the app method or started directly with the start method.
+    """
+
+    address = param.String(default='localhost', doc="""
+        The address the server listens on.""")
+
+    port = param.Integer(default=5006, doc="""
+        The port the server listens on.""")
+
+    backend = param.String(default=None, allow_None=True, doc="""
+        The plotting backend, defaults to the current backend.""")
+
+    fmt = param.String(default=None, allow_None=True, doc="""
+        The output format passed to the renderer, e.g. 'widgets' or
+        'scrubber' to display the object with a widget.""")
+
+    max_queue = param.Integer(default=16, bounds=(1, None), doc="""
+        Maximum number of pending messages per client before they
+        are replaced by a single message holding the full plot state.""")
+
+    session_timeout = param.Number(default=60, doc="""
+        Time in seconds after which sessions whose page never
+        connected are discarded.""")
+
+    title = param.String(default='HoloViews', doc="""
+        The title of the served HTML page.""")
+
+    def __init__(self, obj, **params):
+        if web is None:
+            raise ImportError('The PlotServer requires tornado.')
+        super(PlotServer, self).__init__(**params)
+        self.obj = obj
+        self.sessions = {}
+        self._server = None
+
+
+    def renderer(self):
+        """
+        Returns a renderer instance for a new session, which renders
+        live widgets and opens WebSocketComms for all plots.
+        """
+        backend = self.backend or Store.current_backend
+        renderer = Store.renderers[backend].instance(widget_mode='live')
+        renderer.comms = {mode: (WebSocketComm, handler)
+                          for mode, (_, handler) in renderer.comms.items()}
+        return renderer
+
+
+    def create_session(self):
+        """
+        Renders the object for a new client and registers the session.
+        """
+        obj = self.obj if isinstance(self.obj, Dimensioned) else self.obj()
+        session = PlotSession(obj, self.renderer(), self.fmt,
+                              self.title, self.max_queue)
+        self.sessions[session.id] = session
+        if self.session_timeout:
+            IOLoop.current().call_later(self.session_timeout,
+                                        self._expire_session, session.id)
+        return session
+
+
+    def _expire_session(self, session_id):
+        session = self.sessions.get(session_id)
+        if session is not None and session.comm._comm is None:
+            self.close_session(session_id)
+
+
+    def close_session(self, session_id):
+        """
+        Closes the session with the supplied id.
+        """
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            session.close()
+
+
+    def app(self):
+        """
+        Returns a tornado Application serving the object.
+        """
+        return web.Application([(r'/', PageHandler, dict(server=self)),
+                                (r'/ws/(\w+)', SocketHandler, dict(server=self))])
+
+
+    def start(self, block=True):
+        """
+        Starts listening on the configured address and port. If block
+        is True the IOLoop is started and runs until stopped.
+        """
+        self._server = self.app().listen(self.port, self.address)
+        if block:
+            IOLoop.current().start()
+
+
+    def stop(self):
+        """
+        Stops the server and closes all sessions.
+        """
+        if self._server is not None:
+            self._server.stop()
+            self._server = None
+        for session_id in list(self.sessions):
+            self.close_session(session_id)
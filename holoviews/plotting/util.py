@@ -1,13 +1,17 @@
 from __future__ import unicode_literals
 
+import weakref
+
 import numpy as np
 import param
 
 from ..core import (HoloMap, DynamicMap, CompositeOverlay, Layout,
-                    Overlay, GridSpace, NdLayout, Store, Dataset)
+                    Overlay, GridSpace, NdLayout, Store, Dataset,
+                    Element, OrderedDict)
 from ..core.spaces import get_nested_streams, Callable
 from ..core.util import (match_spec, is_number, wrap_tuple, basestring,
-                         get_overlay_spec, unique_iterator, safe_unicode)
+                         get_overlay_spec, unique_iterator, safe_unicode,
+                         thread_map)
 
 
 def displayable(obj):
@@ -303,6 +307,17 @@ def attach_streams(plot, obj):
     return obj.traverse(append_refresh, [DynamicMap])
 
 
+def detach_streams(plot, obj):
+    """
+    Detaches the plot refresh from all streams on the object.
+    """
+    def remove_refresh(dmap):
+        for stream in get_nested_streams(dmap):
+            stream._hidden_subscribers[:] = [s for s in stream._hidden_subscribers
+                                             if s != plot.refresh]
+    return obj.traverse(remove_refresh, [DynamicMap])
+
+
 def get_sources(obj, index=None):
     """
     Traverses Callable graph to resolve sources on
@@ -484,3 +499,119 @@ try:
     register_cmap("fire_r", cmap=fire_r_cmap)
 except ImportError:
     pass
+
+
+
+class RangeCache(object):
+    """
+    RangeCache memoizes the dimension ranges of elements, so ranges
+    shared between plots, e.g. between the subplots of a Layout or
+    across the frames of a HoloMap normalized over all frames, are
+    only computed once. Ranges are keyed by the identity of each
+    element and discarded once the element is garbage collected, so
+    the ranges of a DynamicMap are merged incrementally as new frames
+    are added. Ranges of uncached elements are computed on a pool of
+    threads if more than one thread is requested.
+
+    Since the cache assumes elements are not modified in place, it
+    should be cleared if the data of a displayed element is mutated.
+    """
+
+    def __init__(self, threads=1):
+        self.threads = threads
+        self._ranges = {}
+
+
+    def __len__(self):
+        return len(self._ranges)
+
+
+    def _discard(self, key):
+        return lambda ref: self._ranges.pop(key, None)
+
+
+    def get(self, element):
+        """
+        Returns the cached ranges of an element or None.
+        """
+        entry = self._ranges.get(id(element))
+        if entry is None or entry[0]() is not element:
+            return None
+        return entry[1]
+
+
+    def set(self, element, ranges):
+        """
+        Stores the ranges of an element, supplied as a dictionary
+        mapping from dimension name to range.
+        """
+        key = id(element)
+        try:
+            ref = weakref.ref(element, self._discard(key))
+        except TypeError:
+            return
+        self._ranges[key] = (ref, ranges)
+
+
+    def clear(self):
+        self._ranges.clear()
+
+
+    @classmethod
+    def element_ranges(cls, element):
+        """
+        Computes the ranges of all dimensions of an element.
+        """
+        return OrderedDict((d, element.range(d))
+                           for d in element.dimensions(label=True))
+
+
+    def compute(self, elements):
+        """
+        Returns a list of the ranges of the supplied elements,
+        computing the ranges of elements missing from the cache.
+        """
+        elements = list(elements)
+        computed, missing = {}, []
+        for el in elements:
+            ranges = self.get(el)
+            if ranges is not None:
+                computed[id(el)] = ranges
+            elif id(el) not in computed:
+                computed[id(el)] = None
+                missing.append(el)
+        for el, ranges in zip(missing, thread_map(self.element_ranges,
+                                                  missing, self.threads)):
+            self.set(el, ranges)
+            computed[id(el)] = ranges
+        return [computed[id(el)] for el in elements]
+
+
+    def summary(self, obj):
+        """
+        Returns a summary of the ranges of the elements in a HoloMap,
+        mapping from each key to a list of the ranges of the elements
+        in the corresponding frame. The summary may be pickled and
+        loaded for an equivalent HoloMap to avoid recomputing ranges.
+        """
+        summary = OrderedDict()
+        for key, item in obj.data.items():
+            elements = item.traverse(lambda x: x, [Element])
+            summary[key] = self.compute(elements)
+        return summary
+
+
+    def load(self, obj, summary):
+        """
+        Loads a summary of ranges into the cache, assigning them to
+        the elements of the frames in the HoloMap with matching keys.
+        """
+        for key, ranges in summary.items():
+            if key not in obj.data:
+                continue
+            elements = obj.data[key].traverse(lambda x: x, [Element])
+            if len(elements) != len(ranges):
+                raise ValueError('Range summary for key %r does not match '
+                                 'the number of elements in the frame.' % (key,))
+            for el, el_ranges in zip(elements, ranges):
+                self.set(el, el_ranges)
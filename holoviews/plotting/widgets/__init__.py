@@ -1,6 +1,11 @@
 from __future__ import unicode_literals
 
-import os, uuid, json, math
+import os, uuid, json, math, threading, hashlib
+
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
 
 import param
 import numpy as np
@@ -50,6 +55,141 @@ def escape_dict(vals):
 
 subdirs = [p[0] for p in os.walk(os.path.join(os.path.split(__file__)[0], '..'))]
 
+
+class FramePrefetcher(object):
+    """
+    FramePrefetcher renders the frames neighbouring the current
+    position of a live widget on a background thread, storing the
+    diffs in a bounded least-recently-used cache so that subsequent
+    updates may be served without re-rendering the plot.
+
+    The scrub direction is predicted from the last two requested
+    frames, prefetching lookahead frames ahead of the current position
+    and one frame behind it. Since all frames are rendered using the
+    same plot, rendering is serialized by a lock which must be held
+    while updating the plot and requests which have been superseded
+    by a newer update are abandoned.
+
+    The cached diffs restore the full state of the plot, so they may
+    be replayed whichever frame the client displayed before. Frames
+    served from the cache are therefore not rendered again, instead
+    the plot is restored to the displayed frame on the background
+    thread once prefetching completes.
+    """
+
+    def __init__(self, widget, lookahead=2, cache_size=20):
+        self.widget = widget
+        self.lookahead = lookahead
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.lock = threading.RLock()
+        self.direction = 1
+        self.current = None
+        self.plot_key = None
+        self._generation = 0
+        self._requests = Queue()
+        self._thread = None
+
+
+    def get(self, key):
+        """
+        Returns the cached diff for the supplied frame or None.
+        """
+        with self.lock:
+            diff = self.cache.pop(key, None)
+            if diff is not None:
+                self.cache[key] = diff
+            return diff
+
+
+    def put(self, key, diff):
+        """
+        Caches the diff for the supplied frame evicting the least
+        recently used frames if the cache is full.
+        """
+        if diff is None or not self.cache_size:
+            return
+        with self.lock:
+            self.cache.pop(key, None)
+            self.cache[key] = diff
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+
+    def render(self, key):
+        """
+        Updates the plot to the supplied frame and returns the diff
+        restoring its full state. Must be called holding the lock.
+        """
+        diff = self.widget._render_diff(key)
+        self.plot_key = key
+        return diff
+
+
+    def predict(self, key):
+        """
+        Updates the predicted scrub direction given the requested
+        frame and returns the frames which should be prefetched.
+        """
+        if self.current is not None and key != self.current:
+            self.direction = 1 if key > self.current else -1
+        self.current = key
+        ahead = [key+self.direction*i for i in range(1, self.lookahead+1)]
+        keys = ahead + [key-self.direction]
+        nframes = len(self.widget.plot)
+        return [k for k in keys if 0 <= k < nframes and k not in self.cache]
+
+
+    def schedule(self, key):
+        """
+        Schedules prefetching of the frames around the supplied frame,
+        superseding any previously scheduled requests.
+        """
+        with self.lock:
+            keys = self.predict(key)
+            self._generation += 1
+            generation = self._generation
+            restore = self.plot_key != key
+        if not keys and not restore:
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+        self._requests.put((generation, key, keys))
+
+
+    def close(self):
+        """
+        Stops the background thread and clears the cache.
+        """
+        with self.lock:
+            self._generation += 1
+            self.cache.clear()
+        if self._thread is not None:
+            self._requests.put(None)
+            self._thread = None
+
+
+    def _run(self):
+        while True:
+            request = self._requests.get()
+            if request is None:
+                break
+            generation, key, keys = request
+            for k in keys:
+                with self.lock:
+                    if generation != self._generation:
+                        break
+                    if k not in self.cache:
+                        self.put(k, self.render(k))
+            with self.lock:
+                # Restore the plot state to the displayed frame
+                if generation == self._generation and self.plot_key != key:
+                    self.widget.plot.update(key)
+                    self.plot_key = key
+
+
 class NdWidget(param.Parameterized):
     """
     NdWidget is an abstract base class implementing a method to find
@@ -85,6 +225,27 @@ class NdWidget(param.Parameterized):
          when exporting the notebook the path can be set to another
          location like a webserver where the json files can be uploaded to.""")
 
+    json_chunk_size = param.Integer(default=None, allow_None=True,
+                                    bounds=(1, None), doc="""
+         If export_json is enabled and a chunk size is set, embedded
+         frames are rendered and written to the json_save_path one at
+         a time, split across files holding the given number of frames
+         which the widget loads on demand. Consecutive identical frames
+         are only written once.""")
+
+    ####################
+    # Prefetch options #
+    ####################
+
+    prefetch = param.Integer(default=0, bounds=(0, None), doc="""
+         Number of frames ahead of the current position in the
+         predicted scrub direction to pre-render on a background
+         thread when the widget is not embedded. Disabled if zero.""")
+
+    cache_size = param.Integer(default=20, bounds=(0, None), doc="""
+         Maximum number of rendered frames held by the prefetch
+         cache.""")
+
     ##############################
     # Javascript include options #
     ##############################
@@ -129,6 +290,12 @@ class NdWidget(param.Parameterized):
 
         NdWidget.widgets[self.id] = self
 
+        if (self.prefetch and not self.embed and not self.plot.dynamic
+            and self.plot.comm is not None):
+            self.prefetcher = FramePrefetcher(self, self.prefetch, self.cache_size)
+        else:
+            self.prefetcher = None
+
         # Set up jinja2 templating
         import jinja2
         templateLoader = jinja2.FileSystemLoader(subdirs)
@@ -164,7 +331,12 @@ class NdWidget(param.Parameterized):
 
 
     def get_frames(self):
-        if self.embed:
+        if (self.embed and self.export_json and self.json_chunk_size
+            and self.json_save_path is not None):
+            self.save_json_chunks(self._plot_figure(idx)
+                                  for idx in range(len(self.plot)))
+            return '{}'
+        elif self.embed:
             frames = OrderedDict([(idx, self._plot_figure(idx))
                                   for idx in range(len(self.plot))])
         else:
@@ -190,6 +362,57 @@ class NdWidget(param.Parameterized):
             json.dump(frames, f)
         self.json_data = frames
 
+    def save_json_chunks(self, frames):
+        """
+        Incrementally writes an iterable of frames into json files at
+        the json_save_path, each holding json_chunk_size frames, so
+        only a single frame is held in memory at a time. Frames which
+        are identical to the preceding frame are recorded as
+        references in a manifest named with the widget uuid.
+        """
+        if not os.path.isdir(self.json_save_path):
+            os.mkdir(self.json_save_path)
+        path = os.path.join(self.json_save_path, '%s_%%d.json' % self.id)
+        chunk_size = self.json_chunk_size
+        refs, previous, chunk, f = {}, None, None, None
+        nframes = 0
+        try:
+            for idx, frame in enumerate(frames):
+                nframes += 1
+                encoded = self._encode_frame(frame)
+                digest = hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+                if previous is not None and digest == previous[1]:
+                    refs[idx] = previous[0]
+                    continue
+                previous = (idx, digest)
+                if idx // chunk_size != chunk:
+                    if f is not None:
+                        f.write('}')
+                        f.close()
+                    chunk = idx // chunk_size
+                    f = open(path % chunk, 'w')
+                    f.write('{')
+                else:
+                    f.write(', ')
+                f.write('"%d": %s' % (idx, encoded))
+        finally:
+            if f is not None:
+                f.write('}')
+                f.close()
+
+        manifest = dict(chunk_size=chunk_size, nframes=nframes, refs=refs)
+        with open(os.path.join(self.json_save_path, '%s.json' % self.id), 'w') as f:
+            json.dump(manifest, f)
+        self.json_data = manifest
+
+
+    def _encode_frame(self, frame):
+        """
+        Encodes a single frame as json.
+        """
+        return json.dumps(frame)
+
+
     def _plot_figure(self, idx):
         with self.renderer.state():
             self.plot.update(idx)
@@ -200,12 +423,41 @@ class NdWidget(param.Parameterized):
                                       comm=False)
 
 
+    def _render_diff(self, key):
+        """
+        Updates the plot to the supplied key and returns the diff
+        restoring the full state of the plot, which is valid whichever
+        frame is currently displayed.
+        """
+        self.plot.update(key)
+        return self.plot.renderer.full_diff(self.plot)
+
+
+    def _update_frame(self, key):
+        """
+        Updates the plot to the supplied key and pushes the diff,
+        serving it from the prefetch cache where possible.
+        """
+        prefetcher = self.prefetcher
+        if prefetcher is None:
+            self.plot.update(key)
+            self.plot.push()
+            return
+
+        with prefetcher.lock:
+            diff = prefetcher.get(key)
+            if diff is None:
+                diff = prefetcher.render(key)
+                prefetcher.put(key, diff)
+            self.plot.comm.send(diff)
+        prefetcher.schedule(key)
+
+
     def update(self, key):
         if not self.plot.dimensions:
             self.plot.refresh()
         else:
-            self.plot.update(key)
-            self.plot.push()
+            self._update_frame(key)
         return 'Complete'
 
 
@@ -384,6 +636,5 @@ class SelectionWidget(NdWidget):
                    for kdim in self.plot.dimensions]
             key = wrap_tuple_streams(tuple(key), self.plot.dimensions,
                                      self.plot.streams)
-        self.plot.update(key)
-        self.plot.push()
+        self._update_frame(key)
         return 'Complete'
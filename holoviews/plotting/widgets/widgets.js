@@ -26,9 +26,47 @@ HoloViewsWidget.prototype.process_error = function(msg){
 HoloViewsWidget.prototype.from_json = function() {
 	var data_url = this.json_path + this.id + '.json';
 	$.getJSON(data_url, $.proxy(function(json_data) {
-		this.frames = json_data;
+		if (json_data.chunk_size !== undefined) {
+			// Chunked export, frames are loaded on demand
+			this.manifest = json_data;
+			this.chunks = {};
+			this.frames = {};
+			this.show_frame(0);
+		} else {
+			this.frames = json_data;
+			this.update_cache();
+			this.update(0);
+		}
+	}, this));
+}
+
+HoloViewsWidget.prototype.show_frame = function(current){
+	if ((this.manifest === undefined) || (current in this.frames)) {
+		this.update(current);
+	} else {
+		this.load_chunk(current);
+	}
+}
+
+HoloViewsWidget.prototype.load_chunk = function(current){
+	var manifest = this.manifest;
+	var frame = (current in manifest.refs) ? manifest.refs[current] : current;
+	var chunk = Math.floor(frame / manifest.chunk_size);
+	this.pending = current;
+	if (chunk in this.chunks) {
+		return
+	}
+	this.chunks[chunk] = true;
+	var data_url = this.json_path + this.id + '_' + chunk + '.json';
+	$.getJSON(data_url, $.proxy(function(json_data) {
+		$.extend(this.frames, json_data);
+		$.each(manifest.refs, $.proxy(function(idx, ref) {
+			if (ref in json_data) { this.frames[idx] = json_data[ref]; }
+		}, this));
 		this.update_cache();
-		this.update(0);
+		if (this.pending in this.frames) {
+			this.update(this.pending);
+		}
 	}, this));
 }
 
@@ -74,7 +112,7 @@ HoloViewsWidget.prototype.dynamic_update = function(current){
 HoloViewsWidget.prototype.update_cache = function(force){
     var frame_len = Object.keys(this.frames).length;
     for (var i=0; i<frame_len; i++) {
-        if(!this.load_json || this.dynamic)  {
+        if(!this.load_json || this.dynamic || (this.manifest !== undefined))  {
             frame = Object.keys(this.frames)[i];
         } else {
             frame = i;
@@ -178,7 +216,7 @@ SelectionWidget.prototype.set_frame = function(dim_val, dim_idx){
     if(this.dynamic) {
         this.dynamic_update(this.current_vals)
     } else if(this.cached) {
-        this.update(current)
+        this.show_frame(current)
     } else {
         this.dynamic_update(current)
     }
@@ -222,7 +260,7 @@ ScrubberWidget.prototype.set_frame = function(frame){
     }
     widget.value = this.current_frame;
     if(this.cached) {
-        this.update(frame)
+        this.show_frame(frame)
     } else {
         this.dynamic_update(frame)
     }
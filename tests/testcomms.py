@@ -2,7 +2,7 @@ import json
 from nose.tools import *
 
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews.plotting.comms import Comm, JupyterComm
+from holoviews.plotting.comms import Comm, JupyterComm, WebSocketComm
 
 
 class TestComm(ComparisonTestCase):
@@ -68,3 +68,105 @@ class TestJupyterComm(ComparisonTestCase):
         comm = JupyterComm(None, id='Test', on_msg=raise_error)
         with self.assertRaises(Exception):
             comm._handle_msg({'content': {'data': 'Error'}})
+
+
+
+class MockConnection(object):
+
+    def __init__(self):
+        self.written = []
+        self.callbacks = []
+
+    def write(self, data, callback):
+        self.written.append(data)
+        self.callbacks.append(callback)
+
+    def flush(self):
+        self.callbacks.pop(0)()
+
+
+class MockRenderer(object):
+
+    def full_diff(self, plot):
+        return 'State %s' % plot.state
+
+
+class MockPlot(object):
+
+    renderer = MockRenderer()
+
+    state = 'D'
+
+
+class TestWebSocketComm(ComparisonTestCase):
+
+    def test_init_comm_id(self):
+        comm = WebSocketComm(None, id='Test')
+        self.assertEqual(comm.id, 'Test')
+
+    def test_decode(self):
+        decoded = WebSocketComm.decode('{"msg_type": "widget", "key": [0]}')
+        self.assertEqual(decoded, {'msg_type': 'widget', 'key': [0]})
+
+    def test_send_queued_before_init(self):
+        comm = WebSocketComm(None, id='Test')
+        connection = MockConnection()
+        comm.send('A')
+        self.assertEqual(connection.written, [])
+        comm.init(connection)
+        self.assertEqual(connection.written, ['A'])
+
+    def test_send_writes_one_message_at_a_time(self):
+        comm = WebSocketComm(None, id='Test')
+        connection = MockConnection()
+        comm.init(connection)
+        comm.send('A')
+        comm.send('B')
+        self.assertEqual(connection.written, ['A'])
+        connection.flush()
+        self.assertEqual(connection.written, ['A', 'B'])
+
+    def test_send_overflow_replaced_by_full_state(self):
+        comm = WebSocketComm(MockPlot(), id='Test')
+        comm.max_queue = 2
+        connection = MockConnection()
+        comm.init(connection)
+        for msg in 'ABCD':
+            comm.send(msg)
+        connection.flush()
+        comm.send('E')
+        connection.flush()
+        connection.flush()
+        self.assertEqual(connection.written, ['A', 'State D', 'E'])
+
+    def test_close_clears_queue(self):
+        comm = WebSocketComm(None, id='Test')
+        connection = MockConnection()
+        comm.send('A')
+        comm.close()
+        comm.init(connection)
+        self.assertEqual(connection.written, [])
+
+    def test_handle_message(self):
+        received = []
+        comm = WebSocketComm(None, id='Test', on_msg=received.append)
+        connection = MockConnection()
+        comm.init(connection)
+        comm._handle_msg('{"msg_type": "widget", "key": [1]}')
+        self.assertEqual(received, [{'msg_type': 'widget', 'key': [1]}])
+        self.assertEqual(json.loads(connection.written[0])['msg_type'], 'Ready')
+
+    def test_replies_not_dropped(self):
+        comm = WebSocketComm(None, id='Test', on_msg=lambda msg: None)
+        comm.max_queue = 1
+        connection = MockConnection()
+        comm.init(connection)
+        comm.send('A')
+        comm._handle_msg('{"msg_type": "widget", "key": [1]}')
+        comm.send('B')
+        comm.send('C')
+        connection.flush()
+        connection.flush()
+        self.assertEqual(connection.written[0], 'A')
+        self.assertEqual(json.loads(connection.written[1])['msg_type'], 'Ready')
+        self.assertEqual(connection.written[2], 'C')
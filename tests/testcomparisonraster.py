@@ -169,3 +169,10 @@ class RasterMapComparisonTest(RasterMapTestCase):
         except AssertionError as e:
             if not str(e).startswith('Image not almost equal to 6 decimals\n'):
                 raise self.failureException("Image mismatch error not raised.")
+
+    def test_element_mismatch_key(self):
+        try:
+            self.assertEqual(self.map1_1D, self.map4_1D)
+            raise AssertionError("Pane mismatch in array data not raised.")
+        except AssertionError as e:
+            self.assertTrue(str(e).endswith('HoloMaps differ at key 1.'))
@@ -82,6 +82,22 @@ class SimpleComparisonTest(ComparisonTestCase):
             if not str(e).startswith("Arrays not almost equal to 6 decimals"):
                             raise self.failureException("Float array mismatch error not raised.")
 
+    def test_arrays_identical_shared_buffer(self):
+        arr = np.arange(10.)
+        self.assertTrue(self.arrays_identical(arr, arr[:]))
+        self.assertFalse(self.arrays_identical(arr, arr[::-1]))
+
+    def test_arrays_identical_nans(self):
+        self.assertTrue(self.arrays_identical(np.array([1, np.NaN]),
+                                              np.array([1, np.NaN])))
+
+    def test_arrays_identical_falls_back(self):
+        self.assertFalse(self.arrays_identical(np.array([0.]), np.array([-0.])))
+        self.assertEqual(np.array([0.]), np.array([-0.]))
+
+    def test_arrays_identical_dtype_mismatch(self):
+        self.assertFalse(self.arrays_identical(np.array([1, 2]), np.array([1., 2.])))
+
     def test_bounds_equal(self):
         self.assertEqual(BoundingBox(radius=0.5),
                          BoundingBox(radius=0.5))
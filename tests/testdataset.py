@@ -9,6 +9,7 @@ from holoviews.element.comparison import ComparisonTestCase
 
 from collections import OrderedDict
 from holoviews.core.dimension import OrderedDict as cyODict
+from holoviews.core.util import basestring
 
 try:
     import pandas as pd
@@ -263,6 +264,15 @@ class HeterogeneousColumnTypes(HomogeneousColumnTypes):
                           kdims=['x'], vdims=['z'])
         self.assertEqual(dataset.reduce(['y'], np.mean), reduced)
 
+    def test_dataset_dimension_type_ht(self):
+        self.assertTrue(issubclass(self.table.get_dimension_type('Age'), np.integer))
+        self.assertTrue(issubclass(self.table.get_dimension_type('Height'), np.floating))
+        self.assertTrue(issubclass(self.table.get_dimension_type('Gender'), basestring))
+
+    def test_dataset_dimension_type_cached(self):
+        dim_type = self.table.get_dimension_type('Gender')
+        self.assertEqual(self.table._dimension_types, {'Gender': dim_type})
+
     def test_dataset_aggregate_ht(self):
         aggregated = Dataset({'Gender':['M', 'F'], 'Weight':[16.5, 10], 'Height':[0.7, 0.8]},
                              kdims=self.kdims[:1], vdims=self.vdims)
@@ -356,6 +366,51 @@ class HeterogeneousColumnTypes(HomogeneousColumnTypes):
         row = self.table['M', 10, 'Weight']
         self.assertEquals(row, 15)
 
+    # Lazy pipelines
+
+    def test_dataset_lazy_select_sort(self):
+        lazy = self.table.lazy().select(Age=(10, 17)).sort(['Weight']).select(Age=(11, None))
+        eager = self.table.select(Age=(10, 17)).sort(['Weight']).select(Age=(11, None))
+        self.assertEquals(lazy.compute(), eager)
+
+    def test_dataset_lazy_optimize_fuses_selects(self):
+        lazy = self.table.lazy().select(Age=(10, 17)).sort(['Weight']).select(Age=(11, None), Weight=(0, 20))
+        pipeline = lazy.optimize().pipeline
+        self.assertEqual([op[0] for op in pipeline], ['select', 'sort'])
+        self.assertEqual(pipeline[0][2], {'Age': (11, 17), 'Weight': (0, 20)})
+
+    def test_dataset_lazy_optimize_prunes_before_sort(self):
+        lazy = self.table.lazy().sort(['Age']).reindex(['Age'], ['Weight']).select(Age=(0, 15))
+        pipeline = lazy.optimize().pipeline
+        self.assertEqual([op[0] for op in pipeline], ['select', 'reindex', 'sort'])
+        eager = self.table.sort(['Age']).reindex(['Age'], ['Weight']).select(Age=(0, 15))
+        self.assertEquals(lazy.compute(), eager)
+
+    def test_dataset_lazy_scalar_select_not_pushed_through_reindex(self):
+        lazy = self.table.lazy().reindex(['Gender', 'Age'], ['Weight']).select(Gender='M', Age=10)
+        self.assertEqual([op[0] for op in lazy.optimize().pipeline], ['reindex', 'select'])
+        self.assertEqual(lazy.compute(), 15)
+
+    def test_dataset_lazy_scalar_select_not_pushed_through_sort(self):
+        table = self.table.reindex(vdims=['Weight'])
+        lazy = table.lazy().sort(['Weight']).select(Gender='M', Age=10)
+        self.assertEqual([op[0] for op in lazy.optimize().pipeline], ['sort', 'select'])
+        self.assertEqual(lazy.compute(), 15)
+
+    def test_dataset_lazy_scalar_select_not_pushed_through_add_dimension(self):
+        table = self.table.reindex(vdims=['Weight'])
+        lazy = table.lazy().add_dimension('Extra', 0, 1, vdim=True).select(Gender='M', Age=10)
+        self.assertEqual([op[0] for op in lazy.optimize().pipeline],
+                         ['add_dimension', 'select'])
+        eager = table.add_dimension('Extra', 0, 1, vdim=True).select(Gender='M', Age=10)
+        self.assertEqual(lazy.compute(), eager)
+
+    def test_dataset_lazy_dframe(self):
+        if pd is None:
+            raise SkipTest("Pandas not available")
+        lazy = self.table.lazy().select(Gender='M')
+        self.assertEqual(list(lazy.dframe()['Age']), [10, 16])
+
     # Casting
 
     def test_dataset_array_ht(self):
@@ -373,6 +428,23 @@ class ArrayDatasetTest(HomogeneousColumnTypes, ComparisonTestCase):
         self.data_instance_type = np.ndarray
         self.init_data()
 
+    def test_dataset_reindex_shares_data(self):
+        dataset = Dataset(np.random.rand(10, 3), kdims=['x', 'y'], vdims=['z'])
+        reindexed = dataset.reindex(kdims=['y'])
+        self.assertTrue(np.may_share_memory(reindexed.data, dataset.data))
+        self.assertEqual(reindexed.dimension_values('z'), dataset.dimension_values('z'))
+
+    def test_dataset_sort_sorted_shares_data(self):
+        self.assertIs(self.dataset_hm.sort('x').data, self.dataset_hm.data)
+
+    def test_dataset_reindex_view_read_only(self):
+        array = np.random.rand(10, 3)
+        dataset = Dataset(array.copy(), kdims=['x', 'y'], vdims=['z'])
+        reindexed = dataset.reindex(kdims=['y'])
+        with self.assertRaises(ValueError):
+            reindexed.data[0, 0] = -1
+        self.assertEqual(dataset.data, array)
+
 
 class DFDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
     """
@@ -387,6 +459,11 @@ class DFDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
         self.data_instance_type = pd.DataFrame
         self.init_data()
 
+    def test_dataset_redim_shares_data(self):
+        redimmed = self.dataset_hm.redim(x='Time')
+        self.assertTrue(np.may_share_memory(redimmed.dimension_values('Time'),
+                                            self.dataset_hm.dimension_values('x')))
+
 
 class DaskDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
     """
@@ -420,6 +497,24 @@ class DaskDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
     def test_dataset_boolean_index(self):
         raise SkipTest("Not supported")
 
+    def test_dataset_aggregate_ufunc_reduction(self):
+        aggregated = Dataset({'Gender':['M', 'F'], 'Weight':[18, 10], 'Height':[0.8, 0.8]},
+                             kdims=self.kdims[:1], vdims=self.vdims)
+        self.compare_dataset(self.table.aggregate(['Gender'], np.maximum), aggregated)
+
+    def test_dataset_aggregate_decomposable_reduction(self):
+        aggregated = Dataset({'Gender':['M', 'F'], 'Weight':[3, 0], 'Height':[0.2, 0]},
+                             kdims=self.kdims[:1], vdims=self.vdims)
+        self.compare_dataset(self.table.aggregate(['Gender'], np.ptp), aggregated)
+
+    def test_dataset_groupby_partitioned(self):
+        df = pd.DataFrame({'x': np.arange(20), 'y': np.arange(20)*2,
+                           'z': np.repeat([0, 1, 2, 3], 5)})
+        ddf = dd.from_pandas(df, npartitions=4, sort=False)
+        grouped = Dataset(ddf, kdims=['x', 'z'], vdims=['y']).groupby('z')
+        self.assertEqual(grouped.keys(), [0, 1, 2, 3])
+        self.assertEqual(grouped[2].dimension_values('y'), np.arange(10, 15)*2)
+
 
 class DictDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
     """
@@ -432,6 +527,37 @@ class DictDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
         self.data_instance_type = (dict, cyODict, OrderedDict)
         self.init_data()
 
+    def test_dataset_clone_shares_columns(self):
+        for clone in [self.dataset_hm.clone(), self.dataset_hm.relabel('A'),
+                      self.dataset_hm.redim(x='Time'), self.dataset_hm.select(),
+                      self.dataset_hm.reindex(vdims=['y'])]:
+            self.assertIs(clone.data[clone.dimensions()[-1].name],
+                          self.dataset_hm.data['y'])
+
+    def test_dataset_sort_sorted_shares_data(self):
+        self.assertIs(self.dataset_hm.sort('x').data, self.dataset_hm.data)
+
+    def test_dataset_input_mutation_not_shared(self):
+        xs, ys = np.arange(5), np.arange(5)*2.
+        dataset = Dataset({'x': xs, 'y': ys}, kdims=['x'], vdims=['y'])
+        clone = dataset.clone()
+        ys[:] = 0
+        self.assertEqual(dataset.dimension_values('y'), np.arange(5)*2.)
+        self.assertEqual(clone.dimension_values('y'), np.arange(5)*2.)
+
+    def test_dataset_dimension_values_mutation_not_shared(self):
+        clone = self.dataset_hm.clone()
+        values = clone.dimension_values('y')
+        values[:] = 0
+        self.assertEqual(clone.dimension_values('y'), np.array(self.y_ints))
+        self.assertEqual(self.dataset_hm.dimension_values('y'), np.array(self.y_ints))
+
+    def test_dataset_shared_columns_read_only(self):
+        clone = self.dataset_hm.redim(x='Time')
+        with self.assertRaises(ValueError):
+            clone.data['y'][0] = -1
+        self.assertEqual(self.dataset_hm.dimension_values('y'), np.array(self.y_ints))
+
 
 
 class NdDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
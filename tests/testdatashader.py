@@ -0,0 +1,181 @@
+"""
+Tests of the caching of the datashader aggregate and shade operations.
+"""
+import gc
+from unittest import SkipTest
+
+import param
+import numpy as np
+
+from holoviews import Points, NdOverlay
+from holoviews.element import GridImage
+from holoviews.element.comparison import ComparisonTestCase
+
+try:
+    import xarray as xr
+    import datashader as ds
+    from holoviews.operation.datashader import AggregateCache, aggregate, shade
+except ImportError:
+    raise SkipTest("Could not import datashader, skipping datashader "
+                   "operation tests.")
+
+
+def aggregate_instance(**params):
+    op = aggregate.instance(**params)
+    op.p = param.ParamOverrides(op, {})
+    return op
+
+
+class nested(ds.reductions.Reduction):
+    """
+    Reduction wrapping another reduction on the same column.
+    """
+
+    def __init__(self, column, reduction):
+        super(nested, self).__init__(column)
+        self.reduction = reduction
+
+
+
+class AggregateCacheTests(ComparisonTestCase):
+
+    def setUp(self):
+        self.cache = AggregateCache(size=2)
+        self.points = Points(np.random.rand(10, 3), vdims=['z'])
+
+    def test_cache_hit(self):
+        self.cache.set(self.points, ('params',), 'agg')
+        self.assertEqual(self.cache.get(self.points, ('params',)), 'agg')
+
+    def test_cache_miss_different_element(self):
+        self.cache.set(self.points, ('params',), 'agg')
+        other = self.points.clone()
+        self.assertEqual(self.cache.get(other, ('params',)), None)
+
+    def test_cache_miss_different_params(self):
+        self.cache.set(self.points, ('params',), 'agg')
+        self.assertEqual(self.cache.get(self.points, ('other',)), None)
+
+    def test_cache_miss_changed_aggregator_column(self):
+        params = aggregate_instance(aggregator=ds.mean('z'))._cache_params()
+        self.cache.set(self.points, params, 'agg')
+        changed = aggregate_instance(aggregator=ds.mean('y'))._cache_params()
+        self.assertEqual(self.cache.get(self.points, changed), None)
+        self.assertEqual(self.cache.get(self.points, params), 'agg')
+
+    def test_cache_miss_column_changed_in_place(self):
+        agg_fn = ds.mean('z')
+        op = aggregate_instance(aggregator=agg_fn)
+        self.cache.set(self.points, op._cache_params(), 'agg')
+        agg_fn.column = 'y'
+        self.assertEqual(self.cache.get(self.points, op._cache_params()), None)
+
+    def test_cache_miss_different_nested_reduction(self):
+        params = aggregate_instance(aggregator=nested('z', ds.mean('z')))._cache_params()
+        self.cache.set(self.points, params, 'agg')
+        changed = aggregate_instance(aggregator=nested('z', ds.max('z')))._cache_params()
+        self.assertEqual(self.cache.get(self.points, changed), None)
+        same = aggregate_instance(aggregator=nested('z', ds.mean('z')))._cache_params()
+        self.assertEqual(self.cache.get(self.points, same), 'agg')
+
+    def test_cache_params_unhashable_aggregator(self):
+        agg_fn = ds.mean('z')
+        agg_fn.weights = np.arange(3)
+        self.assertIs(aggregate_instance(aggregator=agg_fn)._cache_params(), None)
+
+    def test_aggregate_returns_cached(self):
+        op = aggregate_instance(aggregator=ds.mean('z'))
+        op.cache = self.cache
+        self.cache.set(self.points, op._cache_params(), 'agg')
+        self.assertEqual(op._process(self.points), 'agg')
+
+    def test_cache_evicts_least_recently_used(self):
+        points = [self.points.clone() for _ in range(3)]
+        self.cache.set(points[0], (), 0)
+        self.cache.set(points[1], (), 1)
+        self.cache.get(points[0], ())
+        self.cache.set(points[2], (), 2)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.get(points[0], ()), 0)
+        self.assertEqual(self.cache.get(points[1], ()), None)
+        self.assertEqual(self.cache.get(points[2], ()), 2)
+
+    def test_cache_entry_expires_with_element(self):
+        self.cache.set(self.points.clone(), (), 'agg')
+        gc.collect()
+        self.cache.get(self.points, ())
+        self.assertEqual(len(self.cache), 0)
+
+    def test_cache_clear(self):
+        self.cache.set(self.points, (), 'agg')
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+
+class ShadeTests(ComparisonTestCase):
+
+    def setUp(self):
+        self.cache_size = shade._colormap_cache_size
+        shade._colormaps.clear()
+
+    def tearDown(self):
+        shade._colormap_cache_size = self.cache_size
+        shade._colormaps.clear()
+
+    def overlay(self):
+        xs, ys = np.linspace(0.5, 2.5, 3), np.linspace(0.5, 1.5, 2)
+        images = {}
+        for i, c in enumerate('abc'):
+            array = xr.DataArray(np.arange(6).reshape(2, 3)+i, name='z Count',
+                                 coords=[('y', ys), ('x', xs)])
+            images[c] = GridImage(array, kdims=['x', 'y'], vdims=['z Count'],
+                                  datatype=['xarray'])
+        return NdOverlay(images, kdims=['z'])
+
+    def test_concatenate_matches_xarray_concat(self):
+        overlay = self.overlay()
+        concatenated = shade.concatenate(overlay).data
+        expected = xr.concat([v.data.transpose() for v in overlay.values()],
+                             dim='z').transpose()
+        if 'z' not in expected.coords:
+            # Default coordinates were dropped in xarray 0.9
+            expected.coords['z'] = np.arange(len(overlay))
+        self.assertEqual(dict(concatenated.dims), dict(expected.dims))
+        self.assertEqual(concatenated['z Count'].dims, expected['z Count'].dims)
+        self.assertEqual(sorted(concatenated.coords), sorted(expected.coords))
+        for coord in expected.coords:
+            self.assertEqual(concatenated.coords[coord].values,
+                             expected.coords[coord].values)
+        self.assertEqual(concatenated['z Count'].values,
+                         expected['z Count'].values)
+
+    def test_concatenate_requires_ndoverlay(self):
+        with self.assertRaises(ValueError):
+            shade.concatenate(self.overlay().last)
+
+    def test_sample_cmap_vectorized(self):
+        cmap = lambda v: np.column_stack([v, v, v, np.ones(len(v))])
+        self.assertEqual(shade.sample_cmap(cmap, 3),
+                         ['#000000', '#7f7f7f', '#ffffff'])
+
+    def test_sample_cmap_scalar(self):
+        cmap = lambda v: (float(v), 0, 1-float(v))
+        colors = [shade.rgb2hex(cmap(v)) for v in np.linspace(0, 1, 5)]
+        self.assertEqual(shade.sample_cmap(cmap, 5), colors)
+
+    def test_sample_cmap_cached(self):
+        calls = []
+        def cmap(v):
+            calls.append(v)
+            return np.column_stack([v, v, v])
+        shade.sample_cmap(cmap, 4)
+        shade.sample_cmap(cmap, 4)
+        self.assertEqual(len(calls), 1)
+
+    def test_sample_cmap_cache_bounded(self):
+        shade._colormap_cache_size = 2
+        cmaps = [lambda v: np.column_stack([v, v, v]) for _ in range(3)]
+        for cmap in cmaps:
+            shade.sample_cmap(cmap, 2)
+        self.assertEqual(list(shade._colormaps), [(cmaps[1], 2), (cmaps[2], 2)])
@@ -83,6 +83,26 @@ class DimensionTest(ComparisonTestCase):
         dim = Dimension('test', values=df['col'])
         self.assertEqual(dim.values, self.values2)
 
+    def test_dimension_eq_sanitized(self):
+        dim = Dimension('A dimension')
+        self.assertTrue(dim == 'A dimension')
+        self.assertTrue(dim == 'A_dimension')
+        self.assertFalse(dim == 'B_dimension')
+
+    def test_dimension_hash_updates_with_params(self):
+        dim = Dimension('test')
+        initial = hash(dim)
+        dim.unit = 'm'
+        self.assertEqual(hash(dim), hash(Dimension('test', unit='m')))
+        self.assertNotEqual(hash(dim), initial)
+
+    def test_dimension_eq_updates_with_name(self):
+        dim = Dimension('A dimension')
+        self.assertTrue(dim == 'A_dimension')
+        dim.name = 'B dimension'
+        self.assertTrue(dim == 'B_dimension')
+        self.assertFalse(dim == 'A_dimension')
+
 
 class DimensionedTest(ComparisonTestCase):
 
@@ -116,3 +136,22 @@ class DimensionedTest(ComparisonTestCase):
     def test_dimensionsed_redim_dict_range(self):
         redimensioned = Dimensioned('Arbitrary Data', kdims=['x']).redim(x={'range': (0, 10)})
         self.assertEqual(redimensioned.kdims[0].range, (0, 10))
+
+    def test_dimensioned_get_dimension(self):
+        dimensioned = Dimensioned('Arbitrary Data', kdims=['x'], vdims=['y'])
+        self.assertIs(dimensioned.get_dimension('y'), dimensioned.vdims[0])
+        self.assertIs(dimensioned.get_dimension(0), dimensioned.kdims[0])
+        self.assertEqual(dimensioned.get_dimension('z'), None)
+
+    def test_dimensioned_get_dimension_index_sanitized(self):
+        dimensioned = Dimensioned('Arbitrary Data', kdims=['A x'], vdims=['A y'])
+        self.assertEqual(dimensioned.get_dimension_index('A y'), 1)
+        self.assertEqual(dimensioned.get_dimension_index('A_y'), 1)
+        self.assertEqual(dimensioned.get_dimension_index(Dimension('A x')), 0)
+
+    def test_dimensioned_lookup_updates_with_kdims(self):
+        dimensioned = Dimensioned('Arbitrary Data', kdims=['x'], vdims=['y'])
+        self.assertEqual(dimensioned.get_dimension_index('y'), 1)
+        dimensioned.kdims.append(Dimension('z'))
+        self.assertEqual(dimensioned.get_dimension_index('y'), 2)
+        self.assertEqual(dimensioned.get_dimension('z'), 'z')
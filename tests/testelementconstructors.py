@@ -36,6 +36,24 @@ class ElementConstructorTest(ComparisonTestCase):
     def test_path_ziplist_construct(self):
         self.assertEqual(Path([list(zip(self.xs, self.sin)), list(zip(self.xs, self.cos))]), self.path)
 
+    def test_path_ragged_construct(self):
+        coords = np.concatenate(self.path.data)
+        offsets = np.array([0, len(self.xs), 2*len(self.xs)])
+        path = Path.from_ragged(coords, offsets)
+        self.assertEqual(path, self.path)
+        self.assertIs(path.ragged()[0], coords)
+
+    def test_path_ragged_export(self):
+        coords, offsets = self.path.ragged()
+        self.assertEqual(offsets, np.array([0, len(self.xs), 2*len(self.xs)]))
+        self.assertEqual(coords, np.concatenate(self.path.data))
+
+    def test_path_ragged_shared_memory(self):
+        coords = np.concatenate(self.path.data)
+        path = Path.from_ragged(coords, [0, len(self.xs), 2*len(self.xs)])
+        path.data[1][0, 1] = 10
+        self.assertEqual(path.dimension_values('y')[len(self.xs)], 10)
+
     def test_chart_zip_construct(self):
         self.assertEqual(Histogram(list(zip(self.hxs, self.sin))), self.histogram)
 
@@ -72,3 +90,14 @@ class ElementConstructorTest(ComparisonTestCase):
                            'z': [[np.NaN, 0, 0], [0, np.NaN, 2], [0, 2, np.NaN]]},
                           kdims=['x', 'y'], vdims=['z'])
         self.assertEqual(hmap.gridded, dataset)
+
+    def test_heatmap_aggregate_lazy(self):
+        hmap = HeatMap([('A', 'a', 1), ('B', 'b', 2)])
+        self.assertIs(hmap._gridded, None)
+        self.assertIs(hmap.gridded, hmap.gridded)
+
+    def test_heatmap_construct_duplicates_first_valid(self):
+        hmap = HeatMap([('A', 'a', np.NaN), ('A', 'a', 1), ('B', 'b', 2), ('B', 'b', 3)])
+        dataset = Dataset({'x': ['A', 'B'], 'y': ['a', 'b'], 'z': [[1, np.NaN], [np.NaN, 2]]},
+                          kdims=['x', 'y'], vdims=['z'])
+        self.assertEqual(hmap.gridded, dataset)
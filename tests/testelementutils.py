@@ -1,6 +1,6 @@
 import numpy as np
 
-from holoviews.element.util import compute_edges
+from holoviews.element.util import compute_edges, lttb_indices, minmax_indices
 from holoviews.element.comparison import ComparisonTestCase
 
 class TestComputeEdges(ComparisonTestCase):
@@ -24,3 +24,30 @@ class TestComputeEdges(ComparisonTestCase):
     def test_uneven_edges(self):
         with self.assertRaisesRegexp(ValueError, "Centered bins"):
             compute_edges(self.array3)
+
+
+class TestDownsampleIndices(ComparisonTestCase):
+    """
+    Tests for the lttb_indices and minmax_indices functions.
+    """
+
+    def setUp(self):
+        self.xs = np.arange(11)
+        self.ys = np.array([1, 5, np.nan, 2, 3, 3, 3, np.nan, np.nan, 0, 9])
+
+    def test_minmax_indices(self):
+        indices = minmax_indices(self.xs, self.ys, [0, 4, 7, 9, 11])
+        self.assertEqual(indices, np.array([0, 1, 4, 4, 7, 7, 9, 10]))
+
+    def test_minmax_indices_2d(self):
+        indices = minmax_indices(self.xs, np.vstack([self.ys, -self.ys]), [0, 4, 11])
+        self.assertEqual(indices, np.array([[0, 1, 9, 10], [0, 1, 9, 10]]))
+
+    def test_lttb_indices_endpoints(self):
+        indices = lttb_indices(self.xs, self.ys, 4)
+        self.assertEqual(indices, np.array([0, 1, 9, 10]))
+
+    def test_lttb_indices_2d(self):
+        ys = np.random.RandomState(42).randn(3, 100)
+        indices = lttb_indices(np.arange(100), ys, 10)
+        self.assertEqual(indices[1], lttb_indices(np.arange(100), ys[1], 10))
@@ -2,10 +2,16 @@
 Unit test of the (non-rendering) exporters and importers.
 """
 
+import gc
 import os
+import pickle
+import zipfile
+from multiprocessing import Pool
+
 import numpy as np
-from holoviews import Image, Layout
-from holoviews.core.io import Serializer, Pickler, Unpickler, Deserializer
+from holoviews import Image, Layout, HoloMap, DynamicMap
+from holoviews.core.io import (Serializer, Pickler, Unpickler, Deserializer,
+                               ArchivePickler, SharedMemory)
 from holoviews.element.comparison import ComparisonTestCase
 
 
@@ -187,3 +193,159 @@ class TestPicklerAdvanced(ComparisonTestCase):
                                 entries=['Image.I(L)'])
         self.assertEqual(single_layout, loaded)
 
+
+
+
+class TestColumnarPickler(ComparisonTestCase):
+    """
+    Test the columnar .hvz format, which stores arrays and HoloMap
+    frames as separate archive members.
+    """
+
+    def setUp(self):
+        self.image1 = Image(np.array([[1,2],[4,5]]))
+        self.image2 = Image(np.array([[5,4],[3,2]]))
+        self.hmap = HoloMap({i: Image(np.arange(12.).reshape(3, 4)*i)
+                             for i in range(3)}, kdims=['z'])
+
+    def tearDown(self):
+        for f in os.listdir('.'):
+            if f.endswith('.hvz'):
+                os.remove(f)
+
+    def test_columnar_save_load_mmap(self):
+        Pickler.instance(columnar=True, compress=False).save(self.image1, 'test_columnar_mmap')
+        loaded = Unpickler.load('test_columnar_mmap.hvz')
+        self.assertEqual(loaded, self.image1)
+        self.assertIsInstance(loaded.data, np.memmap)
+
+    def test_columnar_save_load_compressed(self):
+        Pickler.instance(columnar=True).save(self.image2, 'test_columnar_compressed')
+        loaded = Unpickler.load('test_columnar_compressed.hvz')
+        self.assertEqual(loaded, self.image2)
+        self.assertNotIsInstance(loaded.data, np.memmap)
+
+    def test_columnar_large_arrays_stored_by_default(self):
+        image = Image(np.random.rand(100, 100))
+        Pickler.instance(columnar=True).save(image, 'test_columnar_stored')
+        loaded = Unpickler.load('test_columnar_stored.hvz')
+        self.assertEqual(loaded, image)
+        self.assertIsInstance(loaded.data, np.memmap)
+        self.assertEqual(loaded.data.offset % ArchivePickler.alignment, 0)
+        with zipfile.ZipFile('test_columnar_stored.hvz') as f:
+            infos = f.infolist()
+        stored = [info.compress_type == zipfile.ZIP_STORED for info in infos]
+        large = [info.file_size >= image.data.nbytes for info in infos]
+        self.assertEqual(stored, large)
+        self.assertEqual(sum(stored), 1)
+
+    def test_columnar_stored_size_none_compresses_arrays(self):
+        image = Image(np.random.rand(100, 100))
+        Pickler.instance(columnar=True, stored_size=None).save(image, 'test_columnar_deflated')
+        loaded = Unpickler.load('test_columnar_deflated.hvz')
+        self.assertEqual(loaded, image)
+        self.assertNotIsInstance(loaded.data, np.memmap)
+
+    def test_columnar_array_alignment(self):
+        Pickler.instance(columnar=True, compress=False).save(self.image1, 'test_columnar_aligned')
+        loaded = Unpickler.load('test_columnar_aligned.hvz')
+        self.assertEqual(loaded.data.offset % ArchivePickler.alignment, 0)
+
+    def test_columnar_serialize_deserialize(self):
+        data, _ = Pickler.instance(columnar=True)(self.image1)
+        self.assertEqual(Unpickler(data), self.image1)
+
+    def test_columnar_layout_entries(self):
+        Pickler.instance(columnar=True).save(self.image1+self.image2, 'test_columnar_entries')
+        entries = Unpickler.entries('test_columnar_entries.hvz')
+        self.assertEqual(entries, ['Image.I', 'Image.II'])
+        loaded = Unpickler.load('test_columnar_entries.hvz', entries=['Image.II'])
+        self.assertEqual(loaded, self.image2)
+
+    def test_columnar_holomap(self):
+        Pickler.instance(columnar=True, compress=False).save(self.hmap, 'test_columnar_holomap')
+        self.assertEqual(Unpickler.load('test_columnar_holomap.hvz'), self.hmap)
+
+    def test_columnar_holomap_lazy(self):
+        Pickler.instance(columnar=True).save(self.hmap, 'test_columnar_holomap_lazy')
+        loaded = Unpickler.instance(lazy=True).load('test_columnar_holomap_lazy.hvz')
+        self.assertIsInstance(loaded, DynamicMap)
+        self.assertEqual(len(loaded), 0)
+        self.assertEqual(loaded[1], self.hmap[1])
+        self.assertEqual(loaded.keys(), [1])
+
+    def test_compress_flag(self):
+        Pickler.instance(compress=True).save(self.image1, 'test_compress_flag')
+        with zipfile.ZipFile('test_compress_flag.hvz') as f:
+            compress_types = [info.compress_type for info in f.infolist()]
+        self.assertEqual(set(compress_types), {zipfile.ZIP_DEFLATED})
+
+
+def _shared_sum(obj):
+    return isinstance(obj.data, np.memmap), float(obj.data.sum())
+
+
+class TestSharedMemory(ComparisonTestCase):
+    """
+    Tests of sharing objects through memory-mapped segments.
+    """
+
+    def setUp(self):
+        self.image1 = Image(np.random.rand(100, 100))
+        self.image2 = Image(np.random.rand(4, 4))
+        self.memory = SharedMemory()
+
+    def tearDown(self):
+        self.memory.close()
+
+    def test_shared_image_memmapped(self):
+        loaded = self.memory.share(self.image1).load()
+        self.assertEqual(loaded, self.image1)
+        self.assertIsInstance(loaded.data, np.memmap)
+
+    def test_shared_small_array_inline(self):
+        loaded = self.memory.share(self.image2).load()
+        self.assertEqual(loaded, self.image2)
+        self.assertNotIsInstance(loaded.data, np.memmap)
+        self.assertEqual(os.listdir(self.memory.path), [])
+
+    def test_shared_handle_pickle_loads_object(self):
+        handle = self.memory.share(self.image1)
+        data = pickle.dumps(handle, protocol=2)
+        self.assertTrue(len(data) < self.image1.data.nbytes)
+        self.assertEqual(pickle.loads(data), self.image1)
+
+    def test_shared_array_written_once(self):
+        hmap = HoloMap({i: Image(self.image1.data) for i in range(3)})
+        loaded = self.memory.share(hmap).load()
+        self.assertEqual(loaded, hmap)
+        self.assertEqual(len(os.listdir(self.memory.path)), 1)
+
+    def test_shared_memory_close_removes_segments(self):
+        self.memory.share(self.image1)
+        path = self.memory.path
+        self.memory.close()
+        self.assertFalse(os.path.exists(path))
+        with self.assertRaises(ValueError):
+            self.memory.share(self.image1)
+
+    def test_shared_handle_keeps_memory_alive(self):
+        handle = SharedMemory().share(self.image1)
+        gc.collect()
+        path = handle._memory.path
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(handle.load(), self.image1)
+        del handle
+        gc.collect()
+        self.assertFalse(os.path.exists(path))
+
+    def test_shared_handle_loaded_in_worker(self):
+        handles = [SharedMemory().share(self.image1)]
+        pool = Pool(1)
+        try:
+            # A worker failing to unpickle the handle may never return
+            results = pool.map_async(_shared_sum, handles).get(60)
+        finally:
+            pool.terminate()
+            pool.join()
+        self.assertEqual(results, [(True, float(self.image1.data.sum()))])
@@ -165,6 +165,56 @@ class HoloMapTest(ComparisonTestCase):
         expected = Dataset({'x':self.xs, 'y': self.ys * 4.5}, kdims=['x'], vdims=['y'])
         self.compare_dataset(collapsed, expected)
 
+    def test_columns_collapse_spreadfn(self):
+        collapsed = HoloMap({i: Dataset({'x':self.xs, 'y': self.ys * i},
+                                        kdims=['x'], vdims=['y'])
+                             for i in range(10)}, kdims=['z']).collapse('z', np.mean, np.std)
+        expected = Dataset({'x':self.xs, 'y': self.ys * 4.5,
+                            'y_std': self.ys * np.std(np.arange(10), ddof=1)},
+                           kdims=['x'], vdims=['y', 'y_std'])
+        self.compare_dataset(collapsed, expected)
+
+    def test_columns_collapse_unsorted_keys(self):
+        collapsed = HoloMap({i: Dataset({'x':self.xs[::-1], 'y': self.ys * i},
+                                        kdims=['x'], vdims=['y'])
+                             for i in range(10)}, kdims=['z']).collapse('z', np.mean)
+        self.assertEqual(collapsed.dimension_values('x'), np.array(self.xs[::-1]))
+        self.assertEqual(collapsed.dimension_values('y'), self.ys * 4.5)
+
+    def test_columns_collapse_spreadfn_key_order(self):
+        hmap = HoloMap({i: Dataset({'x':self.xs, 'y': self.ys * i},
+                                   kdims=['x'], vdims=['y'])
+                        for i in range(10)}, kdims=['z'])
+        reversed_hmap = hmap.clone([(k, v.clone({'x': self.xs[::-1], 'y': v['y'][::-1]}))
+                                    for k, v in hmap.items()])
+        collapsed = hmap.collapse('z', np.mean, np.std)
+        reversed_collapsed = reversed_hmap.collapse('z', np.mean, np.std)
+        self.assertEqual(collapsed.dimension_values('y_std'),
+                         reversed_collapsed.dimension_values('y_std')[::-1])
+
+    def test_columns_collapse_non_numpy_function(self):
+        collapsed = HoloMap({i: Dataset({'x':self.xs, 'y': self.ys * i},
+                                        kdims=['x'], vdims=['y'])
+                             for i in range(10)}, kdims=['z']).collapse('z', len)
+        self.assertEqual(collapsed.dimension_values('y'), np.full(len(self.xs), 10))
+
+    def test_columns_collapse_empty(self):
+        collapsed = HoloMap({i: Dataset({'x': [], 'y': []}, kdims=['x'], vdims=['y'])
+                             for i in range(3)}, kdims=['z']).collapse('z', np.mean)
+        self.assertEqual(len(collapsed), 0)
+
+    def test_holomap_dataframe_table(self):
+        hmap = HoloMap({(i, chr(65+i)): Dataset({'x':self.xs, 'y': self.ys * i},
+                                                kdims=['x'], vdims=['y'],
+                                                datatype=['dataframe'])
+                        for i in range(3)}, kdims=['z', 'w'])
+        table = hmap.table()
+        self.assertEqual(table.dimensions('all', True), ['z', 'w', 'x', 'y'])
+        self.assertEqual(table.dimension_values('z'), np.repeat(np.arange(3), len(self.xs)))
+        self.assertEqual(table.dimension_values('w'), np.repeat(['A', 'B', 'C'], len(self.xs)))
+        self.assertEqual(table.dimension_values('y'),
+                         np.concatenate([self.ys * i for i in range(3)]))
+
 
     def test_columns_sample_homogeneous(self):
         samples = self.columns.sample([0, 5, 10]).dimension_values('y')
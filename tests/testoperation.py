@@ -0,0 +1,177 @@
+"""
+Unit tests of the ElementOperations in holoviews.operation.element
+"""
+
+import numpy as np
+
+from holoviews import Dimension, HoloMap, NdOverlay
+from holoviews.element import Image, Raster, QuadMesh, Contours, Polygons, Curve
+from holoviews.element.comparison import ComparisonTestCase
+from holoviews.operation.element import contours, convolve, gradient, downsample1d
+
+
+class ContoursOperationTests(ComparisonTestCase):
+
+    def setUp(self):
+        self.array = np.array([[0, 1, 0], [1, 2, 1], [0, 1, 0]])
+        self.image = Image(self.array)
+        self.diamond = np.array([(-1/6., 0), (0, -1/6.), (1/6., 0),
+                                 (0, 1/6.), (-1/6., 0)])
+
+    def test_image_contours(self):
+        op_contours = contours(self.image, levels=[1.5], overlaid=False)
+        contour = Contours([self.diamond], level=1.5, group='Level',
+                           vdims=self.image.vdims)
+        self.assertEqual(op_contours, NdOverlay({1.5: contour}, kdims=['Levels']))
+
+    def test_image_contours_overlaid(self):
+        op_contours = contours(self.image, levels=[1.5])
+        self.assertEqual(op_contours.get(0), self.image)
+        self.assertEqual(op_contours.get(1).keys(), [1.5])
+
+    def test_image_contours_no_crossing(self):
+        op_contours = contours(self.image, levels=[2.5], overlaid=False)
+        self.assertEqual(op_contours[2.5].data, [])
+
+    def test_image_contours_multiple_levels(self):
+        op_contours = contours(self.image, levels=[0.5, 1.5], overlaid=False)
+        self.assertEqual(op_contours.keys(), [0.5, 1.5])
+        self.assertEqual(len(op_contours[0.5].data), 4)
+        self.assertEqual(op_contours[1.5].data[0], self.diamond)
+
+    def test_image_contours_closed(self):
+        ys, xs = np.mgrid[-1:1:51j, -1:1:51j]
+        # Contours are placed at the sample centers, so the bounds are
+        # padded by half a sample to align the centers with the grid
+        pad = 1/50.
+        image = Image(np.exp(-(xs**2+ys**2)), bounds=(-1-pad, -1-pad, 1+pad, 1+pad))
+        op_contours = contours(image, levels=[0.5], overlaid=False)
+        path = op_contours[0.5].data[0]
+        self.assertEqual(path[0], path[-1])
+        radii = np.sqrt((path**2).sum(axis=1))
+        self.assertTrue(np.allclose(radii, np.sqrt(np.log(2)), atol=1e-3))
+
+    def test_image_contours_nan_cells_skipped(self):
+        array = self.array.astype(float)
+        array[0, 0] = np.NaN
+        op_contours = contours(Image(array), levels=[0.5], overlaid=False)
+        self.assertEqual(len(op_contours[0.5].data), 3)
+
+    def test_raster_contours(self):
+        op_contours = contours(Raster(self.array), levels=[1.5], overlaid=False)
+        path = op_contours[1.5].data[0]
+        self.assertEqual(path[:, 0].min(), 0.5)
+        self.assertEqual(path[:, 0].max(), 1.5)
+
+    def test_quadmesh_contours(self):
+        qmesh = QuadMesh((np.array([0., 1, 2]), np.array([0., 1, 2]), self.array))
+        op_contours = contours(qmesh, levels=[1.5], overlaid=False)
+        self.assertEqual(op_contours[1.5].data[0], self.diamond*3+1)
+
+    def test_image_filled_contours(self):
+        op_contours = contours(self.image, levels=[0.5, 1.5], filled=True,
+                               overlaid=False)
+        self.assertEqual(op_contours.keys(), [0.5])
+        polygons = op_contours[0.5]
+        self.assertIsInstance(polygons, Polygons)
+        outer, hole = polygons.data
+        self.assertEqual(hole, self.diamond[::-1])
+        self.assertEqual(outer[0], outer[-1])
+
+    def test_filled_contours_single_level_raises(self):
+        with self.assertRaises(ValueError):
+            contours(self.image, levels=[0.5], filled=True)
+
+    def test_holomap_contours_threaded(self):
+        hmap = HoloMap({i: Image(self.array*i) for i in range(1, 5)})
+        serial = contours(hmap, levels=[0.5], overlaid=False)
+        threaded = contours(hmap, levels=[0.5], overlaid=False, threads=4)
+        self.assertEqual(serial, threaded)
+
+
+
+class ConvolveOperationTests(ComparisonTestCase):
+
+    def setUp(self):
+        prng = np.random.RandomState(42)
+        self.image = Image(prng.rand(23, 31))
+        self.kernel = Image(prng.rand(5, 4))
+
+    def test_convolve_identity_kernel(self):
+        kernel = Image(np.array([[0, 0, 0], [0, 1, 0], [0, 0, 0]]))
+        convolved = convolve(self.image * kernel)
+        self.assertEqual(convolved, Image(self.image.data, group='Convolution'))
+
+    def test_convolve_tiled(self):
+        overlay = self.image * self.kernel
+        self.assertEqual(convolve(overlay, tile_size=6), convolve(overlay))
+
+    def test_convolve_tiled_threaded(self):
+        overlay = self.image * self.kernel
+        self.assertEqual(convolve(overlay, tile_size=6, threads=3),
+                         convolve(overlay))
+
+
+
+class GradientOperationTests(ComparisonTestCase):
+
+    def setUp(self):
+        self.array = np.array([[0, 1, 3], [2, 4, 7], [3, 5, 9]])
+
+    def test_gradient(self):
+        expected = np.sqrt(np.array([[1+4, 4+9], [4+1, 9+1]]))
+        self.assertEqual(gradient(Image(self.array)),
+                         Image(expected, group='Gradient'))
+
+    def test_gradient_blocked(self):
+        array = np.random.RandomState(42).rand(37, 21)
+        self.assertEqual(gradient(Image(array), block_size=4, threads=2),
+                         gradient(Image(array)))
+
+    def test_gradient_cyclic(self):
+        image = Image(np.array([[0, 0.9], [0.1, 0]]),
+                      vdims=[Dimension('z', cyclic=True, range=(0, 1))])
+        grad = gradient(image)
+        self.assertEqual(grad.data, np.array([[np.sqrt(0.02)]]))
+
+
+class Downsample1DOperationTests(ComparisonTestCase):
+
+    def setUp(self):
+        self.xs = np.arange(1000.)
+        self.ys = np.sin(self.xs/50.)
+        self.ys[500] = 5
+        self.curve = Curve((self.xs, self.ys))
+
+    def test_downsample_lttb(self):
+        downsampled = downsample1d(self.curve, width=50, dynamic=False)
+        xs = downsampled.dimension_values(0)
+        self.assertEqual(len(xs), 50)
+        self.assertEqual(xs[[0, -1]], np.array([0, 999.]))
+        self.assertEqual(downsampled.range(1)[1], 5)
+
+    def test_downsample_minmax(self):
+        downsampled = downsample1d(self.curve, width=10, algorithm='minmax',
+                                   dynamic=False)
+        ys = downsampled.dimension_values(1)
+        self.assertEqual(len(ys), 20)
+        self.assertEqual(downsampled.range(1), (self.ys.min(), 5))
+
+    def test_downsample_x_range(self):
+        downsampled = downsample1d(self.curve, width=50, x_range=(100, 200),
+                                   dynamic=False)
+        self.assertEqual(downsampled.range(0), (99, 201))
+
+    def test_downsample_no_reduction(self):
+        downsampled = downsample1d(self.curve, width=2000, dynamic=False)
+        self.assertEqual(downsampled, self.curve)
+
+    def test_downsample_overlay_shared_xs(self):
+        overlay = NdOverlay({i: Curve((self.xs, self.ys*i)) for i in range(1, 4)})
+        downsampled = downsample1d(overlay, width=50, dynamic=False)
+        for i, curve in downsampled.items():
+            self.assertEqual(curve, downsample1d(overlay[i], width=50, dynamic=False))
+
+    def test_downsample_dynamic(self):
+        downsampled = downsample1d(self.curve, width=50)
+        self.assertEqual(len(downsampled[()]), 50)
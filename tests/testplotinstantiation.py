@@ -14,7 +14,8 @@ from holoviews import (Dimension, Overlay, DynamicMap, Store,
                        NdOverlay, GridSpace, HoloMap, Layout)
 from holoviews.element import (Curve, Scatter, Image, VLine, Points,
                                HeatMap, QuadMesh, Spikes, ErrorBars,
-                               Scatter3D, Path, Polygons, Bars)
+                               Scatter3D, Path, Polygons, Bars, Area,
+                               BoxWhisker)
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.streams import PositionXY, PositionX
 from holoviews.plotting import comms
@@ -140,6 +141,102 @@ class TestMPLPlotInstantiation(ComparisonTestCase):
                    'cannot use to scale Points size.\n' % plot.name)
         self.assertEqual(log_msg, warning)
 
+    def test_spikes_update_in_place(self):
+        hmap = HoloMap({i: Spikes([(0, i+1), (1, i+2)], vdims=['y'])
+                        for i in range(2)})
+        plot = mpl_renderer.get_plot(hmap)
+        artist = plot.handles['artist']
+        plot.update((0,))
+        self.assertIs(plot.handles['artist'], artist)
+        self.assertEqual(artist.get_segments()[1], np.array([[1, 0], [1, 2]]))
+
+    def test_area_update_in_place(self):
+        hmap = HoloMap({i: Area([1, 2+i, 3]) for i in range(2)})
+        plot = mpl_renderer.get_plot(hmap)
+        artist = plot.handles['artist']
+        plot.update((0,))
+        self.assertIs(plot.handles['artist'], artist)
+        self.assertEqual(artist.get_paths()[0].vertices[:3],
+                         np.array([[0, 1], [1, 2], [2, 3]]))
+
+    def test_axis_settings_skipped_when_unchanged(self):
+        hmap = HoloMap({i: Curve([1, 2, 3], label=str(i)) for i in range(2)})
+        plot = mpl_renderer.get_plot(hmap)
+        axis = plot.handles['axis']
+        axis.set_xlabel('Changed')
+        plot.update((0,))
+        self.assertEqual(axis.get_xlabel(), 'Changed')
+
+    def test_anim_blit_artists(self):
+        hmap = HoloMap({i: Curve([1, 2, i]) for i in range(2)})
+        plot = mpl_renderer.get_plot(hmap)
+        self.assertEqual(plot._frame_artists(), [plot.handles['artist']])
+
+    def test_bars_plot(self):
+        hmap = HoloMap({i: Bars([('A', i+1), ('B', i+2)]) for i in range(2)})
+        plot = mpl_renderer.get_plot(hmap)
+        plot.update((0,))
+        self.assertEqual(plot.handles['axis'].get_ylabel(), 'y')
+
+    def test_box_whisker_plot(self):
+        hmap = HoloMap({i: BoxWhisker((['A']*5+['B']*5, np.arange(10)+i),
+                                      kdims=['x'], vdims=['y'])
+                        for i in range(2)})
+        plot = mpl_renderer.get_plot(hmap)
+        plot.update((0,))
+        self.assertEqual(plot.handles['axis'].get_ylabel(), 'y')
+
+    def test_get_frame_by_key_and_index(self):
+        curves = {(i, j): Curve([i, j]) for i in range(3) for j in range(2)}
+        hmap = HoloMap(curves, kdims=['a', 'b'])
+        plot = mpl_renderer.get_plot(hmap)
+        self.assertIs(plot._get_frame((1, 1)), curves[(1, 1)])
+        self.assertIs(plot._get_frame(3), curves[(1, 1)])
+        self.assertIs(plot._get_frame(10), curves[(2, 1)])
+
+    def test_get_frame_layout_different_keys(self):
+        hmap1 = HoloMap({i: Curve([i]) for i in range(3)}, kdims=['a'])
+        hmap2 = HoloMap({i: Curve([i, i]) for i in range(1, 3)}, kdims=['a'])
+        plot = mpl_renderer.get_plot(hmap1 + hmap2)
+        frame = plot._get_frame((2,))
+        self.assertIs(frame.HoloMap.I.main, hmap1[2])
+        self.assertIs(frame.HoloMap.II.main, hmap2[2])
+        frame = plot._get_frame(0)
+        self.assertIs(frame.HoloMap.I.main, hmap1[0])
+        self.assertEqual(len(frame.HoloMap.II.main), 0)
+
+    def test_dynamic_nth_key_index_extended(self):
+        dmap = DynamicMap(lambda x: Curve([x]), kdims=[Dimension('x', range=(0, 10))])
+        plot = mpl_renderer.get_plot(dmap)
+        plot.update((1,))
+        self.assertEqual(plot._nth_key(dmap, 1), (1,))
+        keys = plot._nth_keys[id(dmap)]
+        plot.update((2,))
+        self.assertIs(plot._nth_keys[id(dmap)], keys)
+        self.assertEqual(keys, list(dmap.data.keys()))
+        self.assertEqual(plot._nth_key(dmap, 2), (2,))
+
+    def test_dynamic_nth_key_index_evicted(self):
+        dmap = DynamicMap(lambda x: Curve([x]), cache_size=2,
+                          kdims=[Dimension('x', range=(0, 10))])
+        plot = mpl_renderer.get_plot(dmap)
+        for i in range(1, 6):
+            plot.update((i,))
+            self.assertEqual(plot._nth_key(dmap, 0), list(dmap.data.keys())[0])
+            self.assertEqual(plot._nth_key(dmap, 1), (i,))
+            self.assertEqual(plot._nth_keys[id(dmap)], list(dmap.data.keys()))
+        self.assertEqual(list(dmap.data.keys()), [(4,), (5,)])
+
+    def test_dynamic_keys_not_duplicated(self):
+        dmap = DynamicMap(lambda x: Curve([x]), kdims=[Dimension('x', range=(0, 10))])
+        plot = mpl_renderer.get_plot(dmap)
+        plot.update((1,))
+        plot.update((2,))
+        keys = list(plot.keys)
+        plot.update((1,))
+        self.assertEqual(plot.keys, keys)
+        self.assertEqual(len(set(keys)), len(keys))
+
 
 
 class TestBokehPlotInstantiation(ComparisonTestCase):
@@ -164,6 +261,16 @@ class TestBokehPlotInstantiation(ComparisonTestCase):
         extents = plot.get_extents(overlay, {})
         self.assertEqual(extents, (0, 0, 98, 98))
 
+    def test_batched_points_color_codes(self):
+        overlay = NdOverlay({i: Points(np.arange(i)) for i in range(1, 4)})
+        plot = bokeh_renderer.get_plot(overlay)
+        subplot = list(plot.subplots.values())[0]
+        data, mapping = subplot.get_batched_data(overlay, {})
+        cmapper = mapping['color']['transform']
+        codes = np.array(data['color']).astype(int)
+        self.assertEqual(codes, np.array([0, 1, 1, 2, 2, 2]))
+        self.assertEqual(len(cmapper.palette), 3)
+
     def _test_hover_info(self, element, tooltips):
         plot = bokeh_renderer.get_plot(element)
         plot.initialize_plot()
@@ -1,7 +1,12 @@
 from unittest import SkipTest
 
+import gc
+
 from holoviews.core.options import Store
+from holoviews.core.spaces import HoloMap
+from holoviews.element import Curve
 from holoviews.element.comparison import ComparisonTestCase
+from holoviews.plotting.util import RangeCache
 
 try:
     from holoviews.plotting.bokeh import util
@@ -10,6 +15,42 @@ except:
     bokeh_renderer = None
 
 
+class TestRangeCache(ComparisonTestCase):
+
+    def setUp(self):
+        self.hmap = HoloMap({i: Curve([i, i+2]) for i in range(3)})
+
+    def test_range_cache_compute(self):
+        cache = RangeCache(threads=2)
+        ranges = cache.compute(self.hmap.values())
+        self.assertEqual([r['y'] for r in ranges], [(0, 2), (1, 3), (2, 4)])
+        self.assertEqual(len(cache), 3)
+
+    def test_range_cache_reuses_ranges(self):
+        cache = RangeCache()
+        curve = self.hmap[0]
+        cache.set(curve, {'x': (0, 1), 'y': (-1, 1)})
+        self.assertEqual(cache.compute([curve])[0]['y'], (-1, 1))
+
+    def test_range_cache_discards_collected_elements(self):
+        cache = RangeCache()
+        cache.compute(self.hmap.values())
+        del self.hmap
+        gc.collect()
+        self.assertEqual(len(cache), 0)
+
+    def test_range_cache_load_summary(self):
+        summary = RangeCache().summary(self.hmap)
+        cache = RangeCache()
+        cache.load(self.hmap, summary)
+        self.assertEqual(cache.get(self.hmap[2])['y'], (2, 4))
+
+    def test_range_cache_load_mismatched_summary(self):
+        summary = {(0,): []}
+        with self.assertRaises(ValueError):
+            RangeCache().load(self.hmap, summary)
+
+
 class TestBokehUtils(ComparisonTestCase):
 
     def setUp(self):
@@ -0,0 +1,102 @@
+"""
+Tests of the Profiler instrumenting the plotting classes.
+"""
+import json
+import logging
+import os
+import tempfile
+
+import param
+
+from holoviews.element.comparison import ComparisonTestCase
+from holoviews.plotting.plot import Plot
+from holoviews.plotting.profiler import Profiler
+
+
+class ProfiledPlot(Plot):
+
+    def __init__(self, **params):
+        self.current_key = None
+        super(ProfiledPlot, self).__init__(**params)
+
+    def update(self, key):
+        self.current_key = key
+        return self.update_frame(key)
+
+    def update_frame(self, key):
+        return sum(range(1000))
+
+
+class ProfiledSubPlot(ProfiledPlot):
+
+    def update_frame(self, key):
+        return super(ProfiledSubPlot, self).update_frame(key)
+
+
+class TestProfiler(ComparisonTestCase):
+
+    def test_profiler_records_nested_calls(self):
+        plot = ProfiledPlot()
+        with Profiler() as profiler:
+            plot.update((0,))
+        names = [(r['name'], r['depth'], r['key']) for r in profiler.records]
+        self.assertEqual(names, [('update_frame', 1, (0,)), ('update', 0, (0,))])
+        outer = profiler.records[1]
+        self.assertTrue(outer['self_time'] <= outer['duration'])
+
+    def test_profiler_restores_methods(self):
+        update = ProfiledPlot.__dict__['update']
+        with Profiler():
+            self.assertIsNot(ProfiledPlot.__dict__['update'], update)
+        self.assertIs(ProfiledPlot.__dict__['update'], update)
+
+    def test_profiler_skips_super_calls(self):
+        plot = ProfiledSubPlot()
+        with Profiler() as profiler:
+            plot.update_frame((0,))
+        self.assertEqual(len(profiler.records), 1)
+        self.assertEqual(profiler.records[0]['cls'], 'ProfiledSubPlot')
+
+    def test_profiler_table(self):
+        plot = ProfiledPlot()
+        with Profiler() as profiler:
+            for i in range(3):
+                plot.update((i,))
+        table = profiler.table()
+        self.assertEqual(list(table.dimension_values('Method')),
+                         ['update', 'update_frame'])
+        self.assertEqual(list(table.dimension_values('Calls')), [3, 3])
+        self.assertEqual(len(profiler.table(frames=True)), 6)
+
+    def test_profiler_trace(self):
+        plot = ProfiledPlot()
+        with Profiler() as profiler:
+            plot.update((0,))
+        filename = tempfile.mktemp(suffix='.json')
+        try:
+            profiler.save_trace(filename)
+            with open(filename) as f:
+                trace = json.load(f)
+        finally:
+            os.remove(filename)
+        events = trace['traceEvents']
+        self.assertEqual([e['name'] for e in events], ['update', 'update_frame'])
+        self.assertEqual(events[0]['ph'], 'X')
+
+    def test_profiler_nested_error(self):
+        with Profiler():
+            with self.assertRaises(RuntimeError):
+                Profiler().__enter__()
+
+    def test_profiler_does_not_log(self):
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger = param.parameterized.get_logger()
+        logger.addHandler(handler)
+        try:
+            with Profiler():
+                ProfiledPlot().update((0,))
+        finally:
+            logger.removeHandler(handler)
+        self.assertEqual([r.getMessage() for r in records], [])
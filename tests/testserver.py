@@ -0,0 +1,196 @@
+"""
+Tests of the PlotServer and the PlotSessions serving plots over
+WebSockets.
+"""
+import json
+import threading
+from unittest import SkipTest
+
+import numpy as np
+
+from holoviews import Curve, HoloMap, DynamicMap, Store
+from holoviews.element.comparison import ComparisonTestCase
+from holoviews.streams import PositionX
+
+try:
+    from matplotlib import pyplot
+    pyplot.switch_backend('agg')
+    import holoviews.plotting.mpl # noqa (Renderer registration)
+    from holoviews.plotting.server import PlotServer, web
+    from holoviews.plotting.comms import WebSocketComm
+except ImportError:
+    web = None
+
+try:
+    from tornado.testing import AsyncHTTPTestCase, gen_test
+    from tornado.websocket import websocket_connect
+except ImportError:
+    AsyncHTTPTestCase = ComparisonTestCase
+    gen_test = lambda fn: fn
+
+
+class MockConnection(object):
+
+    def __init__(self):
+        self.written = []
+
+    def write(self, data, callback):
+        self.written.append(data)
+        callback()
+
+
+def dynamic_curve():
+    return DynamicMap(lambda x: Curve([x, x]), kdims=[], streams=[PositionX(x=0)])
+
+
+class TestPlotServer(ComparisonTestCase):
+
+    def setUp(self):
+        if web is None:
+            raise SkipTest('PlotServer tests require matplotlib and tornado.')
+        self.previous_backend = Store.current_backend
+        Store.current_backend = 'matplotlib'
+
+    def tearDown(self):
+        Store.current_backend = self.previous_backend
+
+    def test_session_open(self):
+        server = PlotServer(dynamic_curve)
+        session = server.create_session()
+        self.assertIs(server.sessions[session.id], session)
+        self.assertIsInstance(session.comm, WebSocketComm)
+        self.assertIs(session.plot.comm, session.comm)
+        self.assertIn('HoloViewsServer', session.page)
+        self.assertIn(session.id, session.page)
+
+    def test_sessions_independent(self):
+        server = PlotServer(dynamic_curve)
+        session1, session2 = server.create_session(), server.create_session()
+        self.assertIsNot(session1.obj, session2.obj)
+        self.assertNotEqual(session1.id, session2.id)
+
+    def test_session_stream_update(self):
+        session = PlotServer(dynamic_curve).create_session()
+        connection = MockConnection()
+        session.comm.init(connection)
+        session.comm._handle_msg(json.dumps({'msg_type': 'stream', 'index': 0,
+                                             'contents': {'x': 3},
+                                             'comm_id': session.id}))
+        self.assertEqual(session.plot.current_frame.dimension_values('y'), np.array([3, 3]))
+        reply = json.loads(connection.written[-1])
+        self.assertEqual(reply['msg_type'], 'Ready')
+        self.assertEqual(reply['comm_id'], session.id)
+
+    def test_session_widget_update(self):
+        hmap = HoloMap({i: Curve([i, i]) for i in range(3)}, kdims=['x'])
+        session = PlotServer(hmap, fmt='widgets').create_session()
+        session.comm.init(MockConnection())
+        session.comm._handle_msg(json.dumps({'msg_type': 'widget', 'key': 2}))
+        self.assertEqual(session.plot.current_key, (2,))
+
+    def test_session_handles_messages_on_thread(self):
+        started, release, threads = threading.Event(), threading.Event(), []
+        def curve(x):
+            if x == 3:
+                threads.append(threading.current_thread())
+                started.set()
+                release.wait(5)
+            return Curve([x, x])
+        dmap = lambda: DynamicMap(curve, kdims=[], streams=[PositionX(x=0)])
+        session = PlotServer(dmap).create_session()
+        connection = MockConnection()
+        session.comm.init(connection)
+        session.handle(json.dumps({'msg_type': 'stream', 'index': 0,
+                                   'contents': {'x': 3}}))
+        self.assertTrue(started.wait(5))
+        self.assertIsNot(threads[0], threading.current_thread())
+        self.assertEqual(connection.written, [])
+        release.set()
+        thread = session._thread
+        session._messages.put(None)
+        thread.join(5)
+        self.assertEqual(session.plot.current_frame.dimension_values('y'), np.array([3, 3]))
+        self.assertEqual(json.loads(connection.written[-1])['msg_type'], 'Ready')
+
+    def test_session_unknown_message(self):
+        session = PlotServer(dynamic_curve).create_session()
+        connection = MockConnection()
+        session.comm.init(connection)
+        session.comm._handle_msg(json.dumps({'msg_type': 'unknown'}))
+        self.assertEqual(json.loads(connection.written[-1])['msg_type'], 'Error')
+
+    def test_close_session(self):
+        server = PlotServer(dynamic_curve)
+        session = server.create_session()
+        stream = session.plot.streams[0]
+        session.comm.init(MockConnection())
+        server.close_session(session.id)
+        self.assertNotIn(session.id, server.sessions)
+        self.assertIs(session.comm._comm, None)
+        self.assertEqual(stream.subscribers, [])
+
+    def test_expire_unconnected_session(self):
+        server = PlotServer(dynamic_curve)
+        session = server.create_session()
+        server._expire_session(session.id)
+        self.assertNotIn(session.id, server.sessions)
+
+    def test_connected_session_not_expired(self):
+        server = PlotServer(dynamic_curve)
+        session = server.create_session()
+        session.comm.init(MockConnection())
+        server._expire_session(session.id)
+        self.assertIn(session.id, server.sessions)
+
+
+
+class TestPlotServerHandlers(AsyncHTTPTestCase):
+
+    def setUp(self):
+        if web is None or AsyncHTTPTestCase is ComparisonTestCase:
+            raise SkipTest('PlotServer tests require matplotlib and tornado.')
+        self.previous_backend = Store.current_backend
+        Store.current_backend = 'matplotlib'
+        self.server = PlotServer(dynamic_curve)
+        super(TestPlotServerHandlers, self).setUp()
+
+    def tearDown(self):
+        super(TestPlotServerHandlers, self).tearDown()
+        Store.current_backend = self.previous_backend
+
+    def get_app(self):
+        return self.server.app()
+
+    @gen_test
+    def test_page_socket_update_and_close(self):
+        response = yield self.http_client.fetch(self.get_url('/'))
+        self.assertEqual(len(self.server.sessions), 1)
+        session_id = list(self.server.sessions)[0]
+        self.assertIn(session_id, response.body.decode('utf-8'))
+
+        url = self.get_url('/ws/%s' % session_id).replace('http', 'ws', 1)
+        socket = yield websocket_connect(url)
+        socket.write_message(json.dumps({'msg_type': 'stream', 'index': 0,
+                                         'contents': {'x': 2}}))
+        reply = None
+        while reply is None:
+            message = yield socket.read_message()
+            try:
+                reply = json.loads(message)['msg_type']
+            except (ValueError, TypeError, KeyError):
+                pass
+        self.assertEqual(reply, 'Ready')
+        session = self.server.sessions[session_id]
+        self.assertEqual(list(session.plot.current_frame.dimension_values('y')), [2, 2])
+
+        socket.close()
+        while session_id in self.server.sessions:
+            yield self.io_loop.run_in_executor(None, lambda: None)
+        self.assertIs(session.comm._comm, None)
+
+    @gen_test
+    def test_socket_unknown_session_closed(self):
+        url = self.get_url('/ws/missing').replace('http', 'ws', 1)
+        socket = yield websocket_connect(url)
+        message = yield socket.read_message()
+        self.assertIs(message, None)
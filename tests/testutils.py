@@ -14,7 +14,9 @@ try:
 except:
     pd = None
 
-from holoviews.core.util import sanitize_identifier_fn, find_range, max_range, wrap_tuple_streams, deephash
+from holoviews.core.util import (sanitize_identifier_fn, find_range, max_range,
+                                 wrap_tuple_streams, deephash, values_type,
+                                 reduce_arrays, sorted_unique)
 from holoviews import Dimension
 from holoviews.streams import PositionXY
 from holoviews.element.comparison import ComparisonTestCase
@@ -417,6 +419,41 @@ class TestMaxRange(unittest.TestCase):
 
 
 
+class TestValuesType(unittest.TestCase):
+    """
+    Tests for values_type function.
+    """
+
+    def test_float_values_type(self):
+        self.assertIs(values_type(np.array([0.1, 2.5])), np.float64)
+
+    def test_datetime_values_type(self):
+        dates = np.array(['2016-01-01', '2016-01-02'], dtype='datetime64[D]')
+        self.assertIs(values_type(dates), np.datetime64)
+
+    def test_uniform_object_values_type(self):
+        self.assertIs(values_type(np.array(['A', 'B', 'C'], dtype=object)), str)
+
+    def test_mixed_object_values_type(self):
+        self.assertIs(values_type(np.array(['A', 1], dtype=object)), None)
+
+    def test_sampled_object_values_type(self):
+        values = np.array([1.5]*1000, dtype=object)
+        self.assertIs(values_type(values, samples=10), float)
+
+    def test_categorical_values_type(self):
+        if pd is None:
+            raise SkipTest("Test requires pandas")
+        series = pd.Series(['A', 'B', 'A']).astype('category')
+        self.assertIs(values_type(series), str)
+
+    def test_series_values_type(self):
+        if pd is None:
+            raise SkipTest("Test requires pandas")
+        self.assertIs(values_type(pd.Series([1, 2, 3])), np.int64)
+
+
+
 class TestWrapTupleStreams(unittest.TestCase):
 
 
@@ -447,3 +484,46 @@ class TestWrapTupleStreams(unittest.TestCase):
                                     [Dimension('x'), Dimension('y')],
                                     [PositionXY(x=0,y=5)])
         self.assertEqual(result, (0,5))
+
+
+class TestReduceArrays(ComparisonTestCase):
+
+    def setUp(self):
+        rs = np.random.RandomState(0)
+        self.arrays = [rs.randint(0, 10, (3, 4)).astype('int32') for _ in range(5)]
+        self.stacked = np.array(self.arrays)
+
+    def test_reduce_arrays_streamed_functions(self):
+        for fn in [np.sum, np.mean, np.min, np.max, np.var, np.std]:
+            reduced = reduce_arrays(self.arrays, fn)
+            expected = fn(self.stacked, axis=0)
+            self.assertEqual(reduced.dtype, expected.dtype)
+            self.assertEqual(reduced, expected)
+
+    def test_reduce_arrays_ufunc(self):
+        self.assertEqual(reduce_arrays(self.arrays, np.maximum),
+                         np.maximum.reduce(self.stacked))
+
+    def test_reduce_arrays_var_ddof(self):
+        self.assertEqual(reduce_arrays(self.arrays, np.var, ddof=1),
+                         np.var(self.stacked, axis=0, ddof=1))
+
+    def test_reduce_arrays_stacked_function(self):
+        self.assertEqual(reduce_arrays(iter(self.arrays), np.median),
+                         np.median(self.stacked, axis=0))
+
+    def test_reduce_arrays_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            reduce_arrays([np.zeros(2), np.zeros(3)], np.mean)
+
+
+class TestSortedUnique(unittest.TestCase):
+
+    def test_sorted_unique_single_column(self):
+        self.assertTrue(sorted_unique([np.array([0, 1, 3])]))
+        self.assertFalse(sorted_unique([np.array([0, 1, 1])]))
+        self.assertFalse(sorted_unique([np.array([1, 0, 3])]))
+
+    def test_sorted_unique_multiple_columns(self):
+        self.assertTrue(sorted_unique([np.array([0, 0, 1]), np.array([1, 2, 0])]))
+        self.assertFalse(sorted_unique([np.array([0, 0, 1]), np.array([2, 2, 0])]))
@@ -1,7 +1,11 @@
 """
 Test cases for the HTML/JavaScript scrubber and widgets.
 """
+import os
 import re
+import json
+import shutil
+import tempfile
 from hashlib import sha256
 from unittest import SkipTest
 import numpy as np
@@ -16,8 +20,10 @@ try:
 except:
     raise SkipTest("Matplotlib required to test widgets")
 
-from holoviews import Image, HoloMap
+from holoviews import Image, HoloMap, Curve, Store
 from holoviews.core.util import unicode
+from holoviews.element.comparison import ComparisonTestCase
+from holoviews.plotting.widgets import FramePrefetcher
 from holoviews.plotting.mpl import RasterPlot
 
 def digest_data(data):
@@ -72,3 +78,160 @@ class TestWidgets(IPTestCase):
     def test_selection_widget_2(self):
         html = normalize(SelectionWidget(self.plot2, display_options={'figure_format': 'png'})())
         self.assertEqual(digest_data(html), 'e44e3f92e26e7249338aadfa3fccc9140d378f1cb8ae481f62de22d1b16290ee')
+
+    def test_scrubber_widget_json_chunks(self):
+        path = tempfile.mkdtemp()
+        try:
+            widget = ScrubberWidget(self.plot2, export_json=True, json_chunk_size=1,
+                                    json_save_path=path)
+            self.assertEqual(widget.get_frames(), '{}')
+            with open(os.path.join(path, widget.id+'.json')) as f:
+                manifest = json.load(f)
+            self.assertEqual(manifest, {'chunk_size': 1, 'nframes': 2, 'refs': {}})
+            self.assertEqual(sorted(os.listdir(path)),
+                             sorted([widget.id+'.json', widget.id+'_0.json',
+                                     widget.id+'_1.json']))
+        finally:
+            shutil.rmtree(path)
+
+    def test_scrubber_widget_json_chunks_deduplicated(self):
+        im = Image(np.array([[1,2],[3,4]]))
+        plot = RasterPlot(HoloMap([(0, im), (1, im), (2, im)], kdims=['test']))
+        path = tempfile.mkdtemp()
+        try:
+            widget = ScrubberWidget(plot, export_json=True, json_chunk_size=2,
+                                    json_save_path=path)
+            widget.get_frames()
+            self.assertEqual(widget.json_data['refs'], {1: 0, 2: 0})
+            with open(os.path.join(path, widget.id+'_0.json')) as f:
+                self.assertEqual(list(json.load(f).keys()), ['0'])
+            self.assertFalse(os.path.isfile(os.path.join(path, widget.id+'_1.json')))
+        finally:
+            shutil.rmtree(path)
+
+
+
+class MockPlot(object):
+
+    def __init__(self, nframes):
+        self.nframes = nframes
+        self.current_key = None
+
+    def __len__(self):
+        return self.nframes
+
+    def update(self, key):
+        self.current_key = key
+
+
+class MockWidget(object):
+
+    def __init__(self, nframes):
+        self.plot = MockPlot(nframes)
+        self.rendered = []
+
+    def _render_diff(self, key):
+        self.rendered.append(key)
+        self.plot.update(key)
+        return 'frame %d' % key
+
+
+class TestFramePrefetcher(ComparisonTestCase):
+
+    def test_predict_forward(self):
+        prefetcher = FramePrefetcher(MockWidget(10), lookahead=2)
+        self.assertEqual(prefetcher.predict(3), [4, 5, 2])
+
+    def test_predict_backward(self):
+        prefetcher = FramePrefetcher(MockWidget(10), lookahead=2)
+        prefetcher.predict(5)
+        self.assertEqual(prefetcher.predict(4), [3, 2, 5])
+
+    def test_predict_bounds(self):
+        prefetcher = FramePrefetcher(MockWidget(3), lookahead=2)
+        self.assertEqual(prefetcher.predict(2), [1])
+
+    def test_predict_skips_cached(self):
+        prefetcher = FramePrefetcher(MockWidget(10), lookahead=2)
+        prefetcher.put(4, 'frame 4')
+        self.assertEqual(prefetcher.predict(3), [5, 2])
+
+    def test_cache_evicts_least_recently_used(self):
+        prefetcher = FramePrefetcher(MockWidget(10), cache_size=2)
+        prefetcher.put(0, 'frame 0')
+        prefetcher.put(1, 'frame 1')
+        prefetcher.get(0)
+        prefetcher.put(2, 'frame 2')
+        self.assertEqual(list(prefetcher.cache), [0, 2])
+
+    def test_run_prefetches_and_restores(self):
+        widget = MockWidget(10)
+        prefetcher = FramePrefetcher(widget, lookahead=2)
+        prefetcher._requests.put((prefetcher._generation, 3, [4, 5, 2]))
+        prefetcher._requests.put(None)
+        prefetcher._run()
+        self.assertEqual(widget.rendered, [4, 5, 2])
+        self.assertEqual(widget.plot.current_key, 3)
+        self.assertEqual(prefetcher.get(5), 'frame 5')
+
+    def test_run_restores_without_rendering(self):
+        widget = MockWidget(10)
+        prefetcher = FramePrefetcher(widget, lookahead=2)
+        prefetcher.plot_key = 5
+        prefetcher._requests.put((prefetcher._generation, 3, []))
+        prefetcher._requests.put(None)
+        prefetcher._run()
+        self.assertEqual(widget.rendered, [])
+        self.assertEqual(widget.plot.current_key, 3)
+        self.assertEqual(prefetcher.plot_key, 3)
+
+    def test_run_abandons_superseded_request(self):
+        widget = MockWidget(10)
+        prefetcher = FramePrefetcher(widget, lookahead=2)
+        prefetcher._requests.put((prefetcher._generation-1, 3, [4, 5, 2]))
+        prefetcher._requests.put(None)
+        prefetcher._run()
+        self.assertEqual(widget.rendered, [])
+
+
+
+class MockComm(object):
+
+    id = 'Test'
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, data):
+        self.sent.append(data)
+
+
+class TestPrefetchingWidget(ComparisonTestCase):
+
+    def setUp(self):
+        renderer = Store.renderers['matplotlib'].instance(widget_mode='live')
+        hmap = HoloMap({i: Curve([i, i]) for i in range(5)}, kdims=['x'])
+        plot = renderer.get_plot(hmap)
+        plot.comm = MockComm()
+        self.widget = SelectionWidget(plot, renderer=renderer, embed=False, prefetch=1)
+        self.scheduled, self.updates = [], []
+        self.widget.prefetcher.schedule = self.scheduled.append
+        update = plot.update
+        def record_update(key):
+            self.updates.append(key)
+            return update(key)
+        plot.update = record_update
+
+    def test_cache_hit_not_rendered(self):
+        self.widget.prefetcher.put(2, 'frame 2')
+        self.widget._update_frame(2)
+        self.assertEqual(self.widget.plot.comm.sent, ['frame 2'])
+        self.assertEqual(self.updates, [])
+        self.assertEqual(self.scheduled, [2])
+
+    def test_cache_miss_rendered_and_cached(self):
+        self.widget._update_frame(3)
+        self.assertEqual(self.updates, [3])
+        self.assertEqual(self.widget.prefetcher.plot_key, 3)
+        diff = self.widget.prefetcher.get(3)
+        self.assertEqual(self.widget.plot.comm.sent, [diff])